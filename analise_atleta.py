@@ -6,9 +6,10 @@ import atexit
 # Importações de módulos locais
 from db_manager import DBManager, get_db_manager
 from utils import (
-    extrair_dataframe_jogador, pegar_figuras_e_estatisticas, exibir_conteudo_tab,
-    pegar_figuras_e_estatisticas_jogadores, exibir_conteudo_tabs_jogadores,
-    pegar_imagem_jogador,extrair_estatisticas_gerais # Adicionado para a lógica do jogador
+    obter_dataframe_jogador, obter_dataframe_contagens, limpar_cache_analise, pegar_figuras_e_estatisticas, exibir_conteudo_tab,
+    pegar_figuras_e_estatisticas_jogadores, exibir_conteudo_tabs_jogadores, memorizar_figuras,
+    pegar_imagem_jogador,extrair_estatisticas_gerais, # Adicionado para a lógica do jogador
+    pre_carregar_imagens_drive
 )
 
 
@@ -37,17 +38,17 @@ if "filtro_partida_jogador" not in st.session_state:
 
 # Botão de refresh
 if st.button("Atualizar Dados"):
-    st.session_state.dados_atualizados = True
+    # Descarta os DataFrames em cache (de todas as sessões) e as consultas guardadas,
+    # forçando a releitura completa do banco
+    limpar_cache_analise(db_manager)
     # Opcional: resetar todos os filtros ao atualizar dados
      # Força o recarregamento para aplicar o reset
 
-# Extrai o DataFrame inicial com todos os dados
-df_dados_completos = extrair_dataframe_jogador(db_manager)
-df_time_total = df_dados_completos.copy() # Mantém uma cópia do DataFrame original para cálculos de média
+# Lista as equipes com jogadas sem carregar as jogadas; elas são lidas do banco
+# só depois que a equipe é escolhida, já filtradas pela equipe
+equipes_com_jogadas = {nome_equipe: equipe_id for equipe_id, nome_equipe in db_manager.listar_equipes_com_jogadas()}
 
-# st.dataframe(df_dados_completos) # Removido para não poluir a UI
-
-if df_dados_completos.empty:
+if not equipes_com_jogadas:
     st.warning("Sem jogos analisados!")
 else:
     
@@ -56,7 +57,7 @@ else:
     st.subheader("Análise de Desempenho do Atleta")
     with st.container():
         # 1. Filtro de Seleção de Equipe (para Análise de Atleta)
-        opcoes_equipes_analise_atleta = ["Selecione uma equipe"] + df_dados_completos["equipe_jogada"].unique().tolist()
+        opcoes_equipes_analise_atleta = ["Selecione uma equipe"] + list(equipes_com_jogadas.keys())
         indice_equipe_analise_atleta = 0
         if st.session_state.filtro_equipe_analise and st.session_state.filtro_equipe_analise in opcoes_equipes_analise_atleta:
             indice_equipe_analise_atleta = opcoes_equipes_analise_atleta.index(st.session_state.filtro_equipe_analise)
@@ -82,7 +83,11 @@ else:
             st.stop() # Interrompe a execução para a aba de atleta
 
     # A partir daqui, sabemos que uma equipe válida foi selecionada para a aba de atleta
-    df_equipe_selecionada = df_dados_completos[df_dados_completos['equipe_jogada'] == st.session_state.filtro_equipe_analise]
+    # Lê só as contagens agregadas por quadrante (resumo_jogo) da equipe selecionada, do cache compartilhado
+    # quando os dados não mudaram. Elas alimentam as estatísticas, as médias e os mapas de calor da grade
+    # padrão; a equipe inteira é necessária para a comparação no radar do jogador.
+    id_equipe_selecionada = equipes_com_jogadas[st.session_state.filtro_equipe_analise]
+    df_equipe_selecionada = obter_dataframe_contagens(db_manager, por_quadrante=True, equipe_id=id_equipe_selecionada)
 
     if df_equipe_selecionada.empty:
         st.warning(f"Não há dados para a equipe '{st.session_state.filtro_equipe_analise}'.")
@@ -100,7 +105,6 @@ else:
     }
 
     
-    id_equipe_selecionada =  int(df_equipe_selecionada.iloc[0]["equipe_jogada_id"])
     lista_todos_atletas_do_db = db_manager.listar_jogadores_por_equipe(id_equipe_selecionada) 
     
     jogadores_com_dados_na_equipe = [
@@ -108,6 +112,8 @@ else:
         if j[1] in df_equipe_selecionada['jogador_nome'].unique().tolist()
     ]
     dicionario_jogadores = {jogador[1]: [jogador[0], jogador[4],jogador[2]] for jogador in jogadores_com_dados_na_equipe}
+    # Baixa as fotos do elenco em segundo plano, enquanto o restante da página é montado
+    pre_carregar_imagens_drive([jogador[4] for jogador in jogadores_com_dados_na_equipe])
     lista_nomes_jogadores = list(dicionario_jogadores.keys())
 
     if not lista_nomes_jogadores:
@@ -195,10 +201,12 @@ else:
                 st.session_state.filtro_partida_jogador = None
                 df_analise_jogador = df_filtrado_jogador_competicao.copy()
                 df_media_jogador = df_filtrado_jogador_competicao.copy()
+                id_partida_jogador = None
             else:
                 df_analise_jogador = df_filtrado_jogador_competicao[
                     df_filtrado_jogador_competicao['partida'] == st.session_state.filtro_partida_jogador
                 ]
+                id_partida_jogador = int(df_analise_jogador["jogo_id"].iloc[0]) if not df_analise_jogador.empty else None
                 df_media_jogador = df_filtrado_jogador_competicao[
                     df_filtrado_jogador_competicao['partida'] != st.session_state.filtro_partida_jogador
                 ]
@@ -207,10 +215,28 @@ else:
 
         # --- Geração dos Gráficos e Exibição das Abas (para o jogador) ---
         if not df_analise_jogador.empty:
-            dict_figuras_jogador = pegar_figuras_e_estatisticas_jogadores(
-                df_analise_jogador, df_media_jogador, estatisticas_gerais_para_radar,posicao
+            # As figuras de cada aba só são construídas quando a aba é exibida, e ficam guardadas
+            # na sessão enquanto os filtros e os dados não mudarem
+            dict_figuras_jogador = memorizar_figuras(
+                "atleta",
+                (st.session_state.filtro_equipe_analise, st.session_state.filtro_jogador,
+                 st.session_state.filtro_competicao_jogador, st.session_state.filtro_partida_jogador),
+                df_equipe_selecionada,
+                lambda: pegar_figuras_e_estatisticas_jogadores(
+                    df_analise_jogador, df_media_jogador, estatisticas_gerais_para_radar,posicao
+                )
             )
 
+            # As jogadas individuais só são lidas, para a fatia exibida, quando uma aba usa outra grade
+            def carregar_jogadas_para_localizacao():
+                return obter_dataframe_jogador(
+                    db_manager,
+                    equipe_id=id_equipe_selecionada,
+                    competicao=st.session_state.filtro_competicao_jogador,
+                    jogo_id=id_partida_jogador,
+                    jogador_id=dicionario_jogadores[st.session_state.filtro_jogador][0]
+                )
+
             nomes_abas_jogador = ["Primeiro Tempo", "Segundo Tempo", "Total"]
             abas_jogador = st.tabs(nomes_abas_jogador)
 
@@ -220,7 +246,7 @@ else:
                     if dict_figuras_jogador[nome_aba_jogador][0] and dict_figuras_jogador[nome_aba_jogador][0].data:
                         exibir_conteudo_tabs_jogadores(nome_aba_jogador,
                              dict_figuras_jogador[nome_aba_jogador],
-                            df_analise_jogador, id_imagem,posicao
+                            df_analise_jogador, id_imagem,posicao, carregar_jogadas_para_localizacao
                         )
                     else:
                         st.info(f"Não há dados para exibir em '{nome_aba_jogador}' para a seleção atual.")
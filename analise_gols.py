@@ -171,7 +171,6 @@ else:
                                         
                                     except Exception as e:
                                         st.error(f"Erro ao salvar dados: {str(e)}")
-                                        db_manager.rollback()
                                                         
                                         
                 with right_div:
@@ -1,7 +1,7 @@
 import streamlit as st
 from db_manager import DBManager,get_db_manager
 import atexit
-from utils import extrair_dados_caracteristicas_gols,extrair_dataframe_analise_gols,plotar_caracteristicas_gols,plotar_caracteristicas_gols_invertido,plotar_caracteristicas_gols_1,plotar_caracteristicas_gols_2,extrair_dados_caracteristicas_gols_1, plotar_caracteristicas_gols_2_invertido
+from utils import extrair_dados_caracteristicas_gols,extrair_pivo_gols,obter_dataframe_analise_gols,plotar_caracteristicas_gols,plotar_caracteristicas_gols_invertido,plotar_caracteristicas_gols_1,plotar_caracteristicas_gols_2,extrair_dados_caracteristicas_gols_1, plotar_caracteristicas_gols_2_invertido
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -12,7 +12,7 @@ import datetime
 
 
 db_manager = get_db_manager()
-df_gols_total = extrair_dataframe_analise_gols(db_manager)
+df_gols_total = obter_dataframe_analise_gols(db_manager)
 opcoes_equipes = df_gols_total['Equipe Analisada'].unique().tolist()
 opcoes_equipes_restante = []
 col1, col2 = st.columns([1, 1])
@@ -47,14 +47,16 @@ if filtro_equipe_2:
         
         
         df_gols = df_gols_total[(df_gols_total['Data'] >= data_inicio) & (df_gols_total['Data'] <= data_fim)]
+        # Um único agrupamento do período alimenta os quatro gráficos
+        pivo_gols = extrair_pivo_gols(df_gols)
    
     #Figs por tempo
-        fig = plotar_caracteristicas_gols_2(df_gols,filtro_equipe_1,filtro_equipe_2)
-        fig1 = plotar_caracteristicas_gols_2_invertido(df_gols,filtro_equipe_1,filtro_equipe_2)
+        fig = plotar_caracteristicas_gols_2(pivo_gols,filtro_equipe_1,filtro_equipe_2)
+        fig1 = plotar_caracteristicas_gols_2_invertido(pivo_gols,filtro_equipe_1,filtro_equipe_2)
 
         #Figs totais
-        fig_total = plotar_caracteristicas_gols(df_gols,filtro_equipe_1,filtro_equipe_2)
-        fig_total1 = plotar_caracteristicas_gols_invertido(df_gols,filtro_equipe_1,filtro_equipe_2)
+        fig_total = plotar_caracteristicas_gols(pivo_gols,filtro_equipe_1,filtro_equipe_2)
+        fig_total1 = plotar_caracteristicas_gols_invertido(pivo_gols,filtro_equipe_1,filtro_equipe_2)
         
         total_tab, por_quarto_tab = st.tabs(['Total','Por Quarto'])
         
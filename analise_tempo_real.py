@@ -6,7 +6,8 @@ import atexit
 # Importações de módulos locais
 from db_manager import DBManager, get_db_manager
 from utils import (
-    extrair_dataframe_jogador, pegar_figuras_e_estatisticas, exibir_conteudo_tab,pegar_imagem_jogador
+    obter_dataframe_jogador, obter_dataframe_contagens, limpar_cache_analise, pegar_figuras_e_estatisticas, exibir_conteudo_tab,pegar_imagem_jogador,
+    memorizar_figuras, pre_carregar_imagens_drive
 )
 
 # --- Configuração da Página e Inicialização ---
@@ -25,23 +26,22 @@ if "filtro_partida_time" not in st.session_state:
 
 # Botão de refresh
 if st.button("Atualizar Dados"):
-    # Esta flag pode ser usada para forçar um recarregamento de dados, se necessário
-    # No entanto, o Streamlit já recarrega o script em cada interação,
-    # então pode não ser estritamente necessário dependendo da sua lógica de cache.
-    st.session_state.dados_atualizados = True
+    # Descarta os DataFrames em cache (de todas as sessões) e as consultas guardadas,
+    # forçando a releitura completa do banco
+    limpar_cache_analise(db_manager)
   
-# Extrai o DataFrame inicial com todos os dados
-dados_time_df = extrair_dataframe_jogador(db_manager)
-dados_time_total_df = dados_time_df.copy() # Mantém uma cópia do DataFrame original para cálculos de média
+# Lista as equipes com jogadas sem carregar as jogadas; elas são lidas do banco
+# só depois que a equipe é escolhida, já filtradas por equipe e competição
+equipes_com_jogadas = {nome_equipe: equipe_id for equipe_id, nome_equipe in db_manager.listar_equipes_com_jogadas()}
 
 
-if dados_time_df.empty:
+if not equipes_com_jogadas:
     st.warning("Sem jogos analisados!")
 else:
     with st.container():
         # 1. Filtro por Equipe
         # Adiciona uma opção de placeholder no início da lista
-        options_equipes = ["Selecione uma equipe"] + dados_time_df["equipe_jogada"].unique().tolist()
+        options_equipes = ["Selecione uma equipe"] + list(equipes_com_jogadas.keys())
 
         # Define o índice inicial para o selectbox como 0 (o placeholder)
         # Se um filtro já foi selecionado e é válido, usa seu índice
@@ -73,20 +73,19 @@ else:
 
     # A partir daqui, sabemos que uma equipe válida foi selecionada (st.session_state.filtro_equipes não é None)
 
-    # Filtra os dados pela equipe selecionada
-    dados_filtrados_por_equipe = dados_time_df[dados_time_df['equipe_jogada'] == st.session_state.filtro_equipes]
-    
-    id_equipe_selecionada =  int(dados_filtrados_por_equipe.iloc[0]["equipe_jogada_id"])
+    id_equipe_selecionada = equipes_com_jogadas[st.session_state.filtro_equipes]
     dados_equipe = db_manager.listar_dados_equipe(id_equipe_selecionada)
     
     if dados_equipe:
         nome_equipe, categoria_equipe,logo_id = dados_equipe
+        # Baixa o logo em segundo plano, enquanto os filtros e as figuras são montados
+        pre_carregar_imagens_drive([logo_id])
     col1, col2 = st.columns([1, 1])
 
     # 2. Filtro por Competição
     with col1:
         # Adiciona placeholder para competição
-        options_competicao = ["Selecione uma competição"] + dados_filtrados_por_equipe["competicao"].unique().tolist()
+        options_competicao = ["Selecione uma competição"] + db_manager.listar_competicoes_com_jogadas(id_equipe_selecionada)
         competicao_index = 0
         if st.session_state.filtro_competicao_time and st.session_state.filtro_competicao_time in options_competicao:
             competicao_index = options_competicao.index(st.session_state.filtro_competicao_time)
@@ -104,11 +103,19 @@ else:
             st.rerun()
 
         # Se o usuário selecionou o placeholder para competição, ou se ainda não selecionou nenhuma competição válida
+        # continua com a filtragem apenas por equipe
         if filtro_competicao_selecionado == "Selecione uma competição":
             st.session_state.filtro_competicao_time = None
-            dados_filtrados_por_competicao = dados_filtrados_por_equipe.copy() # Continua com a filtragem apenas por equipe
-        else:
-            dados_filtrados_por_competicao = dados_filtrados_por_equipe[dados_filtrados_por_equipe['competicao'] == st.session_state.filtro_competicao_time]
+
+    # Lê só as contagens agregadas por quadrante (resumo_jogo) da equipe e competição selecionadas,
+    # do cache compartilhado quando os dados não mudaram. Elas alimentam as estatísticas, as médias
+    # e os mapas de calor da grade padrão.
+    dados_filtrados_por_competicao = obter_dataframe_contagens(
+        db_manager,
+        por_quadrante=True,
+        equipe_id=id_equipe_selecionada,
+        competicao=st.session_state.filtro_competicao_time
+    )
 
 
     # 3. Filtro por Partida
@@ -137,11 +144,13 @@ else:
             st.session_state.filtro_partida_time = None
             df_para_analisar = dados_filtrados_por_competicao.copy()
             df_para_media = dados_filtrados_por_competicao.copy()
+            id_partida_selecionada = None
         else:
             # Se uma partida específica foi selecionada, analise apenas essa partida
             df_para_analisar = dados_filtrados_por_competicao[
                 dados_filtrados_por_competicao['partida'] == st.session_state.filtro_partida_time
             ]
+            id_partida_selecionada = int(df_para_analisar["jogo_id"].iloc[0]) if not df_para_analisar.empty else None
             # A média deve ser calculada a partir de todas as outras partidas (excluindo a atual)
             df_para_media = dados_filtrados_por_competicao[
                 dados_filtrados_por_competicao['partida'] != st.session_state.filtro_partida_time
@@ -154,7 +163,23 @@ else:
     # --- Geração dos Gráficos e Exibição das Abas ---
     # Apenas exibe os gráficos se houver dados para analisar após todos os filtros
     if not df_para_analisar.empty:
-        figures_dict = pegar_figuras_e_estatisticas(df_para_analisar, df_para_media)
+        # As figuras de cada aba só são construídas quando a aba é exibida, e ficam guardadas
+        # na sessão enquanto os filtros e os dados não mudarem
+        figures_dict = memorizar_figuras(
+            "time",
+            (st.session_state.filtro_equipes, st.session_state.filtro_competicao_time, st.session_state.filtro_partida_time),
+            dados_filtrados_por_competicao,
+            lambda: pegar_figuras_e_estatisticas(df_para_analisar, df_para_media)
+        )
+
+        # As jogadas individuais só são lidas, para a fatia exibida, quando uma aba usa outra grade
+        def carregar_jogadas_para_localizacao():
+            return obter_dataframe_jogador(
+                db_manager,
+                equipe_id=id_equipe_selecionada,
+                competicao=st.session_state.filtro_competicao_time,
+                jogo_id=id_partida_selecionada
+            )
 
         tab_names = ["Primeiro Tempo", "Segundo Tempo", "Total"]
         tabs = st.tabs(tab_names)
@@ -164,7 +189,7 @@ else:
                 tab_name = tab_names[i]
                 # Verifica se há dados para exibir na aba antes de chamar a função
                 if tab_name == "Total" or (figures_dict[tab_name][0] and figures_dict[tab_name][0].data):
-                    exibir_conteudo_tab(tab_name, figures_dict[tab_name], df_para_analisar,logo_id)
+                    exibir_conteudo_tab(tab_name, figures_dict[tab_name], df_para_analisar,logo_id, carregar_jogadas_para_localizacao)
                 else:
                     st.info(f"Não há dados para exibir em '{tab_name}' para a seleção atual.")
     else:
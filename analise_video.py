@@ -1,7 +1,7 @@
 import streamlit as st
 import streamlit.components.v1 as components
 from db_manager import get_db_manager
-from utils import listar_jogadas_com_tempo,formatar_hhmmss
+from utils import listar_jogadas_com_tempo,formatar_hhmmss_serie
 import re
 import atexit   
 
@@ -23,7 +23,6 @@ if jogo_selecionado:
         if match:
             video_id = match.group(1)
             lista_jogadas_df = listar_jogadas_com_tempo(db_manager, jogo_id)
-            lista_jogadas_df =  lista_jogadas_df.reset_index()
 
             if not lista_jogadas_df.empty:
 
@@ -31,20 +30,24 @@ if jogo_selecionado:
                 tipos_jogadas = lista_jogadas_df["jogada"].unique()
                 jogadores = lista_jogadas_df["jogador_nome"].unique()
 
-                # Linhas da tabela
-                linhas_html = ""
-                for idx, row in lista_jogadas_df.iterrows():
-                    tempo_formatado = formatar_hhmmss(row['tempo_relativo_jogada'])
-                    linhas_html += f"""
-                    <tr data-tempo="{row['tempo_relativo_jogada']}" data-tempo-original="{row['tempo_relativo_jogada']}" style="background-color:{'#ffffff' if idx%2==0 else '#e6e6e6'};">
+                # Linhas da tabela, montadas direto das colunas (tempos já formatados de uma vez)
+                tempos_formatados = formatar_hhmmss_serie(lista_jogadas_df['tempo_relativo_jogada'])
+                linhas_html = "".join(
+                    f"""
+                    <tr data-tempo="{tempo_relativo}" data-tempo-original="{tempo_relativo}" style="background-color:{'#ffffff' if idx%2==0 else '#e6e6e6'};">
                         <td>{idx}</td>
-                        <td>{row['jogada']}</td>
-                        <td>{row['jogador_nome']}</td>
-                        <td>{row['quadrante']}</td>
+                        <td>{jogada}</td>
+                        <td>{jogador_nome}</td>
+                        <td>{quadrante}</td>
                         <td>{tempo_formatado}</td>
-                        <td><button onclick="seekToTime({row['tempo_relativo_jogada']})">Ir</button></td>
+                        <td><button onclick="seekToTime({tempo_relativo})">Ir</button></td>
                     </tr>
                     """
+                    for idx, (jogada, jogador_nome, quadrante, tempo_relativo, tempo_formatado) in enumerate(zip(
+                        lista_jogadas_df['jogada'], lista_jogadas_df['jogador_nome'], lista_jogadas_df['quadrante'],
+                        lista_jogadas_df['tempo_relativo_jogada'], tempos_formatados
+                    ))
+                )
 
                                 # HTML completo
                 html_code = f"""
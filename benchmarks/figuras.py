@@ -0,0 +1,89 @@
+"""
+Compara, para cada tipo de figura, as duas formas de montá-la: a especificação em dicionário
+sem validação (padrão) e a mesma especificação validada pelo Plotly propriedade a propriedade,
+como fazia a montagem com objetos `go.*` (FUTSAL_VALIDAR_FIGURAS=1).
+
+Mede a montagem e a montagem seguida da serialização em JSON que `st.plotly_chart` envia ao navegador.
+
+Uso:
+    python benchmarks/figuras.py [--repeticoes 200]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import utils
+
+
+def estatisticas_de_exemplo(semente=0, quantidade=20000):
+    """Estatísticas de uma temporada fictícia, no formato que as páginas passam às figuras."""
+    gerador = np.random.default_rng(semente)
+    x = gerador.uniform(0, utils.LARGURA_QUADRA, quantidade)
+    y = gerador.uniform(0, utils.COMPRIMENTO_QUADRA, quantidade)
+    jogadas_df = pd.DataFrame({
+        "jogo_id": gerador.integers(1, 11, quantidade),
+        "jogada": gerador.choice(utils.JOGADAS, quantidade),
+        "tempo": gerador.choice(utils.TEMPOS_JOGO, quantidade, p=[0.45, 0.45, 0.05, 0.05]),
+        "x_loc": x,
+        "y_loc": y,
+        "zona": utils.calcular_zonas(x, y),
+    })
+    pt, st_, total, _, _ = utils.extrair_estatisticas_gerais(jogadas_df[jogadas_df["jogo_id"] == 1])
+    _, _, total_geral, _, _ = utils.extrair_estatisticas_gerais(jogadas_df)
+    media_pt, media_st, _, _, _ = utils.get_mean(jogadas_df)
+    titulos, matrizes = utils.quadras_por_periodo(utils.extrair_tensor_localizacao(jogadas_df), utils.jogadas_da_posicao()["Ataque"])
+    return pt, st_, total, total_geral, media_pt, media_st, titulos, matrizes
+
+
+def tipos_de_figura():
+    pt, st_, total, total_geral, media_pt, media_st, titulos, matrizes = estatisticas_de_exemplo()
+    return {
+        "plotar_estatisticas_gerais_time": lambda: utils.plotar_estatisticas_gerais_time(total, 10),
+        "plotar_estatisticas_gerais": lambda: utils.plotar_estatisticas_gerais(total, 10),
+        "plotar_estatisticas_gerais_1": lambda: utils.plotar_estatisticas_gerais_1(total),
+        "plotar_grafico_barras": lambda: utils.plotar_grafico_barras(pt, st_, media_pt, media_st),
+        "plotar_grafico_barras_jogador": lambda: utils.plotar_grafico_barras_jogador(pt, st_, media_pt, media_st, "Goleiro"),
+        "plotar_grafico_barras_parcial": lambda: utils.plotar_grafico_barras_parcial(pt, media_pt),
+        "plotar_grafico_barras_parcial_jogador": lambda: utils.plotar_grafico_barras_parcial_jogador(pt, media_pt, "Ala"),
+        "plotar_radar_chart": lambda: utils.plotar_radar_chart(total, total_geral, "Goleiro"),
+        "create_futsal_court": lambda: utils.create_futsal_court(titulos[0], matrizes[0]),
+        "create_futsal_court_grid": lambda: utils.create_futsal_court_grid(titulos, matrizes, 3),
+    }
+
+
+def cronometrar(funcao, repeticoes):
+    funcao()
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000
+
+
+def medir(construir, validar, repeticoes):
+    utils.VALIDAR_FIGURAS = validar
+    montagem = cronometrar(construir, repeticoes)
+    com_serializacao = cronometrar(lambda: pio.to_json(construir(), validate=False), repeticoes)
+    return montagem, com_serializacao
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeticoes", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'figura':40s} {'validada':>10s} {'dicionário':>11s} {'validada+json':>14s} {'dicionário+json':>16s}  (ms)")
+    for nome, construir in tipos_de_figura().items():
+        validada, validada_json = medir(construir, True, args.repeticoes)
+        especificacao, especificacao_json = medir(construir, False, args.repeticoes)
+        print(f"{nome:40s} {validada:10.2f} {especificacao:11.2f} {validada_json:14.2f} {especificacao_json:16.2f}")
+    utils.VALIDAR_FIGURAS = False
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Mede o tempo de montagem de cada quadra de `create_futsal_court` com a geometria da quadra
+em cache (`geometria_quadra`, padrão) e recalculada a cada figura, como antes do cache.
+
+Mede cada grade de `GRADES_QUADRA`, com a montagem padrão (dicionário) e com a validação
+do Plotly (FUTSAL_VALIDAR_FIGURAS=1).
+
+Uso:
+    python benchmarks/quadras.py [--repeticoes 100]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import utils
+
+
+def cronometrar(funcao, repeticoes):
+    funcao()
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000
+
+
+def sem_cache(matriz):
+    utils.geometria_quadra.cache_clear()
+    return utils.create_futsal_court("Quadra", matriz)
+
+
+def com_cache(matriz):
+    return utils.create_futsal_court("Quadra", matriz)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeticoes", type=int, default=100)
+    args = parser.parse_args()
+
+    gerador = np.random.default_rng(0)
+    print(f"{'grade':8s} {'validação':>10s} {'sem cache':>10s} {'com cache':>10s}  (ms por quadra)")
+    for nome, grade in utils.GRADES_QUADRA.items():
+        matriz = gerador.integers(0, 50, grade)
+        for validar in (False, True):
+            utils.VALIDAR_FIGURAS = validar
+            recalculada = cronometrar(lambda: sem_cache(matriz), args.repeticoes)
+            em_cache = cronometrar(lambda: com_cache(matriz), args.repeticoes)
+            print(f"{nome:8s} {'sim' if validar else 'não':>10s} {recalculada:10.2f} {em_cache:10.2f}")
+    utils.VALIDAR_FIGURAS = False
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compara os mapas de calor de uma aba 'Total' (ataque e defesa) exibidos como uma figura
+por quadra (modo "Interativo") e como uma figura única por aba (modo "Figura única"):
+bytes enviados ao navegador, tempo de montagem e tempo de desenho no plotly.js.
+
+O desenho é medido no Chromium headless do kaleido 0.2.1 (`pip install kaleido==0.2.1`),
+que roda o plotly.js como o navegador, mas não a página do Streamlit. Esse Chromium é antigo
+e não executa o plotly.js 2.35 do plotly 5.24; use --plotlyjs com um plotly.min.js até a
+versão 2.16 (o do pacote plotly 5.11, por exemplo). O tempo de uma figura vazia por chamada
+é medido à parte, para separar o custo fixo de cada figura do custo de desenho.
+
+Uso:
+    python benchmarks/quadras_render.py [--plotlyjs caminho/plotly.min.js] [--repeticoes 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import plotly.io as pio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import utils
+
+
+def tensor_aleatorio(semente=0):
+    """Tensor [jogada, tempo, linha, coluna] com contagens de uma temporada fictícia."""
+    gerador = np.random.default_rng(semente)
+    return gerador.poisson(40, size=(len(utils.JOGADAS), len(utils.TEMPOS_JOGO), utils.NUMERO_LINHAS, utils.NUMERO_COLUNAS))
+
+
+def figuras_por_quadra(tensor):
+    jogadas = utils.jogadas_da_posicao()
+    return [
+        utils.create_futsal_court(titulo, matriz)
+        for aba in ("Ataque", "Defesa")
+        for titulo, matriz in zip(*utils.quadras_por_periodo(tensor, jogadas[aba]))
+    ]
+
+
+def figuras_agrupadas(tensor):
+    jogadas = utils.jogadas_da_posicao()
+    return [utils.create_futsal_court_grid(*utils.quadras_por_periodo(tensor, jogadas[aba]), 3) for aba in ("Ataque", "Defesa")]
+
+
+def desenhar(escopo, especificacoes, largura, altura=None):
+    inicio = time.perf_counter()
+    for especificacao in especificacoes:
+        escopo.transform(especificacao, format="svg", width=largura, height=altura or especificacao["layout"].get("height", 450))
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--plotlyjs", help="plotly.min.js usado pelo kaleido")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    tensor = tensor_aleatorio()
+    modos = {"por quadra": (figuras_por_quadra, 330, 450), "figura única": (figuras_agrupadas, 1000, None)}
+
+    try:
+        from kaleido.scopes.plotly import PlotlyScope
+        escopo = PlotlyScope(mathjax=False, plotlyjs=args.plotlyjs)
+    except ImportError:
+        escopo = None
+        print("kaleido 0.2.1 não instalado: só bytes e montagem serão medidos.")
+
+    for nome, (construir, largura, altura) in modos.items():
+        inicio = time.perf_counter()
+        figuras = construir(tensor)
+        montagem = time.perf_counter() - inicio
+        jsons = [pio.to_json(figura, validate=False) for figura in figuras]
+        print(f"{nome}: {len(figuras)} figuras, {sum(len(j.encode()) for j in jsons)} bytes, montagem {montagem * 1000:.0f} ms")
+
+        if escopo is not None:
+            especificacoes = [figura.to_plotly_json() for figura in figuras]
+            desenhar(escopo, especificacoes, largura, altura)
+            tempos = [desenhar(escopo, especificacoes, largura, altura) for _ in range(args.repeticoes)]
+            vazias = desenhar(escopo, [{"data": [], "layout": {}}] * len(figuras), largura, altura or 450)
+            print(f"    desenho: mediana {statistics.median(tempos) * 1000:.0f} ms; "
+                  f"custo fixo de {len(figuras)} figuras vazias {vazias * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
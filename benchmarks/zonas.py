@@ -0,0 +1,73 @@
+"""
+Compara o cálculo das zonas da quadra de uma vez por `calcular_zonas` com o cálculo linha a linha
+que o app fazia antes, `df.apply(lambda row: calcular_quadrante(...), axis=1)`, e confere que os
+dois chegam às mesmas zonas.
+
+Uso:
+    python benchmarks/zonas.py [--eventos 1000000] [--repeticoes 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import utils
+
+
+def jogadas_de_exemplo(quantidade, semente=0):
+    """Coordenadas fictícias, incluindo algumas sobre as bordas e fora da quadra."""
+    gerador = np.random.default_rng(semente)
+    return pd.DataFrame({
+        "x_loc": gerador.uniform(-5, utils.LARGURA_QUADRA + 5, quantidade),
+        "y_loc": gerador.uniform(-5, utils.COMPRIMENTO_QUADRA + 5, quantidade),
+    })
+
+
+def por_linha(jogadas_df):
+    return jogadas_df.apply(lambda row: utils.calcular_quadrante(row['x_loc'], row['y_loc']), axis=1)
+
+
+def vetorizado(jogadas_df):
+    return utils.calcular_zonas(jogadas_df["x_loc"].to_numpy(), jogadas_df["y_loc"].to_numpy())
+
+
+def zonas_dos_rotulos(quadrantes):
+    """Converte os rótulos "linha-coluna" de `calcular_quadrante` em zonas inteiras."""
+    partes = quadrantes.str.split("-", expand=True).astype(float)
+    return utils.zonas_de_quadrantes(partes[0], partes[1])
+
+
+def cronometrar(funcao, repeticoes):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        resultado = funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--eventos", type=int, default=1_000_000)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    jogadas_df = jogadas_de_exemplo(args.eventos)
+    # O caminho linha a linha leva segundos por rodada; uma basta.
+    tempo_linha, quadrantes = cronometrar(lambda: por_linha(jogadas_df), 1)
+    vetorizado(jogadas_df)
+    tempo_vetorizado, zonas = cronometrar(lambda: vetorizado(jogadas_df), args.repeticoes)
+
+    if not np.array_equal(zonas_dos_rotulos(quadrantes), zonas):
+        sys.exit("calcular_zonas diverge de calcular_quadrante")
+
+    print(f"{args.eventos} eventos")
+    print(f"{'apply(calcular_quadrante)':28s} {tempo_linha:12.1f} ms")
+    print(f"{'calcular_zonas':28s} {tempo_vetorizado:12.1f} ms")
+    print(f"{'aceleração':28s} {tempo_linha / tempo_vetorizado:12.0f} x")
+
+
+if __name__ == "__main__":
+    main()
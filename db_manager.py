@@ -1,22 +1,306 @@
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
 import psycopg2
-from psycopg2 import sql
+from psycopg2 import sql, extensions, extras, pool
 import streamlit as st
 
+
+# Migrações de schema aplicadas em ordem por `DBManager.aplicar_migracoes`.
+# Cada item é uma tupla (versao, descricao, comandos). Uma migração já publicada
+# não deve ser alterada: mudanças novas entram como uma nova versão no fim da lista.
+MIGRACOES = [
+    (
+        1,
+        "Índices das consultas por jogo, equipe e jogador e das exclusões em cascata",
+        [
+            # jogadores_1(equipe_id) já é coberto pelo índice de unique_numero_camisa_por_equipe_1.
+            "CREATE INDEX IF NOT EXISTS idx_jogadas_1_jogo_tempo_jogada ON jogadas_1 (jogo_id, tempo, jogada)",
+            "CREATE INDEX IF NOT EXISTS idx_jogadas_1_jogador ON jogadas_1 (jogador_id)",
+            "CREATE INDEX IF NOT EXISTS idx_gols_1_equipe_analisada ON gols_1 (equipe_analisada_id)",
+            "CREATE INDEX IF NOT EXISTS idx_gols_1_jogo ON gols_1 (jogo_id)",
+            "CREATE INDEX IF NOT EXISTS idx_gols_1_autor_gol ON gols_1 (autor_gol_id)",
+            "CREATE INDEX IF NOT EXISTS idx_gols_1_assistente ON gols_1 (assistente_id)",
+            "CREATE INDEX IF NOT EXISTS idx_jogos_1_data ON jogos_1 (data)",
+            "CREATE INDEX IF NOT EXISTS idx_jogos_1_mandante_competicao ON jogos_1 (equipe_mandante_id, competicao)",
+            "CREATE INDEX IF NOT EXISTS idx_jogos_1_visitante_competicao ON jogos_1 (equipe_visitante_id, competicao)",
+        ]
+    ),
+    (
+        2,
+        "Colunas geradas de quadrante (linha e coluna) em jogadas_1 e gols_1",
+        [
+            # Mesma divisão de `utils.calcular_quadrante`: quadra de 280 x 470 em 6 linhas e 3 colunas.
+            # Colunas STORED são calculadas para as linhas existentes ao serem adicionadas.
+            f"""
+            ALTER TABLE {tabela}
+                ADD COLUMN IF NOT EXISTS quadrante_linha SMALLINT
+                    GENERATED ALWAYS AS ((floor(y_loc / (470.0::float8 / 6)) + 1)::SMALLINT) STORED,
+                ADD COLUMN IF NOT EXISTS quadrante_coluna SMALLINT
+                    GENERATED ALWAYS AS ((floor(x_loc / (280.0::float8 / 3)) + 1)::SMALLINT) STORED
+            """
+            for tabela in ("jogadas_1", "gols_1")
+        ] + [
+            "CREATE INDEX IF NOT EXISTS idx_jogadas_1_jogo_jogada_quadrante ON jogadas_1 (jogo_id, jogada, tempo, quadrante_linha, quadrante_coluna)",
+            "CREATE INDEX IF NOT EXISTS idx_gols_1_equipe_quadrante ON gols_1 (equipe_analisada_id, quadrante_linha, quadrante_coluna)",
+        ]
+    ),
+    (
+        3,
+        "Tabela resumo_jogo com a contagem de jogadas, mantida por triggers em jogadas_1",
+        [
+            # A equipe vem de jogadores_1 na leitura, como nas consultas de jogadas_1.
+            """
+            CREATE TABLE IF NOT EXISTS resumo_jogo (
+                jogo_id INT NOT NULL REFERENCES jogos_1(id) ON DELETE CASCADE,
+                jogador_id BIGINT NOT NULL REFERENCES jogadores_1(id) ON DELETE CASCADE,
+                tempo VARCHAR(10) NOT NULL,
+                jogada VARCHAR(255) NOT NULL,
+                quadrante_linha SMALLINT NOT NULL,
+                quadrante_coluna SMALLINT NOT NULL,
+                quantidade INT NOT NULL,
+                PRIMARY KEY (jogo_id, jogador_id, tempo, jogada, quadrante_linha, quadrante_coluna)
+            )
+            """,
+            "CREATE INDEX IF NOT EXISTS idx_resumo_jogo_jogador ON resumo_jogo (jogador_id)",
+            # Triggers por comando (FOR EACH STATEMENT) com tabelas de transição: uma inserção
+            # em lote de `adicionar_jogadas_lote` ou uma exclusão em cascata de `deletar_jogo`
+            # atualiza o resumo com um único comando agregado.
+            """
+            CREATE OR REPLACE FUNCTION atualizar_resumo_jogo() RETURNS TRIGGER AS $$
+            BEGIN
+                IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                    UPDATE resumo_jogo r
+                    SET quantidade = r.quantidade - removidas.quantidade
+                    FROM (
+                        SELECT jogo_id, jogador_id, tempo, jogada, quadrante_linha, quadrante_coluna, COUNT(*) AS quantidade
+                        FROM jogadas_removidas
+                        GROUP BY jogo_id, jogador_id, tempo, jogada, quadrante_linha, quadrante_coluna
+                    ) removidas
+                    WHERE r.jogo_id = removidas.jogo_id
+                      AND r.jogador_id = removidas.jogador_id
+                      AND r.tempo = removidas.tempo
+                      AND r.jogada = removidas.jogada
+                      AND r.quadrante_linha = removidas.quadrante_linha
+                      AND r.quadrante_coluna = removidas.quadrante_coluna;
+
+                    DELETE FROM resumo_jogo r
+                    USING jogadas_removidas removidas
+                    WHERE r.quantidade <= 0
+                      AND r.jogo_id = removidas.jogo_id
+                      AND r.jogador_id = removidas.jogador_id
+                      AND r.tempo = removidas.tempo
+                      AND r.jogada = removidas.jogada
+                      AND r.quadrante_linha = removidas.quadrante_linha
+                      AND r.quadrante_coluna = removidas.quadrante_coluna;
+                END IF;
+
+                IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                    INSERT INTO resumo_jogo (jogo_id, jogador_id, tempo, jogada, quadrante_linha, quadrante_coluna, quantidade)
+                    SELECT jogo_id, jogador_id, tempo, jogada, quadrante_linha, quadrante_coluna, COUNT(*)
+                    FROM jogadas_novas
+                    GROUP BY jogo_id, jogador_id, tempo, jogada, quadrante_linha, quadrante_coluna
+                    ON CONFLICT (jogo_id, jogador_id, tempo, jogada, quadrante_linha, quadrante_coluna)
+                    DO UPDATE SET quantidade = resumo_jogo.quantidade + EXCLUDED.quantidade;
+                END IF;
+
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+            """,
+            "DROP TRIGGER IF EXISTS resumo_jogo_insercao ON jogadas_1",
+            "DROP TRIGGER IF EXISTS resumo_jogo_atualizacao ON jogadas_1",
+            "DROP TRIGGER IF EXISTS resumo_jogo_exclusao ON jogadas_1",
+            """
+            CREATE TRIGGER resumo_jogo_insercao AFTER INSERT ON jogadas_1
+            REFERENCING NEW TABLE AS jogadas_novas
+            FOR EACH STATEMENT EXECUTE FUNCTION atualizar_resumo_jogo()
+            """,
+            """
+            CREATE TRIGGER resumo_jogo_atualizacao AFTER UPDATE ON jogadas_1
+            REFERENCING OLD TABLE AS jogadas_removidas NEW TABLE AS jogadas_novas
+            FOR EACH STATEMENT EXECUTE FUNCTION atualizar_resumo_jogo()
+            """,
+            """
+            CREATE TRIGGER resumo_jogo_exclusao AFTER DELETE ON jogadas_1
+            REFERENCING OLD TABLE AS jogadas_removidas
+            FOR EACH STATEMENT EXECUTE FUNCTION atualizar_resumo_jogo()
+            """,
+            # Carga inicial. Roda na mesma transação em que os triggers foram criados, que
+            # bloqueiam escritas em jogadas_1 até o commit, então nenhuma jogada fica de fora.
+            """
+            INSERT INTO resumo_jogo (jogo_id, jogador_id, tempo, jogada, quadrante_linha, quadrante_coluna, quantidade)
+            SELECT jogo_id, jogador_id, tempo, jogada, quadrante_linha, quadrante_coluna, COUNT(*)
+            FROM jogadas_1
+            GROUP BY jogo_id, jogador_id, tempo, jogada, quadrante_linha, quadrante_coluna
+            ON CONFLICT DO NOTHING
+            """,
+        ]
+    ),
+    (
+        4,
+        "Tabela versao_tabelas com um contador de alterações por tabela, mantido por triggers",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS versao_tabelas (
+                tabela VARCHAR(63) PRIMARY KEY,
+                versao BIGINT NOT NULL DEFAULT 0,
+                alterada_em TIMESTAMP NOT NULL DEFAULT NOW()
+            )
+            """,
+            """
+            CREATE OR REPLACE FUNCTION registrar_alteracao_tabela() RETURNS TRIGGER AS $$
+            BEGIN
+                INSERT INTO versao_tabelas (tabela, versao, alterada_em)
+                VALUES (TG_TABLE_NAME, 1, NOW())
+                ON CONFLICT (tabela)
+                DO UPDATE SET versao = versao_tabelas.versao + 1, alterada_em = NOW();
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+            """,
+        ] + [
+            comando
+            for tabela in ("equipes_1", "jogadores_1", "jogos_1", "jogadas_1", "gols_1")
+            for comando in (
+                f"DROP TRIGGER IF EXISTS versao_{tabela} ON {tabela}",
+                f"""
+                CREATE TRIGGER versao_{tabela} AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {tabela}
+                FOR EACH STATEMENT EXECUTE FUNCTION registrar_alteracao_tabela()
+                """,
+                f"INSERT INTO versao_tabelas (tabela) VALUES ('{tabela}') ON CONFLICT DO NOTHING",
+            )
+        ]
+    ),
+]
+
+
+# Tabelas afetadas indiretamente por escritas em cada tabela (ON DELETE CASCADE / SET NULL
+# e os triggers de resumo_jogo). Usado para invalidar o cache de consultas.
+DEPENDENCIAS_TABELAS = {
+    "equipes_1": ("jogadores_1", "jogos_1", "gols_1"),
+    "jogadores_1": ("jogadas_1", "gols_1"),
+    "jogos_1": ("jogadas_1", "gols_1"),
+    "jogadas_1": ("resumo_jogo",),
+}
+
+
+def tabelas_afetadas(tabelas):
+    """
+    Expande um conjunto de tabelas com todas as que dependem delas em `DEPENDENCIAS_TABELAS`.
+
+    Args:
+        tabelas (iterable of str): As tabelas escritas diretamente.
+
+    Returns:
+        set of str: As tabelas escritas e as afetadas em cascata.
+    """
+    afetadas = set()
+    pendentes = list(tabelas)
+    while pendentes:
+        tabela = pendentes.pop()
+        if tabela not in afetadas:
+            afetadas.add(tabela)
+            pendentes.extend(DEPENDENCIAS_TABELAS.get(tabela, ()))
+    return afetadas
+
+
+def consulta_em_cache(*tabelas):
+    """
+    Decorador de métodos de leitura do DBManager: guarda o resultado por argumentos
+    e o marca com as tabelas lidas, para ser descartado quando uma delas for alterada.
+
+    A invalidação só enxerga escritas deste processo, então o decorador é para consultas
+    de exibição (`listar_*`), não para as verificações que protegem uma escrita (`verificar_*`).
+
+    Args:
+        *tabelas (str): As tabelas lidas pela consulta.
+    """
+    def decorador(metodo):
+        @wraps(metodo)
+        def envolucro(self, *args, **kwargs):
+            if not self.usar_cache:
+                return metodo(self, *args, **kwargs)
+
+            chave = (metodo.__name__, args, tuple(sorted(kwargs.items())))
+            with self._cache_lock:
+                entrada = self._cache.get(chave)
+                agora = time.monotonic()
+                if entrada is not None and agora - entrada[1] < self.VALIDADE_CACHE:
+                    self.cache_acertos += 1
+                    # Cópia da lista para que quem chama não altere o resultado guardado
+                    return list(entrada[0]) if isinstance(entrada[0], list) else entrada[0]
+                self.cache_falhas += 1
+                self._descartar_expiradas(agora)
+                geracoes = self._geracoes(tabelas)
+
+            resultado = metodo(self, *args, **kwargs)
+
+            with self._cache_lock:
+                # Só guarda se nenhuma das tabelas (nem o cache inteiro) foi invalidada durante a consulta
+                if geracoes == self._geracoes(tabelas):
+                    self._cache[chave] = (resultado, time.monotonic(), tabelas)
+            return list(resultado) if isinstance(resultado, list) else resultado
+        return envolucro
+    return decorador
+
+
+def invalida_cache(*tabelas):
+    """
+    Decorador de métodos de escrita do DBManager: depois da escrita, descarta do cache
+    as consultas que leem as tabelas escritas ou as afetadas em cascata.
+
+    Args:
+        *tabelas (str): As tabelas escritas pelo método.
+    """
+    afetadas = tabelas_afetadas(tabelas)
+
+    def decorador(metodo):
+        @wraps(metodo)
+        def envolucro(self, *args, **kwargs):
+            try:
+                return metodo(self, *args, **kwargs)
+            finally:
+                self.invalidar_cache(afetadas)
+        return envolucro
+    return decorador
+
+
 class DBManager:
     """
     Gerencia a conexão e as operações com o banco de dados PostgreSQL.
+
+    As conexões ficam em um pool compartilhado entre as sessões do Streamlit: cada
+    operação retira uma conexão, usa um cursor próprio e a devolve ao final, de modo
+    que consultas de sessões diferentes rodam em paralelo sem compartilhar cursor.
     """
-    
-    def __init__(self):
+
+    # Conexões ociosas por mais tempo que isso (em segundos) são testadas antes do uso.
+    INTERVALO_VERIFICACAO = 30
+
+    # Tempo máximo (em segundos) de uma consulta em cache, para escritas feitas fora deste processo.
+    VALIDADE_CACHE = 300
+
+    def __init__(self, minconn=1, maxconn=10, usar_cache=True):
         """
-        Inicializa a conexão com o banco de dados PostgreSQL usando as
+        Inicializa o pool de conexões com o banco de dados PostgreSQL usando as
         variáveis de ambiente do Streamlit.
 
+        Args:
+            minconn (int, optional): Número mínimo de conexões mantidas abertas. Defaults to 1.
+            maxconn (int, optional): Número máximo de conexões simultâneas. Defaults to 10.
+            usar_cache (bool, optional): Se True, os métodos marcados com `consulta_em_cache`
+                                         guardam seus resultados. Defaults to True.
+
         Raises:
             psycopg2.OperationalError: Se a conexão com o banco de dados falhar.
         """
         try:
-            self.conn = psycopg2.connect(
+            self.pool = pool.ThreadedConnectionPool(
+                minconn,
+                maxconn,
                 host=st.secrets.DB_HOST,
                 port=st.secrets.DB_PORT,
                 database=st.secrets.DB_NAME,
@@ -24,16 +308,103 @@ class DBManager:
                 password=st.secrets.DB_PASSWORD,
                 sslmode="require"
             )
-            self.cursor = self.conn.cursor()
         except psycopg2.OperationalError as e:
             print(f"Erro de conexão: {e}")
             raise
+
+        # O pool lança erro quando esgotado; o semáforo faz a sessão esperar por uma conexão livre.
+        self._semaforo = threading.BoundedSemaphore(maxconn)
+        self._ultimo_uso = {}
+        self._migracoes_aplicadas = False
+
+        # Cache de consultas: chave -> (resultado, instante, tabelas)
+        self.usar_cache = usar_cache
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._geracao_tabelas = {}
+        self._geracao_global = 0
+        self.cache_acertos = 0
+        self.cache_falhas = 0
+
+    def _conexao_valida(self, conn):
+        """
+        Verifica se uma conexão retirada do pool ainda pode ser usada.
+
+        Conexões usadas recentemente são verificadas apenas pelo estado local; as que
+        ficaram ociosas por mais de `INTERVALO_VERIFICACAO` segundos recebem um `SELECT 1`.
+
+        Args:
+            conn (psycopg2.extensions.connection): A conexão a ser verificada.
+
+        Returns:
+            bool: True se a conexão estiver saudável, False caso contrário.
+        """
+        if conn.closed or conn.info.transaction_status == extensions.TRANSACTION_STATUS_UNKNOWN:
+            return False
+
+        ociosa = time.monotonic() - self._ultimo_uso.get(id(conn), 0)
+        if ociosa < self.INTERVALO_VERIFICACAO:
+            return True
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            return False
+
+    def _obter_conexao(self):
+        """
+        Retira uma conexão saudável do pool, descartando e substituindo conexões quebradas.
+
+        Returns:
+            psycopg2.extensions.connection: Uma conexão pronta para uso.
+        """
+        conn = self.pool.getconn()
+        while not self._conexao_valida(conn):
+            self._ultimo_uso.pop(id(conn), None)
+            self.pool.putconn(conn, close=True)
+            conn = self.pool.getconn()
+        return conn
+
+    @contextmanager
+    def obter_cursor(self):
+        """
+        Fornece um cursor exclusivo dentro de uma transação.
+
+        A transação é confirmada ao final do bloco ou revertida em caso de erro, e a
+        conexão volta ao pool nos dois casos.
+
+        Yields:
+            psycopg2.extensions.cursor: Um cursor ligado a uma conexão do pool.
+        """
+        with self._semaforo:
+            conn = self._obter_conexao()
+            try:
+                with conn.cursor() as cursor:
+                    yield cursor
+                conn.commit()
+            except Exception:
+                if not conn.closed:
+                    conn.rollback()
+                raise
+            finally:
+                if conn.closed:
+                    self._ultimo_uso.pop(id(conn), None)
+                else:
+                    self._ultimo_uso[id(conn)] = time.monotonic()
+                self.pool.putconn(conn, close=bool(conn.closed))
         
     def criar_tabelas(self):
         """
         Cria as tabelas `equipes_1`, `jogadores_1`, `jogos_1`, `jogadas_1` e `gols_1`
-        se elas ainda não existirem.
-        Caso ocorra algum erro, a transação será revertida.
+        se elas ainda não existirem e aplica as migrações pendentes.
+        Caso ocorra algum erro, a transação é revertida e o erro é relançado,
+        sem aplicar as migrações sobre um schema incompleto.
+
+        Raises:
+            psycopg2.Error: Se algum comando de criação falhar.
         """
         comandos = [
             """
@@ -106,18 +477,115 @@ class DBManager:
         ]
 
         try:
-            for comando in comandos:
-                self.cursor.execute(comando)
-            self.conn.commit()
+            with self.obter_cursor() as cursor:
+                for comando in comandos:
+                    cursor.execute(comando)
         except Exception as e:
-            self.conn.rollback()
+            print(f"Erro ao criar tabelas: {e}")
+            raise
+
+        self.aplicar_migracoes()
+
+    def aplicar_migracoes(self):
+        """
+        Aplica, em ordem, as migrações de `MIGRACOES` que ainda não constam na
+        tabela `schema_migracoes`.
+
+        Cada migração roda em sua própria transação junto com o registro da versão,
+        sob um advisory lock, então aplicar de novo ou em paralelo não tem efeito.
+        Depois da primeira execução bem-sucedida o método não consulta mais o banco.
+
+        Returns:
+            list of int: As versões aplicadas nesta chamada.
+        """
+        if self._migracoes_aplicadas:
+            return []
+
+        with self.obter_cursor() as cursor:
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS schema_migracoes (
+                    versao INT PRIMARY KEY,
+                    descricao VARCHAR(255) NOT NULL,
+                    aplicada_em TIMESTAMP NOT NULL DEFAULT NOW()
+                )
+                """
+            )
+
+        aplicadas = []
+        for versao, descricao, comandos in sorted(MIGRACOES, key=lambda migracao: migracao[0]):
+            with self.obter_cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_xact_lock(hashtext('schema_migracoes'))")
+                cursor.execute("SELECT 1 FROM schema_migracoes WHERE versao = %s", (versao,))
+                if cursor.fetchone():
+                    continue
+                for comando in comandos:
+                    cursor.execute(comando)
+                cursor.execute(
+                    "INSERT INTO schema_migracoes (versao, descricao) VALUES (%s, %s)",
+                    (versao, descricao)
+                )
+                aplicadas.append(versao)
+
+        self._migracoes_aplicadas = True
+        return aplicadas
 
         
-    def rollback(self):
+    def invalidar_cache(self, tabelas=None):
+        """
+        Descarta do cache as consultas que leem alguma das tabelas informadas.
+
+        Args:
+            tabelas (iterable of str, optional): As tabelas alteradas. Se None, descarta todo o cache.
+        """
+        with self._cache_lock:
+            if tabelas is None:
+                # Vale também para tabelas que nenhuma consulta terminada leu ainda
+                self._geracao_global += 1
+                self._cache.clear()
+                return
+            tabelas = set(tabelas)
+            self._cache = {
+                chave: entrada for chave, entrada in self._cache.items()
+                if tabelas.isdisjoint(entrada[2])
+            }
+            for tabela in tabelas:
+                self._geracao_tabelas[tabela] = self._geracao_tabelas.get(tabela, 0) + 1
+
+    def _geracoes(self, tabelas):
+        """
+        Retorna as gerações do cache inteiro e de cada tabela, comparadas antes e depois de uma
+        consulta para saber se houve invalidação no meio. Chamado com `_cache_lock` adquirido.
+
+        Args:
+            tabelas (tuple of str): As tabelas lidas pela consulta.
+
+        Returns:
+            tuple of int: A geração global seguida da geração de cada tabela.
         """
-        Desfaz a última transação do banco de dados.
+        return (self._geracao_global,) + tuple(self._geracao_tabelas.get(tabela, 0) for tabela in tabelas)
+
+    def _descartar_expiradas(self, agora):
+        """
+        Remove do cache as consultas com mais de VALIDADE_CACHE segundos, para que argumentos
+        que não voltam a ser consultados não acumulem entradas. Chamado com `_cache_lock` adquirido.
+
+        Args:
+            agora (float): O instante atual de `time.monotonic()`.
         """
-        self.conn.rollback()
+        expiradas = [chave for chave, entrada in self._cache.items() if agora - entrada[1] >= self.VALIDADE_CACHE]
+        for chave in expiradas:
+            del self._cache[chave]
+
+    def estatisticas_cache(self):
+        """
+        Retorna os contadores do cache de consultas.
+
+        Returns:
+            dict: {'acertos': int, 'falhas': int, 'entradas': int}
+        """
+        with self._cache_lock:
+            return {"acertos": self.cache_acertos, "falhas": self.cache_falhas, "entradas": len(self._cache)}
 
     def verificar_equipe_existente(self, nome, categoria):
         """
@@ -132,14 +600,15 @@ class DBManager:
         """
         nome=nome.strip()
         
-        self.cursor.execute(
-            """
-            SELECT id FROM equipes_1
-            WHERE nome = %s AND categoria = %s
-            """,
-            (nome, categoria)
-        )
-        return self.cursor.fetchone()  # Retorna None se não encontrar
+        with self.obter_cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT id FROM equipes_1
+                WHERE nome = %s AND categoria = %s
+                """,
+                (nome, categoria)
+            )
+            return cursor.fetchone()  # Retorna None se não encontrar
     
     def verificar_jogador_por_nome(self, nome, equipe_id, jogador_id=None):
         """
@@ -154,15 +623,16 @@ class DBManager:
         Returns:
             str or None: Uma string de erro se um jogador com o mesmo nome for encontrado, caso contrário, None.
         """
-        self.cursor.execute(
-            """
-            SELECT 1 FROM jogadores_1 WHERE nome = %s AND equipe_id = %s AND id != %s
-            """,
-            (nome, equipe_id, jogador_id)
-        )
-        resultado = self.cursor.fetchone()
-        if resultado:
-            return "Jogador já cadastrado com este nome."
+        with self.obter_cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT 1 FROM jogadores_1 WHERE nome = %s AND equipe_id = %s AND id != %s
+                """,
+                (nome, equipe_id, jogador_id)
+            )
+            resultado = cursor.fetchone()
+            if resultado:
+                return "Jogador já cadastrado com este nome."
 
     def verificar_jogador_por_numero_camisa(self, numero_camisa, equipe_id, jogador_id=None):
         """
@@ -177,17 +647,19 @@ class DBManager:
         Returns:
             str or None: Uma string de erro se um jogador com o mesmo número de camisa for encontrado, caso contrário, None.
         """
-        self.cursor.execute(
-            """
-            SELECT 1 FROM jogadores_1 WHERE numero_camisa = %s AND equipe_id = %s AND id != %s
-            """,
-            (numero_camisa, equipe_id, jogador_id)
-        )
-        resultado = self.cursor.fetchone()
-        if resultado:
-            return "Já existe um jogador com este número de camisa no equipe."
+        with self.obter_cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT 1 FROM jogadores_1 WHERE numero_camisa = %s AND equipe_id = %s AND id != %s
+                """,
+                (numero_camisa, equipe_id, jogador_id)
+            )
+            resultado = cursor.fetchone()
+            if resultado:
+                return "Já existe um jogador com este número de camisa no equipe."
 
     
+    @invalida_cache("equipes_1")
     def adicionar_equipe(self, nome, categoria, logo_id):
         """
         Adiciona uma nova equipe ao banco de dados.
@@ -206,19 +678,20 @@ class DBManager:
             return None
 
         # Inserir o novo equipe
-        self.cursor.execute(
-            """
-            INSERT INTO equipes_1 (nome, categoria, logo_id)
-            VALUES (%s, %s,%s)
-            RETURNING id
-            """,
-            (nome, categoria, logo_id)
-        )
-        self.conn.commit()
-        novo_id = self.cursor.fetchone()[0]
-        return novo_id
+        with self.obter_cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO equipes_1 (nome, categoria, logo_id)
+                VALUES (%s, %s,%s)
+                RETURNING id
+                """,
+                (nome, categoria, logo_id)
+            )
+            novo_id = cursor.fetchone()[0]
+            return novo_id
 
 
+    @invalida_cache("jogadores_1")
     def adicionar_jogador(self, nome, equipe_id, equipe_nome, posicao, numero_camisa, image_id=None):
         """
         Adiciona um novo jogador ao banco de dados, verificando se o nome e o número da camisa 
@@ -247,17 +720,18 @@ class DBManager:
             return erro_numero_camisa  # Retorna a mensagem de erro se o número da camisa já estiver em uso
 
         # Inserir o novo jogador
-        self.cursor.execute(
-            """
-            INSERT INTO jogadores_1 (nome, equipe_id, equipe, posicao, numero_camisa, image_id)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            """,
-            (nome, equipe_id, equipe_nome, posicao, numero_camisa, image_id)
-        )
-        self.conn.commit()
-        novo_id = self.cursor.lastrowid
-        return novo_id
+        with self.obter_cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO jogadores_1 (nome, equipe_id, equipe, posicao, numero_camisa, image_id)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                """,
+                (nome, equipe_id, equipe_nome, posicao, numero_camisa, image_id)
+            )
+            novo_id = cursor.lastrowid
+            return novo_id
     
+    @invalida_cache("jogadores_1")
     def editar_jogador(self, equipe_id, jogador_id, nome=None, numero_camisa=None, posicao=None, image_id=None):
         """
         Edita os dados de um jogador existente.
@@ -301,10 +775,11 @@ class DBManager:
         valores.append(jogador_id)
 
         comando = f"UPDATE jogadores_1 SET {', '.join(campos)} WHERE id = %s"
-        self.cursor.execute(comando, tuple(valores))
-        self.conn.commit()
+        with self.obter_cursor() as cursor:
+            cursor.execute(comando, tuple(valores))
 
 
+    @invalida_cache("jogos_1")
     def adicionar_jogo(self, equipe_mandante_id, equipe_mandante_nome, equipe_visitante_id, equipe_visitante_nome, data, fase, rodada, competicao):
         """
         Adiciona um novo jogo ao banco de dados.
@@ -322,17 +797,18 @@ class DBManager:
         Returns:
             int: O ID do novo jogo.
         """
-        self.cursor.execute(
-            """
-            INSERT INTO jogos_1 (equipe_mandante_id, equipe_mandante_nome, equipe_visitante_id, equipe_visitante_nome, data, fase, rodada, competicao)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
-            """,
-            (equipe_mandante_id, equipe_mandante_nome, equipe_visitante_id, equipe_visitante_nome, data, fase, rodada, competicao)
-        )
-        self.conn.commit()
-        return self.cursor.fetchone()[0]
+        with self.obter_cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO jogos_1 (equipe_mandante_id, equipe_mandante_nome, equipe_visitante_id, equipe_visitante_nome, data, fase, rodada, competicao)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                RETURNING id
+                """,
+                (equipe_mandante_id, equipe_mandante_nome, equipe_visitante_id, equipe_visitante_nome, data, fase, rodada, competicao)
+            )
+            return cursor.fetchone()[0]
 
+    @invalida_cache("jogadas_1")
     def adicionar_jogada(self, jogador_id, jogador_nome, jogo_id, jogada, tempo, x_loc, y_loc):
         """
         Adiciona uma nova jogada ao banco de dados.
@@ -349,16 +825,48 @@ class DBManager:
         Returns:
             int: O ID da jogada recém-adicionada.
         """
-        self.cursor.execute(
-            """
-            INSERT INTO jogadas_1 (jogador_id, jogador_nome, jogo_id, jogada, tempo, x_loc, y_loc, hora_jogada)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, CURRENT_TIME)
-            """,
-            (jogador_id, jogador_nome, jogo_id, jogada, tempo, x_loc, y_loc)
-        )
-        self.conn.commit()
-        return self.cursor.lastrowid
+        with self.obter_cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO jogadas_1 (jogador_id, jogador_nome, jogo_id, jogada, tempo, x_loc, y_loc, hora_jogada)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, CURRENT_TIME)
+                """,
+                (jogador_id, jogador_nome, jogo_id, jogada, tempo, x_loc, y_loc)
+            )
+            return cursor.lastrowid
+
+    @invalida_cache("jogadas_1")
+    def adicionar_jogadas_lote(self, jogadas):
+        """
+        Adiciona várias jogadas ao banco de dados em um único comando `INSERT` de
+        múltiplas linhas e uma única transação: ou todas são gravadas, ou nenhuma.
+
+        Args:
+            jogadas (list of tuple): Lista de tuplas no formato
+                                     (jogador_id, jogador_nome, jogo_id, jogada, tempo, x_loc, y_loc).
+
+        Returns:
+            list of int: Os IDs das jogadas recém-adicionadas, na mesma ordem da entrada.
+        """
+        if not jogadas:
+            return []
+
+        with self.obter_cursor() as cursor:
+            resultado = extras.execute_values(
+                cursor,
+                """
+                INSERT INTO jogadas_1 (jogador_id, jogador_nome, jogo_id, jogada, tempo, x_loc, y_loc, hora_jogada)
+                VALUES %s
+                RETURNING id
+                """,
+                jogadas,
+                template="(%s, %s, %s, %s, %s, %s, %s, CURRENT_TIME)",
+                page_size=len(jogadas),
+                fetch=True
+            )
+            return [linha[0] for linha in resultado]
 
+    @consulta_em_cache("equipes_1")
     def listar_equipes(self):
         """
         Lista todas as equipes cadastradas no banco de dados.
@@ -367,9 +875,11 @@ class DBManager:
             list of tuple: Uma lista de tuplas, onde cada tupla contém:
                            (id, nome, categoria)
         """
-        self.cursor.execute("SELECT id, nome, categoria FROM equipes_1")
-        return self.cursor.fetchall()  # Retorna uma lista de tuplas
+        with self.obter_cursor() as cursor:
+            cursor.execute("SELECT id, nome, categoria FROM equipes_1")
+            return cursor.fetchall()  # Retorna uma lista de tuplas
 
+    @consulta_em_cache("equipes_1")
     def listar_dados_equipe(self, id):
         """
         Lista os dados de uma equipe específica.
@@ -381,12 +891,14 @@ class DBManager:
             tuple or None: Uma tupla com os dados da equipe se encontrada, caso contrário, None. A tupla contém:
                            (nome, categoria, logo_id)
         """
-        self.cursor.execute("""
-            SELECT nome, categoria, logo_id
-            FROM equipes_1
-            WHERE id = %s""", (id,))
-        return self.cursor.fetchone()
+        with self.obter_cursor() as cursor:
+            cursor.execute("""
+                SELECT nome, categoria, logo_id
+                FROM equipes_1
+                WHERE id = %s""", (id,))
+            return cursor.fetchone()
     
+    @invalida_cache("equipes_1")
     def atualizar_equipe(self, id, nome=None, categoria=None, logo=None):
         """
         Atualiza os dados de uma equipe existente.
@@ -427,9 +939,10 @@ class DBManager:
             WHERE id = %s
         """
 
-        self.cursor.execute(sql, tuple(valores))
-        self.conn.commit()
+        with self.obter_cursor() as cursor:
+            cursor.execute(sql, tuple(valores))
     
+    @consulta_em_cache("jogadores_1")
     def listar_jogadores(self):
         """
         Lista todos os jogadores cadastrados no banco de dados.
@@ -438,9 +951,11 @@ class DBManager:
             list of tuple: Uma lista de tuplas, onde cada tupla contém:
                            (id, nome, equipe, posicao)
         """
-        self.cursor.execute("SELECT id, nome, equipe, posicao FROM jogadores_1")
-        return self.cursor.fetchall()  # Retorna uma lista de tuplas
+        with self.obter_cursor() as cursor:
+            cursor.execute("SELECT id, nome, equipe, posicao FROM jogadores_1")
+            return cursor.fetchall()  # Retorna uma lista de tuplas
 
+    @consulta_em_cache("jogos_1")
     def listar_jogos(self):
         """
         Lista todos os jogos cadastrados no banco de dados, ordenados por data decrescente.
@@ -449,8 +964,9 @@ class DBManager:
             list of tuple: Uma lista de tuplas, onde cada tupla contém:
                            (id, equipe_mandante_id, equipe_mandante_nome, equipe_visitante_id, equipe_visitante_nome, data, competicao, fase, rodada)
         """
-        self.cursor.execute("SELECT id, equipe_mandante_id, equipe_mandante_nome, equipe_visitante_id, equipe_visitante_nome, data, competicao, fase, rodada FROM jogos_1 ORDER BY data DESC")
-        return self.cursor.fetchall()
+        with self.obter_cursor() as cursor:
+            cursor.execute("SELECT id, equipe_mandante_id, equipe_mandante_nome, equipe_visitante_id, equipe_visitante_nome, data, competicao, fase, rodada FROM jogos_1 ORDER BY data DESC")
+            return cursor.fetchall()
     
     def listar_jogadas(self):
         """
@@ -460,8 +976,9 @@ class DBManager:
             list of tuple: Uma lista de tuplas, onde cada tupla contém:
                            (id, jogador_id, jogador_nome, jogo_id, jogada, tempo, x_loc, y_loc)
         """
-        self.cursor.execute("SELECT * FROM jogadas_1")
-        return self.cursor.fetchall()  # Retorna uma lista de tuplas
+        with self.obter_cursor() as cursor:
+            cursor.execute("SELECT * FROM jogadas_1")
+            return cursor.fetchall()  # Retorna uma lista de tuplas
 
     def listar_jogadas_por_partida_com_tempo(self, jogo_id):
         """
@@ -483,34 +1000,42 @@ class DBManager:
                 - tempo (str): tempo da jogada (ex: '1ºT', '2ºT', etc.)
                 - x_loc (float)
                 - y_loc (float)
+                - hora_jogada (time)
                 - tempo_relativo_jogada (timedelta): diferença entre o horário da jogada e o início da partida
-        """
-        self.cursor.execute("""
-            SELECT
-                jogos_1.equipe_mandante_nome,
-                jogos_1.equipe_visitante_nome,
-                jogos_1.fase,
-                jogos_1.rodada,
-                jogos_1.competicao,
-                jogadas_1.jogador_nome, 
-                jogadas_1.jogada,
-                jogadas_1.tempo,
-                jogadas_1.x_loc,
-                jogadas_1.y_loc,
-                jogadas_1.hora_jogada,
-                EXTRACT(EPOCH from jogadas_1.hora_jogada - jogos_1.inicio_partida) as tempo_relativo_jogada
-            FROM
-                jogos_1
-            INNER JOIN
-                jogadas_1
-            ON
-                jogos_1.id = jogadas_1.jogo_id
-            WHERE
-                jogos_1.id = %s
-            ORDER BY
-                jogadas_1.id ASC
-        """, (jogo_id,))
-        return self.cursor.fetchall()
+                - quadrante_linha (int)
+                - quadrante_coluna (int)
+                - segundos_jogada (float): horário da jogada em segundos desde a meia-noite
+        """
+        with self.obter_cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    jogos_1.equipe_mandante_nome,
+                    jogos_1.equipe_visitante_nome,
+                    jogos_1.fase,
+                    jogos_1.rodada,
+                    jogos_1.competicao,
+                    jogadas_1.jogador_nome, 
+                    jogadas_1.jogada,
+                    jogadas_1.tempo,
+                    jogadas_1.x_loc,
+                    jogadas_1.y_loc,
+                    jogadas_1.hora_jogada,
+                    EXTRACT(EPOCH from jogadas_1.hora_jogada - jogos_1.inicio_partida) as tempo_relativo_jogada,
+                    jogadas_1.quadrante_linha,
+                    jogadas_1.quadrante_coluna,
+                    EXTRACT(EPOCH FROM jogadas_1.hora_jogada)::float8 AS segundos_jogada
+                FROM
+                    jogos_1
+                INNER JOIN
+                    jogadas_1
+                ON
+                    jogos_1.id = jogadas_1.jogo_id
+                WHERE
+                    jogos_1.id = %s
+                ORDER BY
+                    jogadas_1.id ASC
+            """, (jogo_id,))
+            return cursor.fetchall()
     
     def listar_jogadas_por_partida(self, jogo_id):
         """
@@ -532,33 +1057,39 @@ class DBManager:
                 - tempo (str): tempo da jogada (ex: '1ºT', '2ºT', etc.)
                 - x_loc (float)
                 - y_loc (float)
-        """
-        self.cursor.execute("""
-            SELECT
-                jogos_1.equipe_mandante_nome,
-                jogos_1.equipe_visitante_nome,
-                jogos_1.fase,
-                jogos_1.rodada,
-                jogos_1.competicao,
-                jogadas_1.jogador_nome, 
-                jogadas_1.jogada,
-                jogadas_1.tempo,
-                jogadas_1.x_loc,
-                jogadas_1.y_loc
-            FROM
-                jogos_1
-            INNER JOIN
-                jogadas_1
-            ON
-                jogos_1.id = jogadas_1.jogo_id
-            WHERE
-                jogos_1.id = %s
-            ORDER BY
-                jogadas_1.id ASC
-        """, (jogo_id,))
-        return self.cursor.fetchall()
+                - quadrante_linha (int)
+                - quadrante_coluna (int)
+        """
+        with self.obter_cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    jogos_1.equipe_mandante_nome,
+                    jogos_1.equipe_visitante_nome,
+                    jogos_1.fase,
+                    jogos_1.rodada,
+                    jogos_1.competicao,
+                    jogadas_1.jogador_nome, 
+                    jogadas_1.jogada,
+                    jogadas_1.tempo,
+                    jogadas_1.x_loc,
+                    jogadas_1.y_loc,
+                    jogadas_1.quadrante_linha,
+                    jogadas_1.quadrante_coluna
+                FROM
+                    jogos_1
+                INNER JOIN
+                    jogadas_1
+                ON
+                    jogos_1.id = jogadas_1.jogo_id
+                WHERE
+                    jogos_1.id = %s
+                ORDER BY
+                    jogadas_1.id ASC
+            """, (jogo_id,))
+            return cursor.fetchall()
     
     
+    @consulta_em_cache("jogadores_1")
     def listar_jogadores_por_equipe(self, equipe_id):
         """
         Lista todos os jogadores de uma equipe específica.
@@ -570,9 +1101,11 @@ class DBManager:
             list of tuple: Uma lista de tuplas, onde cada tupla contém:
                            (id, nome, posicao, numero_camisa, image_id)
         """
-        self.cursor.execute("SELECT id, nome, posicao, numero_camisa, image_id FROM jogadores_1 WHERE equipe_id = %s", (equipe_id,))
-        return self.cursor.fetchall()  # Retorna uma lista de tuplas
+        with self.obter_cursor() as cursor:
+            cursor.execute("SELECT id, nome, posicao, numero_camisa, image_id FROM jogadores_1 WHERE equipe_id = %s", (equipe_id,))
+            return cursor.fetchall()  # Retorna uma lista de tuplas
     
+    @consulta_em_cache("jogadores_1")
     def listar_nome_id_jogadores_por_equipe(self, equipe_id):
         """
         Lista o ID e o nome de todos os jogadores de uma equipe específica.
@@ -584,9 +1117,11 @@ class DBManager:
             list of tuple: Uma lista de tuplas, onde cada tupla contém:
                            (id, nome)
         """
-        self.cursor.execute("SELECT id, nome FROM jogadores_1 WHERE equipe_id = %s", (equipe_id,))
-        return self.cursor.fetchall()  # Retorna uma lista de tuplas
+        with self.obter_cursor() as cursor:
+            cursor.execute("SELECT id, nome FROM jogadores_1 WHERE equipe_id = %s", (equipe_id,))
+            return cursor.fetchall()  # Retorna uma lista de tuplas
 
+    @consulta_em_cache("jogos_1")
     def listar_jogos_por_equipe_e_competicao(self, equipe_id, competicao):
         """
         Lista todos os jogos de uma equipe em uma competição específica.
@@ -598,15 +1133,17 @@ class DBManager:
         Returns:
             list of tuple: Uma lista de tuplas, onde cada tupla contém os dados do jogo.
         """
-        self.cursor.execute(
-            """
-            SELECT * FROM jogos_1
-            WHERE (equipe_mandante_id = %s OR equipe_visitante_id = %s) AND competicao = %s
-            """,
-            (equipe_id, equipe_id, competicao)
-        )
-        return self.cursor.fetchall()  # Retorna uma lista de tuplas
+        with self.obter_cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT * FROM jogos_1
+                WHERE (equipe_mandante_id = %s OR equipe_visitante_id = %s) AND competicao = %s
+                """,
+                (equipe_id, equipe_id, competicao)
+            )
+            return cursor.fetchall()  # Retorna uma lista de tuplas
 
+    @consulta_em_cache("jogos_1")
     def listar_detalhes_jogo(self, jogo_id):
         """
         Lista os detalhes de um jogo específico.
@@ -618,8 +1155,9 @@ class DBManager:
             tuple or None: Uma tupla com os detalhes do jogo se encontrado, caso contrário, None. A tupla contém:
                            (equipe_mandante_id, equipe_mandante_nome, equipe_visitante_id, equipe_visitante_nome, data, fase, rodada, competicao)
         """
-        self.cursor.execute("SELECT equipe_mandante_id, equipe_mandante_nome, equipe_visitante_id, equipe_visitante_nome, data, fase, rodada, competicao FROM jogos_1 WHERE id = %s", (jogo_id,))
-        return self.cursor.fetchone()
+        with self.obter_cursor() as cursor:
+            cursor.execute("SELECT equipe_mandante_id, equipe_mandante_nome, equipe_visitante_id, equipe_visitante_nome, data, fase, rodada, competicao FROM jogos_1 WHERE id = %s", (jogo_id,))
+            return cursor.fetchone()
     
     def listar_jogadas_por_jogo(self, jogo_id):
         """
@@ -633,69 +1171,267 @@ class DBManager:
                            (equipe_mandante_nome, equipe_visitante_nome, fase_jogo, rodada_jogo, competicao_jogo, 
                            nome_jogador, tipo_jogada, tempo_jogada, x_loc_jogada, y_loc_jogada)
         """
-        self.cursor.execute("""
-            SELECT
-                jogos_1.equipe_mandante_nome,
-                jogos_1.equipe_visitante_nome,
-                jogos_1.fase,
-                jogos_1.rodada,
-                jogos_1.competicao,
-                jogadas_1.jogador_nome, 
-                jogadas_1.jogada,
-                jogadas_1.tempo,
-                jogadas_1.x_loc,
-                jogadas_1.y_loc
-            FROM
-                jogos_1
-            INNER JOIN
-                jogadas_1
-            ON
-                jogos_1.id = jogadas_1.jogo_id
-            WHERE
-                jogos_1.id = %s""", 
-                (jogo_id,))
-        return self.cursor.fetchall() 
+        with self.obter_cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    jogos_1.equipe_mandante_nome,
+                    jogos_1.equipe_visitante_nome,
+                    jogos_1.fase,
+                    jogos_1.rodada,
+                    jogos_1.competicao,
+                    jogadas_1.jogador_nome, 
+                    jogadas_1.jogada,
+                    jogadas_1.tempo,
+                    jogadas_1.x_loc,
+                    jogadas_1.y_loc
+                FROM
+                    jogos_1
+                INNER JOIN
+                    jogadas_1
+                ON
+                    jogos_1.id = jogadas_1.jogo_id
+                WHERE
+                    jogos_1.id = %s""", 
+                    (jogo_id,))
+            return cursor.fetchall() 
     
     
-    def listar_dados_analise_individual(self):
+    def _filtro_jogadas(self, equipe_id=None, competicao=None, jogo_id=None, jogador_id=None,
+                        a_partir_de_id=None, ate_id=None):
+        """
+        Monta a cláusula WHERE e os parâmetros das consultas de jogadas que unem
+        jogadas_1, jogos_1 e jogadores_1. Filtros None são ignorados.
+
+        Args:
+            equipe_id, competicao, jogo_id, jogador_id, a_partir_de_id, ate_id:
+                Os mesmos filtros de `listar_dados_analise_individual`.
+
+        Returns:
+            tuple: (clausula_where, parametros). A cláusula é vazia se não houver filtros.
+        """
+        filtros = [
+            ("jogadores_1.equipe_id = %s", equipe_id),
+            ("jogos_1.competicao = %s", competicao),
+            ("jogadas_1.jogo_id = %s", jogo_id),
+            ("jogadas_1.jogador_id = %s", jogador_id),
+            ("jogadas_1.id > %s", a_partir_de_id),
+            ("jogadas_1.id <= %s", ate_id),
+        ]
+        condicoes = [condicao for condicao, valor in filtros if valor is not None]
+        parametros = [valor for condicao, valor in filtros if valor is not None]
+        clausula = f"WHERE {' AND '.join(condicoes)}" if condicoes else ""
+        return clausula, parametros
+
+    def listar_dados_analise_individual(self, equipe_id=None, competicao=None, jogo_id=None, jogador_id=None,
+                                        a_partir_de_id=None, ate_id=None):
         """
         Retorna uma lista completa de dados para análise individual, unindo informações de jogos, jogadas e jogadores.
+        Os filtros opcionais são aplicados no banco, de modo que só a fatia exibida é lida.
+
+        Args:
+            equipe_id (int, optional): Apenas jogadas de jogadores desta equipe. Defaults to None.
+            competicao (str, optional): Apenas jogadas de jogos desta competição. Defaults to None.
+            jogo_id (int, optional): Apenas jogadas deste jogo. Defaults to None.
+            jogador_id (int, optional): Apenas jogadas deste jogador. Defaults to None.
+            a_partir_de_id (int, optional): Se informado, retorna apenas as jogadas com id maior que este
+                                            (leitura incremental). Defaults to None.
+            ate_id (int, optional): Se informado, retorna apenas as jogadas com id menor ou igual a este.
+                                    Defaults to None.
 
         Returns:
             list of tuple: Uma lista de tuplas, onde cada tupla contém:
                            (id_jogo, equipe_mandante_nome, equipe_visitante_nome, fase_jogo, rodada_jogo, 
                            competicao_jogo, equipe_id_jogador, equipe_nome_jogador, nome_jogador, 
-                           tipo_jogada, tempo_jogada, x_loc_jogada, y_loc_jogada)
-        """
-        self.cursor.execute("""
-            SELECT
-                jogos_1.id,
-                jogos_1.equipe_mandante_nome,
-                jogos_1.equipe_visitante_nome,
-                jogos_1.fase,
-                jogos_1.rodada,
-                jogos_1.competicao,
-                jogadores_1.equipe_id,
-                jogadores_1.equipe,
-                jogadas_1.jogador_nome, 
-                jogadas_1.jogada,
-                jogadas_1.tempo,
-                jogadas_1.x_loc,
-                jogadas_1.y_loc
-            FROM
-                jogos_1
-            LEFT JOIN
-                jogadas_1
-            ON
-                jogos_1.id = jogadas_1.jogo_id
-            INNER JOIN 
-                jogadores_1 
-            ON
-                jogadas_1.jogador_id = jogadores_1.id
-            """)
-        return self.cursor.fetchall()
+                           tipo_jogada, tempo_jogada, x_loc_jogada, y_loc_jogada,
+                           quadrante_linha, quadrante_coluna, id_jogada)
+        """
+        filtro, parametros = self._filtro_jogadas(equipe_id, competicao, jogo_id, jogador_id, a_partir_de_id, ate_id)
+
+        with self.obter_cursor() as cursor:
+            cursor.execute(f"""
+                SELECT
+                    jogos_1.id,
+                    jogos_1.equipe_mandante_nome,
+                    jogos_1.equipe_visitante_nome,
+                    jogos_1.fase,
+                    jogos_1.rodada,
+                    jogos_1.competicao,
+                    jogadores_1.equipe_id,
+                    jogadores_1.equipe,
+                    jogadas_1.jogador_nome, 
+                    jogadas_1.jogada,
+                    jogadas_1.tempo,
+                    jogadas_1.x_loc,
+                    jogadas_1.y_loc,
+                    jogadas_1.quadrante_linha,
+                    jogadas_1.quadrante_coluna,
+                    jogadas_1.id
+                FROM
+                    jogos_1
+                LEFT JOIN
+                    jogadas_1
+                ON
+                    jogos_1.id = jogadas_1.jogo_id
+                INNER JOIN 
+                    jogadores_1 
+                ON
+                    jogadas_1.jogador_id = jogadores_1.id
+                {filtro}
+                """, parametros)
+            return cursor.fetchall()
+
+    def obter_marca_jogadas(self, equipe_id=None, competicao=None, jogo_id=None, jogador_id=None):
+        """
+        Retorna o maior id e o total de jogadas cadastradas, usados pela leitura
+        incremental para saber até onde ler e para detectar exclusões.
+
+        Args:
+            equipe_id (int, optional): Considera apenas jogadas de jogadores desta equipe. Defaults to None.
+            competicao (str, optional): Considera apenas jogadas de jogos desta competição. Defaults to None.
+            jogo_id (int, optional): Considera apenas jogadas deste jogo. Defaults to None.
+            jogador_id (int, optional): Considera apenas jogadas deste jogador. Defaults to None.
+
+        Returns:
+            tuple: (maior_id_jogada, total_jogadas). O maior id é 0 se não houver jogadas.
+        """
+        filtro, parametros = self._filtro_jogadas(equipe_id, competicao, jogo_id, jogador_id)
+
+        with self.obter_cursor() as cursor:
+            if not parametros:
+                cursor.execute("SELECT COALESCE(MAX(id), 0), COUNT(*) FROM jogadas_1")
+            else:
+                cursor.execute(f"""
+                    SELECT COALESCE(MAX(jogadas_1.id), 0), COUNT(*)
+                    FROM jogadas_1
+                    INNER JOIN jogos_1 ON jogos_1.id = jogadas_1.jogo_id
+                    INNER JOIN jogadores_1 ON jogadores_1.id = jogadas_1.jogador_id
+                    {filtro}
+                    """, parametros)
+            return cursor.fetchone()
+
+    def obter_versao_dados(self):
+        """
+        Retorna o contador de alterações de cada tabela, incrementado pelos triggers
+        a cada comando de escrita. Serve de chave barata para os caches de DataFrames.
+
+        Returns:
+            dict: {nome_tabela: versao}
+        """
+        with self.obter_cursor() as cursor:
+            cursor.execute("SELECT tabela, versao FROM versao_tabelas")
+            return dict(cursor.fetchall())
+
+    @consulta_em_cache("jogadores_1", "jogadas_1")
+    def listar_equipes_com_jogadas(self):
+        """
+        Lista as equipes que têm ao menos uma jogada registrada, sem ler as jogadas.
+
+        Returns:
+            list of tuple: Uma lista de tuplas (equipe_id, nome_equipe), ordenada pelo nome.
+        """
+        with self.obter_cursor() as cursor:
+            cursor.execute("""
+                SELECT DISTINCT jogadores_1.equipe_id, jogadores_1.equipe
+                FROM jogadores_1
+                WHERE EXISTS (SELECT 1 FROM jogadas_1 WHERE jogadas_1.jogador_id = jogadores_1.id)
+                ORDER BY jogadores_1.equipe
+                """)
+            return cursor.fetchall()
+
+    @consulta_em_cache("jogos_1", "jogadores_1", "jogadas_1")
+    def listar_competicoes_com_jogadas(self, equipe_id):
+        """
+        Lista as competições em que a equipe tem jogadas registradas.
+
+        Args:
+            equipe_id (int): O ID da equipe.
+
+        Returns:
+            list of str: Os nomes das competições, em ordem alfabética.
+        """
+        with self.obter_cursor() as cursor:
+            cursor.execute("""
+                SELECT DISTINCT jogos_1.competicao
+                FROM jogadas_1
+                INNER JOIN jogos_1 ON jogos_1.id = jogadas_1.jogo_id
+                INNER JOIN jogadores_1 ON jogadores_1.id = jogadas_1.jogador_id
+                WHERE jogadores_1.equipe_id = %s
+                ORDER BY jogos_1.competicao
+                """, (equipe_id,))
+            return [competicao for (competicao,) in cursor.fetchall()]
     
     
+    def contar_jogadas_agrupadas(self, por_quadrante=False, equipe_id=None, competicao=None, jogo_id=None, jogador_id=None):
+        """
+        Retorna a contagem de jogadas agregada por jogo, jogador, tempo e tipo de jogada,
+        em vez das jogadas individuais, junto com os dados do jogo e do jogador usados
+        nos filtros das páginas de análise.
+
+        A contagem vem da tabela `resumo_jogo`, mantida pelos triggers de jogadas_1, de modo
+        que o custo acompanha o número de combinações e não o número de jogadas.
+
+        Args:
+            por_quadrante (bool, optional): Se True, agrupa também pelas colunas
+                                            quadrante_linha e quadrante_coluna, para os
+                                            mapas de calor. Defaults to False.
+            equipe_id (int, optional): Apenas jogadas de jogadores desta equipe. Defaults to None.
+            competicao (str, optional): Apenas jogadas de jogos desta competição. Defaults to None.
+            jogo_id (int, optional): Apenas jogadas deste jogo. Defaults to None.
+            jogador_id (int, optional): Apenas jogadas deste jogador. Defaults to None.
+
+        Returns:
+            list of tuple: Uma lista de tuplas, ordenada por jogo, onde cada tupla contém:
+                           (id_jogo, equipe_mandante_nome, equipe_visitante_nome, fase_jogo, rodada_jogo,
+                           competicao_jogo, equipe_id_jogador, id_jogador, nome_jogador, tempo_jogada,
+                           tipo_jogada, quantidade)
+                           ou, com `por_quadrante`, com quadrante_linha e quadrante_coluna antes da quantidade.
+        """
+        # Colunas de jogos_1 e jogadores_1 dependem das chaves primárias agrupadas
+        agrupamento = ["jogos_1.id", "jogadores_1.id", "jogadas_1.tempo", "jogadas_1.jogada"]
+        colunas = [
+            "jogos_1.id",
+            "jogos_1.equipe_mandante_nome",
+            "jogos_1.equipe_visitante_nome",
+            "jogos_1.fase",
+            "jogos_1.rodada",
+            "jogos_1.competicao",
+            "jogadores_1.equipe_id",
+            "jogadores_1.id",
+            "jogadores_1.nome",
+            "jogadas_1.tempo",
+            "jogadas_1.jogada",
+        ]
+        if por_quadrante:
+            agrupamento += ["jogadas_1.quadrante_linha", "jogadas_1.quadrante_coluna"]
+            colunas += ["jogadas_1.quadrante_linha", "jogadas_1.quadrante_coluna"]
+
+        # resumo_jogo tem as mesmas colunas de jogadas_1 usadas nos filtros
+        filtro, parametros = self._filtro_jogadas(equipe_id, competicao, jogo_id, jogador_id)
+
+        with self.obter_cursor() as cursor:
+            cursor.execute(f"""
+                SELECT
+                    {", ".join(colunas)},
+                    SUM(jogadas_1.quantidade) AS quantidade
+                FROM
+                    resumo_jogo AS jogadas_1
+                INNER JOIN
+                    jogos_1
+                ON
+                    jogadas_1.jogo_id = jogos_1.id
+                INNER JOIN
+                    jogadores_1
+                ON
+                    jogadas_1.jogador_id = jogadores_1.id
+                {filtro}
+                GROUP BY
+                    {", ".join(agrupamento)}
+                ORDER BY
+                    jogos_1.id
+                """, parametros)
+            return cursor.fetchall()
+
+    @invalida_cache("equipes_1")
     def deletar_equipe(self, equipe_id):
         """
         Deleta uma equipe do banco de dados.
@@ -706,14 +1442,15 @@ class DBManager:
         Returns:
             bool: True se a equipe foi deletada com sucesso, False caso contrário.
         """
-        self.cursor.execute("DELETE FROM equipes_1 WHERE id = %s", (equipe_id,))
-        self.conn.commit()
+        with self.obter_cursor() as cursor:
+            cursor.execute("DELETE FROM equipes_1 WHERE id = %s", (equipe_id,))
         
-        if self.cursor.rowcount > 0:
-            return True
-        else:
-            return False
+            if cursor.rowcount > 0:
+                return True
+            else:
+                return False
 
+    @invalida_cache("jogadores_1")
     def deletar_jogador(self, jogador_id):
         """
         Deleta um jogador do banco de dados.
@@ -724,14 +1461,15 @@ class DBManager:
         Returns:
             bool: True se o jogador foi deletado com sucesso, False caso contrário.
         """
-        self.cursor.execute("DELETE FROM jogadores_1 WHERE id = %s", (jogador_id,))
-        self.conn.commit()
+        with self.obter_cursor() as cursor:
+            cursor.execute("DELETE FROM jogadores_1 WHERE id = %s", (jogador_id,))
         
-        if self.cursor.rowcount > 0:
-            return True
-        else:
-            return False
+            if cursor.rowcount > 0:
+                return True
+            else:
+                return False
 
+    @invalida_cache("jogos_1")
     def deletar_jogo(self, jogo_id):
         """
         Deleta um jogo do banco de dados.
@@ -742,14 +1480,15 @@ class DBManager:
         Returns:
             bool: True se o jogo foi deletado com sucesso, False caso contrário.
         """
-        self.cursor.execute("DELETE FROM jogos_1 WHERE id = %s", (jogo_id,))
-        self.conn.commit()
+        with self.obter_cursor() as cursor:
+            cursor.execute("DELETE FROM jogos_1 WHERE id = %s", (jogo_id,))
         
-        if self.cursor.rowcount > 0:
-            return True
-        else:
-            return False
+            if cursor.rowcount > 0:
+                return True
+            else:
+                return False
 
+    @invalida_cache("jogadas_1")
     def deletar_jogada(self, jogada_id):
         """
         Deleta uma jogada do banco de dados.
@@ -760,13 +1499,13 @@ class DBManager:
         Returns:
             bool: True se a jogada foi deletada com sucesso, False caso contrário.
         """
-        self.cursor.execute("DELETE FROM jogadas_1 WHERE id = %s", (jogada_id,))
-        self.conn.commit()
+        with self.obter_cursor() as cursor:
+            cursor.execute("DELETE FROM jogadas_1 WHERE id = %s", (jogada_id,))
         
-        if self.cursor.rowcount > 0:
-            return True
-        else:
-            return False
+            if cursor.rowcount > 0:
+                return True
+            else:
+                return False
 
     def listar_gols(self):
         """
@@ -776,42 +1515,46 @@ class DBManager:
             list of tuple: Uma lista de tuplas, onde cada tupla contém:
                            (id_gol, jogo_id, equipe_mandante_nome, equipe_visitante_nome, competicao, fase, 
                            rodada, data, equipe_analisada, tipo_gol, caracteristica, tempo, nome_autor_gol, 
-                           nome_assistente, nomes_jogadores_em_quadra, x_loc, y_loc)
-        """
-        self.cursor.execute("""
-            SELECT
-                g.id,
-                jogos_1.id as jogo_id, 
-                jogos_1.equipe_mandante_nome,
-                jogos_1.equipe_visitante_nome,
-                jogos_1.competicao ,
-                jogos_1.fase,
-                jogos_1.rodada,
-                jogos_1.data,
-                e.nome as equipe_analisada,
-                g.tipo_gol,
-                g.caracteristica,
-                g.tempo,
-                j.nome AS gol_nome,
-                a.nome as assistente_nome,
-                agg.jogadores_em_quadra_nomes,
-                g.x_loc,
-                g.y_loc
-            FROM gols_1 g
-            LEFT JOIN jogos_1 ON jogos_1.id = g.jogo_id
-            LEFT JOIN equipes_1 e ON e.id = g.equipe_analisada_id
-            LEFT JOIN jogadores_1 j ON j.id = g.autor_gol_id
-            LEFT JOIN jogadores_1 a ON a.id = g.assistente_id
-            LEFT JOIN (
-                SELECT 
-                    g2.id AS gol_id,
-                    array_agg(j2.nome) AS jogadores_em_quadra_nomes
-                FROM gols_1 g2
-                LEFT JOIN jogadores_1 j2 ON j2.id = ANY(g2.jogadores_em_quadra)
-                GROUP BY g2.id
-            ) agg ON agg.gol_id = g.id""")
+                           nome_assistente, nomes_jogadores_em_quadra, x_loc, y_loc,
+                           quadrante_linha, quadrante_coluna)
+        """
+        with self.obter_cursor() as cursor:
+            cursor.execute("""
+                SELECT
+                    g.id,
+                    jogos_1.id as jogo_id, 
+                    jogos_1.equipe_mandante_nome,
+                    jogos_1.equipe_visitante_nome,
+                    jogos_1.competicao ,
+                    jogos_1.fase,
+                    jogos_1.rodada,
+                    jogos_1.data,
+                    e.nome as equipe_analisada,
+                    g.tipo_gol,
+                    g.caracteristica,
+                    g.tempo,
+                    j.nome AS gol_nome,
+                    a.nome as assistente_nome,
+                    agg.jogadores_em_quadra_nomes,
+                    g.x_loc,
+                    g.y_loc,
+                    g.quadrante_linha,
+                    g.quadrante_coluna
+                FROM gols_1 g
+                LEFT JOIN jogos_1 ON jogos_1.id = g.jogo_id
+                LEFT JOIN equipes_1 e ON e.id = g.equipe_analisada_id
+                LEFT JOIN jogadores_1 j ON j.id = g.autor_gol_id
+                LEFT JOIN jogadores_1 a ON a.id = g.assistente_id
+                LEFT JOIN (
+                    SELECT 
+                        g2.id AS gol_id,
+                        array_agg(j2.nome) AS jogadores_em_quadra_nomes
+                    FROM gols_1 g2
+                    LEFT JOIN jogadores_1 j2 ON j2.id = ANY(g2.jogadores_em_quadra)
+                    GROUP BY g2.id
+                ) agg ON agg.gol_id = g.id""")
         
-        return self.cursor.fetchall()
+            return cursor.fetchall()
     
     def listar_gols_por_equipe(self, equipe_id):
         """
@@ -826,41 +1569,43 @@ class DBManager:
                            equipe_analisada, tipo_gol, caracteristica, tempo, nome_autor_gol, 
                            nome_assistente, nomes_jogadores_em_quadra, x_loc, y_loc)
         """
-        self.cursor.execute("""
-            SELECT 
-                jogos_1.equipe_mandante_nome,
-                jogos_1.equipe_visitante_nome,
-                jogos_1.competicao ,
-                jogos_1.fase,
-                jogos_1.rodada,
-                e.nome as equipe_analisada,
-                g.tipo_gol,
-                g.caracteristica,
-                g.tempo,
-                j.nome AS gol_nome,
-                a.nome as assistente_nome,
-                agg.jogadores_em_quadra_nomes,
-                g.x_loc,
-                g.y_loc
-            FROM gols_1 g
-            LEFT JOIN jogos_1 ON jogos_1.id = g.jogo_id
-            LEFT JOIN equipes_1 e ON e.id = g.equipe_analisada_id
-            LEFT JOIN jogadores_1 j ON j.id = g.autor_gol_id
-            LEFT JOIN jogadores_1 a ON a.id = g.assistente_id
-            LEFT JOIN (
+        with self.obter_cursor() as cursor:
+            cursor.execute("""
                 SELECT 
-                    g2.id AS gol_id,
-                    array_agg(j2.nome) AS jogadores_em_quadra_nomes
-                FROM gols_1 g2
-                LEFT JOIN jogadores_1 j2 ON j2.id = ANY(g2.jogadores_em_quadra)
-                GROUP BY g2.id
-            ) agg ON agg.gol_id = g.id
-            WHERE
-                g.equipe_analisada_id = %s""" ,
-                (equipe_id,))
+                    jogos_1.equipe_mandante_nome,
+                    jogos_1.equipe_visitante_nome,
+                    jogos_1.competicao ,
+                    jogos_1.fase,
+                    jogos_1.rodada,
+                    e.nome as equipe_analisada,
+                    g.tipo_gol,
+                    g.caracteristica,
+                    g.tempo,
+                    j.nome AS gol_nome,
+                    a.nome as assistente_nome,
+                    agg.jogadores_em_quadra_nomes,
+                    g.x_loc,
+                    g.y_loc
+                FROM gols_1 g
+                LEFT JOIN jogos_1 ON jogos_1.id = g.jogo_id
+                LEFT JOIN equipes_1 e ON e.id = g.equipe_analisada_id
+                LEFT JOIN jogadores_1 j ON j.id = g.autor_gol_id
+                LEFT JOIN jogadores_1 a ON a.id = g.assistente_id
+                LEFT JOIN (
+                    SELECT 
+                        g2.id AS gol_id,
+                        array_agg(j2.nome) AS jogadores_em_quadra_nomes
+                    FROM gols_1 g2
+                    LEFT JOIN jogadores_1 j2 ON j2.id = ANY(g2.jogadores_em_quadra)
+                    GROUP BY g2.id
+                ) agg ON agg.gol_id = g.id
+                WHERE
+                    g.equipe_analisada_id = %s""" ,
+                    (equipe_id,))
         
-        return self.cursor.fetchall()
+            return cursor.fetchall()
     
+    @invalida_cache("gols_1")
     def adicionar_gol(self, jogo_id, equipe_analisada_id, tipo_gol, tempo, caracteristica, x_loc, y_loc, jogadores_em_quadra=None, autor_gol_id=None, assistente_id=None):
         """
         Adiciona um novo gol ao banco de dados.
@@ -884,38 +1629,39 @@ class DBManager:
         if jogadores_em_quadra is None:
             jogadores_em_quadra = []
         
-        self.cursor.execute(
-            """
-            INSERT INTO gols_1 (
-                jogo_id, 
-                equipe_analisada_id, 
-                tipo_gol, 
-                tempo, 
-                caracteristica, 
-                x_loc, 
-                y_loc, 
-                autor_gol_id, 
-                assistente_id, 
-                jogadores_em_quadra
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """,
-            (
-                jogo_id,
-                equipe_analisada_id,
-                tipo_gol,
-                tempo,
-                caracteristica,
-                x_loc,
-                y_loc,
-                autor_gol_id,
-                assistente_id,
-                jogadores_em_quadra
+        with self.obter_cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO gols_1 (
+                    jogo_id, 
+                    equipe_analisada_id, 
+                    tipo_gol, 
+                    tempo, 
+                    caracteristica, 
+                    x_loc, 
+                    y_loc, 
+                    autor_gol_id, 
+                    assistente_id, 
+                    jogadores_em_quadra
+                )
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    jogo_id,
+                    equipe_analisada_id,
+                    tipo_gol,
+                    tempo,
+                    caracteristica,
+                    x_loc,
+                    y_loc,
+                    autor_gol_id,
+                    assistente_id,
+                    jogadores_em_quadra
+                )
             )
-        )
-        self.conn.commit()
-        return self.cursor.lastrowid
+            return cursor.lastrowid
     
+    @invalida_cache("gols_1")
     def deletar_gol(self, gol_id):
         """
         Deleta um gol do banco de dados.
@@ -926,32 +1672,34 @@ class DBManager:
         Returns:
             bool: True se o gol foi deletado com sucesso, False caso contrário.
         """
-        self.cursor.execute("DELETE FROM gols_1 WHERE id = %s", (gol_id,))
-        self.conn.commit()
+        with self.obter_cursor() as cursor:
+            cursor.execute("DELETE FROM gols_1 WHERE id = %s", (gol_id,))
         
-        if self.cursor.rowcount > 0:
-            return True
-        else:
-            return False
+            if cursor.rowcount > 0:
+                return True
+            else:
+                return False
     
     def fechar_conexao(self):
         """
-        Fecha o cursor e a conexão com o banco de dados.
+        Fecha todas as conexões do pool.
         """
-        if self.cursor:
-            self.cursor.close()
-        if self.conn:
-            self.conn.close()
+        if not self.pool.closed:
+            self.pool.closeall()
 
 
 @st.cache_resource
 def get_db_manager():
     """
     Retorna uma instância de `DBManager` usando o cache do Streamlit.
-    Isso garante que apenas uma única conexão com o banco de dados seja 
-    criada e reutilizada em toda a execução do aplicativo.
+    Isso garante que um único pool de conexões seja criado e compartilhado
+    por todas as sessões do aplicativo. O tamanho do pool pode ser ajustado
+    pelos segredos opcionais `DB_POOL_MIN` e `DB_POOL_MAX`.
 
     Returns:
         DBManager: Uma instância de DBManager.
     """
-    return DBManager()
+    return DBManager(
+        minconn=int(st.secrets.get("DB_POOL_MIN", 1)),
+        maxconn=int(st.secrets.get("DB_POOL_MAX", 10))
+    )
@@ -6,7 +6,6 @@ import atexit
 from psycopg2.errors import UniqueViolation
 
 db_manager = get_db_manager()
-db_manager.rollback()
 
 
 @st.dialog("Adicionar Jogador")
@@ -30,7 +29,6 @@ def adicionar_jogador_dialog(equipe_id, equipe_nome):
             
             except Exception as e:
                 st.error(f"Aconteceu o segunite erro ao cadastrar o jogador: {e}")
-                db_manager.rollback()
                 
 @st.dialog("Editar Jogador")
 def editar_jogador_dialog(equipe_id):
@@ -53,7 +51,6 @@ def editar_jogador_dialog(equipe_id):
                 resultado = db_manager.editar_jogador(equipe_id,jogador_id,nome,numero_camisa,posicao,image_id)   
                 if isinstance(resultado, str):  # Se for uma string, é uma mensagem de erro
                     st.error(resultado)
-                    db_manager.rollback()# Exibe a mensagem de erro no Streamlit
                 else:
                     st.success(f"Jogador editado com sucesso!")
                     time.sleep(1)  # Pausa de 2 segundos para mostrar a mensagem antes de atualizar a página
@@ -83,7 +80,6 @@ def excluir_jogador_dialog(equipe_id):
                 st.rerun()    
             else:
                 st.error('Erro na hora de excluir jogador. Tente novamente')
-                db_manager.rollback()         
                 time.sleep(1)  # Pausa de 2 segundos para mostrar a mensagem antes de atualizar a página
                 st.rerun()     
 
@@ -140,7 +136,6 @@ def adicionar_equipe_dialog():
                 st.rerun()
             else:
                 st.error(f"O equipe '{equipe}' na categoria '{categoria}' já está cadastrado.")
-                db_manager.rollback()
 @st.dialog("Excluir equipe")
 def excluir_equipe_dialog():
     
@@ -158,7 +153,6 @@ def excluir_equipe_dialog():
                 st.rerun()    
             else:
                 st.error('Erro na hora de excluir time. Tente novamente')
-                db_manager.rollback()         
                 time.sleep(1)  # Pausa de 2 segundos para mostrar a mensagem antes de atualizar a página
                 st.rerun()     
                     
@@ -190,7 +184,6 @@ def editar_equipe_dialog():
                     st.rerun()    
                 except Exception as e:
                     st.error(f"Erro ao atualizar equipe: {e}")
-                    db_manager.rollback()         
                     
 
 
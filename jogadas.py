@@ -6,7 +6,7 @@ from db_manager import DBManager,get_db_manager
 import atexit
 from utils import exibir_seta
 
-from utils import listar_opcoes_jogadores
+from utils import listar_opcoes_jogadores, JOGADAS, TEMPOS_JOGO
 db_manager = get_db_manager()
 
 # Lista de jogos
@@ -43,7 +43,7 @@ else:
                 # Seleção do tempo
                     tempo = st.pills(
                         "Tempo", 
-                        ['1ºT', '2ºT', '1ºP', '2ºP'], 
+                        TEMPOS_JOGO, 
                         key="selected_tempo",
                         default=st.session_state["selected_tempo"]  # Usar o valor atual do session_state como default
                     )
@@ -71,7 +71,7 @@ else:
                                 # Campos do formulário com valor padrão vazio
                                 jogadas = st.pills(
                                     "Jogada", 
-                                    ['FIN.C', 'FIN.E', 'FIN.T', 'GOL', 'ASSIST.', 'DES.C/P.','C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra',"FIN.S.C", "FIN.S.E", "FIN.S.T"],
+                                    JOGADAS,
                                     selection_mode="multi"
                                 )
                                 jogador = st.pills("Selecione o jogador", options=opcoes_jogadores_list)
@@ -101,22 +101,14 @@ else:
                                             if 'GOL' in jogadas_modificadas and 'FIN.C' not in jogadas_modificadas:
                                                 jogadas_modificadas.append('FIN.C')
                                             
-                                            for jogada in jogadas_modificadas:
-                                            
-                                                # Insere cada jogada no banco de dados
-                                                db_manager.adicionar_jogada(
-                                                    jogador_id=jogador_id,
-                                                    jogador_nome=jogador,
-                                                    jogo_id=jogo_id,
-                                                    jogada=jogada,
-                                                    tempo=tempo,
-                                                    x_loc=x,
-                                                    y_loc=y
-                                                )
+                                            # Insere todas as jogadas de uma vez, em uma única transação
+                                            db_manager.adicionar_jogadas_lote([
+                                                (jogador_id, jogador, jogo_id, jogada, tempo, x, y)
+                                                for jogada in jogadas_modificadas
+                                            ])
                                             st.success(f"Jogada adicionada com sucesso para {jogador}!")    
                                         except Exception as e:
                                             st.error(f"Erro ao adicionar jogadas: {e}")
-                                            db_manager.rollback()
 
                 
                 with right_div:
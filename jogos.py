@@ -2,7 +2,7 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 from db_manager import DBManager,get_db_manager
-from utils import convert_df_to_csv, calcular_quadrante,listar_competicoes_unicas
+from utils import convert_df_to_csv, formatar_quadrante,listar_competicoes_unicas
 import atexit
 
 
@@ -76,7 +76,6 @@ def adicionar_jogos_dialog(lista_equipes):
                         st.rerun()
                     except Exception as e:
                         st.error(f"Erro ao adicionar jogo: {e}")
-                        db_manager.rollback()
 @st.dialog("Deletar Jogos",width = 'large')
 def deletar_jogos_dialog(lista_jogos):
     opcoes_jogos = {f"{jogo[2]} x {jogo[4]} - {jogo[6]} - {jogo[7]} - {jogo[8]}" : jogo[0] for jogo in lista_jogos}
@@ -92,7 +91,6 @@ def deletar_jogos_dialog(lista_jogos):
                 st.rerun()
             except Exception as e:
                 st.error(f"Erro ao deletar jogo: {e}")
-                db_manager.rollback()
                    
                                 
 
@@ -105,10 +103,10 @@ def baixar_jogadas_dialog(lista_jogos):
         if jogo_selecionado:
             jogo_id = opcoes_jogos[jogo_selecionado]
             lista_jogadas = db_manager.listar_jogadas_por_partida(jogo_id)
-            lista_jogadas_df = pd.DataFrame(lista_jogadas, columns=["equipe_mandante_nome","equipe_visitante_nome","fase","rodada","competicao","jogador_nome","jogada","tempo","x_loc","y_loc"])
+            lista_jogadas_df = pd.DataFrame(lista_jogadas, columns=["equipe_mandante_nome","equipe_visitante_nome","fase","rodada","competicao","jogador_nome","jogada","tempo","x_loc","y_loc","quadrante_linha","quadrante_coluna"])
             if not lista_jogadas_df.empty:
-                lista_jogadas_df['quadrante'] = lista_jogadas_df.apply(lambda row: calcular_quadrante(row['x_loc'], row['y_loc']), axis=1)
-                lista_jogadas_df.drop(["x_loc","y_loc"],axis=1, inplace=True)
+                lista_jogadas_df['quadrante'] = formatar_quadrante(lista_jogadas_df['quadrante_linha'], lista_jogadas_df['quadrante_coluna'])
+                lista_jogadas_df.drop(["x_loc","y_loc","quadrante_linha","quadrante_coluna"],axis=1, inplace=True)
                 csv_data = convert_df_to_csv(lista_jogadas_df)
 
                 # Botão para download do CSV
@@ -0,0 +1,79 @@
+"""
+Testes do cache de consultas do DBManager (`consulta_em_cache` / `invalidar_cache`),
+com uma consulta de teste no lugar do banco.
+"""
+from types import SimpleNamespace
+
+import psycopg2
+import pytest
+
+import db_manager
+from db_manager import DBManager, consulta_em_cache
+
+
+class Relogio:
+    """Substitui `time.monotonic` no db_manager, para envelhecer o cache sem esperar."""
+
+    def __init__(self):
+        self.agora = 1000.0
+
+    def __call__(self):
+        return self.agora
+
+
+class ConsultasDeTeste(DBManager):
+    def __init__(self):
+        super().__init__(minconn=1, maxconn=1)
+        self.consultas = 0
+        self.durante_consulta = None
+
+    @consulta_em_cache("tabela_nunca_lida")
+    def listar_teste(self, valor):
+        self.consultas += 1
+        if self.durante_consulta is not None:
+            self.durante_consulta()
+        return [valor]
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    relogio = Relogio()
+    monkeypatch.setattr(db_manager.time, "monotonic", relogio)
+    return relogio
+
+
+@pytest.fixture
+def db(monkeypatch, relogio):
+    monkeypatch.setattr(psycopg2, "connect", lambda *args, **kwargs: SimpleNamespace(closed=0, close=lambda: None))
+    monkeypatch.setattr(db_manager.st, "secrets", SimpleNamespace(
+        DB_HOST="localhost", DB_PORT=5432, DB_NAME="futsal", DB_USER="futsal", DB_PASSWORD=""
+    ))
+    return ConsultasDeTeste()
+
+
+def test_consulta_repetida_vem_do_cache(db):
+    assert db.listar_teste(1) == [1]
+    assert db.listar_teste(1) == [1]
+
+    assert db.consultas == 1
+
+
+def test_invalidacao_total_durante_consulta_descarta_o_resultado(db):
+    # Nenhuma consulta à tabela terminou antes, então ela não tem geração própria
+    db.durante_consulta = db.invalidar_cache
+    db.listar_teste(1)
+    db.durante_consulta = None
+
+    db.listar_teste(1)
+
+    assert db.consultas == 2
+
+
+def test_falha_descarta_entradas_expiradas(db, relogio):
+    db.listar_teste(1)
+    db.listar_teste(2)
+    relogio.agora += DBManager.VALIDADE_CACHE
+
+    db.listar_teste(3)
+
+    assert db.estatisticas_cache()["entradas"] == 1
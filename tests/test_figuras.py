@@ -0,0 +1,81 @@
+"""
+Testes das figuras montadas como dicionários (`figura_de_especificacao`): cada tipo de figura
+é validado uma vez pelo Plotly e deve serializar igual à versão não validada.
+"""
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+import pytest
+
+import utils
+
+
+@pytest.fixture(scope="module")
+def dados():
+    gerador = np.random.default_rng(0)
+    quantidade = 4000
+    x = gerador.uniform(0, utils.LARGURA_QUADRA, quantidade)
+    y = gerador.uniform(0, utils.COMPRIMENTO_QUADRA, quantidade)
+    jogadas_df = pd.DataFrame({
+        "jogo_id": gerador.integers(1, 6, quantidade),
+        "jogada": gerador.choice(utils.JOGADAS, quantidade),
+        "tempo": gerador.choice(utils.TEMPOS_JOGO, quantidade, p=[0.45, 0.45, 0.05, 0.05]),
+        "x_loc": x,
+        "y_loc": y,
+        "zona": utils.calcular_zonas(x, y),
+    })
+    partida_df = jogadas_df[jogadas_df["jogo_id"] == 1]
+
+    pt, st_, total, _, _ = utils.extrair_estatisticas_gerais(partida_df)
+    _, _, total_geral, _, _ = utils.extrair_estatisticas_gerais(jogadas_df)
+    media_pt, media_st, _, _, _ = utils.get_mean(jogadas_df)
+    tensor = utils.extrair_tensor_localizacao(jogadas_df)
+    titulos, matrizes = utils.quadras_por_periodo(tensor, utils.jogadas_da_posicao()["Ataque"])
+    return {
+        "pt": pt, "st": st_, "total": total, "total_geral": total_geral,
+        "media_pt": media_pt, "media_st": media_st, "titulos": titulos, "matrizes": matrizes,
+    }
+
+
+# Cada tipo de figura e os argumentos a partir das estatísticas de exemplo
+FIGURAS = {
+    "plotar_estatisticas_gerais_time": lambda d: utils.plotar_estatisticas_gerais_time(d["total"], 5),
+    "plotar_estatisticas_gerais": lambda d: utils.plotar_estatisticas_gerais(d["total"], 5),
+    "plotar_estatisticas_gerais_1": lambda d: utils.plotar_estatisticas_gerais_1(d["total"]),
+    "plotar_grafico_barras": lambda d: utils.plotar_grafico_barras(d["pt"], d["st"], d["media_pt"], d["media_st"]),
+    "plotar_grafico_barras_jogador": lambda d: utils.plotar_grafico_barras_jogador(d["pt"], d["st"], d["media_pt"], d["media_st"], "Goleiro"),
+    "plotar_grafico_barras_parcial": lambda d: utils.plotar_grafico_barras_parcial(d["pt"], d["media_pt"]),
+    "plotar_grafico_barras_parcial_jogador": lambda d: utils.plotar_grafico_barras_parcial_jogador(d["pt"], d["media_pt"], "Ala"),
+    "plotar_radar_chart": lambda d: utils.plotar_radar_chart(d["total"], d["total_geral"], "Goleiro"),
+    "create_futsal_court": lambda d: utils.create_futsal_court(d["titulos"][0], d["matrizes"][0]),
+    "create_futsal_court_grid": lambda d: utils.create_futsal_court_grid(d["titulos"], d["matrizes"], 3),
+}
+
+
+@pytest.mark.parametrize("nome", FIGURAS)
+def test_especificacao_passa_na_validacao_do_plotly(dados, nome):
+    figura = FIGURAS[nome](dados)
+
+    # Levanta ValueError se alguma propriedade não existir ou tiver valor inválido
+    validada = go.Figure(figura.to_dict())
+
+    assert json.loads(pio.to_json(validada, validate=False)) == json.loads(pio.to_json(figura, validate=False))
+
+
+@pytest.mark.parametrize("nome", FIGURAS)
+def test_figura_nao_e_validada_por_padrao(dados, nome, monkeypatch):
+    chamadas = []
+    original = go.Figure.__init__
+
+    def espiao(self, *args, **kwargs):
+        chamadas.append(kwargs.get("_validate", True))
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(utils, "VALIDAR_FIGURAS", False)
+    monkeypatch.setattr(go.Figure, "__init__", espiao)
+    FIGURAS[nome](dados)
+
+    assert chamadas and not any(chamadas)
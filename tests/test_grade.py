@@ -0,0 +1,60 @@
+"""
+Testes das grades dos mapas de calor: a grade padrão (zonas calculadas como no banco)
+e as demais (histograma das coordenadas) devem contar as mesmas jogadas.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+import utils
+from utils import GRADES_QUADRA, JOGADAS, TEMPOS_JOGO, LARGURA_QUADRA, COMPRIMENTO_QUADRA
+
+
+def dataframe_jogadas(x, y, semente=0):
+    gerador = np.random.default_rng(semente)
+    return pd.DataFrame({
+        "jogada": gerador.choice(JOGADAS, len(x)),
+        "tempo": gerador.choice(TEMPOS_JOGO, len(x)),
+        "x_loc": np.asarray(x, dtype=float),
+        "y_loc": np.asarray(y, dtype=float),
+        "zona": utils.calcular_zonas(x, y),
+    })
+
+
+def totais_por_grade(dados_df):
+    return {nome: int(utils.extrair_tensor_localizacao(dados_df, grade).sum()) for nome, grade in GRADES_QUADRA.items()}
+
+
+def test_jogada_sobre_as_bordas_finais_fica_fora_em_todas_as_grades():
+    dados_df = dataframe_jogadas([LARGURA_QUADRA, 100.0], [COMPRIMENTO_QUADRA, 200.0])
+
+    assert set(totais_por_grade(dados_df).values()) == {1}
+
+
+@pytest.mark.parametrize("x, y", [
+    (0.0, 0.0),
+    (LARGURA_QUADRA, 10.0),
+    (10.0, COMPRIMENTO_QUADRA),
+    (-1.0, 10.0),
+    (10.0, COMPRIMENTO_QUADRA + 5),
+])
+def test_bordas_contam_igual_em_todas_as_grades(x, y):
+    dados_df = dataframe_jogadas([x], [y])
+    esperado = int(utils.calcular_zonas([x], [y])[0] >= 0)
+
+    assert set(totais_por_grade(dados_df).values()) == {esperado}
+
+
+def test_totais_iguais_entre_grades_com_coordenadas_aleatorias():
+    gerador = np.random.default_rng(1)
+    # Inclui posições fora da quadra e sobre as linhas
+    x = np.concatenate([gerador.uniform(-20, LARGURA_QUADRA + 20, 5000), np.full(50, float(LARGURA_QUADRA)), np.zeros(50)])
+    y = np.concatenate([gerador.uniform(-20, COMPRIMENTO_QUADRA + 20, 5000), gerador.uniform(0, COMPRIMENTO_QUADRA, 50), np.full(50, float(COMPRIMENTO_QUADRA))])
+    dados_df = dataframe_jogadas(x, y)
+
+    totais = totais_por_grade(dados_df)
+    assert len(set(totais.values())) == 1
+    assert totais["6x3"] == int((dados_df["zona"] >= 0).sum())
+
+    for nome, grade in GRADES_QUADRA.items():
+        assert int(utils.contar_grade(x, y, grade).sum()) == totais[nome]
@@ -0,0 +1,56 @@
+"""
+Testes da pré-carga de imagens: downloads que terminam antes do registro do callback
+(como os lidos do cache em disco) não podem travar a lista de downloads em andamento.
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+
+import utils
+
+
+class ExecutorImediato:
+    """Executa cada tarefa no próprio `submit`, devolvendo um Future já concluído."""
+
+    def submit(self, funcao, *args):
+        futuro = Future()
+        futuro.set_result(funcao(*args))
+        return futuro
+
+
+def recursos(executor):
+    return {"sessao": None, "executor": executor, "trava": threading.Lock(), "em_andamento": {}}
+
+
+def pre_carregar_com_limite(urls, segundos=5):
+    thread = threading.Thread(target=utils.pre_carregar_imagens, args=(urls,), daemon=True)
+    thread.start()
+    thread.join(segundos)
+    assert not thread.is_alive(), "pre_carregar_imagens travou"
+
+
+@pytest.mark.parametrize("executor", [ExecutorImediato, lambda: ThreadPoolExecutor(max_workers=4)])
+def test_download_instantaneo_nao_trava_a_pre_carga(monkeypatch, executor):
+    compartilhados = recursos(executor())
+    monkeypatch.setattr(utils, "recursos_imagens", lambda: compartilhados)
+    monkeypatch.setattr(utils, "baixar_imagem", lambda url, sessao: url.encode())
+
+    urls = [f"https://exemplo/{i}" for i in range(300)]
+    for inicio in range(0, len(urls), 10):
+        pre_carregar_com_limite(urls[inicio:inicio + 10])
+
+    assert utils.buscar_imagem(urls[0]) == urls[0].encode()
+    if isinstance(compartilhados["executor"], ThreadPoolExecutor):
+        compartilhados["executor"].shutdown(wait=True)
+    assert compartilhados["em_andamento"] == {}
+
+
+def test_callback_antigo_nao_remove_download_novo_da_mesma_url():
+    compartilhados = recursos(None)
+    antigo, novo = Future(), Future()
+    compartilhados["em_andamento"]["u"] = novo
+
+    utils.descartar_download(compartilhados, "u", antigo)
+
+    assert compartilhados["em_andamento"] == {"u": novo}
@@ -0,0 +1,152 @@
+"""
+Testes do pool de conexões do DBManager contra conexões falsas: cada comando
+leva um tempo fixo, então a vazão só cresce se as consultas de threads
+diferentes realmente rodam em paralelo.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import psycopg2
+import pytest
+from psycopg2 import extensions
+
+import db_manager
+from db_manager import DBManager
+
+
+ATRASO_CONSULTA = 0.05
+
+
+class CursorFalso:
+    def __init__(self, conexao):
+        self.conexao = conexao
+        self.resultado = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, comando, parametros=None):
+        with self.conexao.fabrica.trava:
+            self.conexao.fabrica.em_uso += 1
+            self.conexao.fabrica.pico = max(self.conexao.fabrica.pico, self.conexao.fabrica.em_uso)
+        time.sleep(ATRASO_CONSULTA)
+        with self.conexao.fabrica.trava:
+            self.conexao.fabrica.em_uso -= 1
+        # Cada conexão devolve o próprio id, para detectar resultados trocados entre threads
+        self.resultado = [(self.conexao.id, threading.get_ident())]
+
+    def fetchall(self):
+        return self.resultado
+
+    def fetchone(self):
+        return self.resultado[0] if self.resultado else None
+
+
+class ConexaoFalsa:
+    def __init__(self, fabrica, id):
+        self.fabrica = fabrica
+        self.id = id
+        self.closed = 0
+        self.info = SimpleNamespace(transaction_status=extensions.TRANSACTION_STATUS_IDLE)
+
+    def cursor(self):
+        return CursorFalso(self)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = 1
+
+
+class FabricaConexoes:
+    """Substitui `psycopg2.connect`, usado pelo ThreadedConnectionPool para abrir conexões."""
+
+    def __init__(self):
+        self.trava = threading.Lock()
+        self.abertas = []
+        self.em_uso = 0
+        self.pico = 0
+
+    def __call__(self, *args, **kwargs):
+        with self.trava:
+            conexao = ConexaoFalsa(self, len(self.abertas))
+            self.abertas.append(conexao)
+        return conexao
+
+
+@pytest.fixture
+def fabrica(monkeypatch):
+    fabrica = FabricaConexoes()
+    monkeypatch.setattr(psycopg2, "connect", fabrica)
+    monkeypatch.setattr(db_manager.st, "secrets", SimpleNamespace(
+        DB_HOST="localhost", DB_PORT=5432, DB_NAME="futsal", DB_USER="futsal", DB_PASSWORD=""
+    ))
+    return fabrica
+
+
+def consultar_em_paralelo(db, chamadas, threads=16):
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        inicio = time.perf_counter()
+        resultados = list(executor.map(lambda _: db.listar_equipes(), range(chamadas)))
+        return time.perf_counter() - inicio, resultados
+
+
+def test_vazao_cresce_com_o_tamanho_do_pool(fabrica):
+    tempos = {}
+    for tamanho in (1, 2, 4, 8):
+        db = DBManager(minconn=1, maxconn=tamanho, usar_cache=False)
+        tempos[tamanho], _ = consultar_em_paralelo(db, chamadas=16)
+        db.fechar_conexao()
+
+    # 16 consultas de 50 ms: ~0,8 s com uma conexão e ~0,1 s com oito
+    assert tempos[1] >= 16 * ATRASO_CONSULTA
+    assert tempos[2] < tempos[1] * 0.75
+    assert tempos[4] < tempos[2] * 0.75
+    assert tempos[8] < tempos[1] / 3
+
+
+def test_pool_esgotado_espera_em_vez_de_falhar(fabrica):
+    db = DBManager(minconn=1, maxconn=3, usar_cache=False)
+    _, resultados = consultar_em_paralelo(db, chamadas=24, threads=12)
+    db.fechar_conexao()
+
+    assert len(resultados) == 24
+    assert fabrica.pico <= 3
+
+
+def test_cada_thread_recebe_o_resultado_da_propria_consulta(fabrica):
+    db = DBManager(minconn=1, maxconn=4, usar_cache=False)
+
+    def consultar(_):
+        return threading.get_ident(), db.listar_equipes()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        resultados = list(executor.map(consultar, range(32)))
+    db.fechar_conexao()
+
+    # As linhas foram produzidas pelo cursor usado na mesma thread que as leu
+    for thread, linhas in resultados:
+        assert linhas == [(linhas[0][0], thread)]
+
+
+def test_conexao_quebrada_e_substituida_no_checkout(fabrica):
+    db = DBManager(minconn=1, maxconn=2, usar_cache=False)
+    with db.obter_cursor():
+        pass
+    fabrica.abertas[0].closed = 2
+
+    with db.obter_cursor() as cursor:
+        cursor.execute("SELECT 1")
+        id_conexao, _ = cursor.fetchone()
+    db.fechar_conexao()
+
+    assert id_conexao != 0
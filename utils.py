@@ -9,8 +9,18 @@ import io
 import requests
 import plotly.io as pio
 from PIL import Image
-from datetime import datetime
 from io import BytesIO
+import threading
+import os
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from matplotlib.figure import Figure
+from matplotlib.colors import LinearSegmentedColormap
 
 
 def convert_df_to_csv(df):
@@ -61,6 +71,64 @@ def listar_opcoes_jogadores(lista_jogadores):
     return opcoes_jogadores_dict, opcoes_jogadores_list
 
 
+# Divisão padrão da quadra virtual (280 x 470) usada nos mapas de calor: 6 linhas e 3 colunas,
+# numeradas a partir de 1, a mesma das colunas geradas no banco. Internamente cada quadrante
+# é uma zona inteira de 0 a 17, zona = (linha - 1) * NUMERO_COLUNAS + (coluna - 1).
+LARGURA_QUADRA = 280
+COMPRIMENTO_QUADRA = 470
+NUMERO_LINHAS = 6
+NUMERO_COLUNAS = 3
+NUMERO_ZONAS = NUMERO_LINHAS * NUMERO_COLUNAS
+GRADE_PADRAO = (NUMERO_LINHAS, NUMERO_COLUNAS)
+
+# Grades (linhas, colunas) oferecidas nos mapas de calor.
+GRADES_QUADRA = {"6x3": GRADE_PADRAO, "12x6": (12, 6), "Terços": (3, 1)}
+
+# Formas de exibir os mapas de calor: um gráfico Plotly por quadra, uma figura única por aba
+# ou imagens PNG estáticas servidas de um cache em disco.
+MODOS_QUADRAS = ["Interativo", "Figura única", "Imagem"]
+
+SEGUNDOS_POR_DIA = 24 * 60 * 60
+
+# Registro dos tipos de jogada e dos tempos de jogo. O código inteiro de cada um é a sua
+# posição na lista, e é por ele que as contagens indexam os arrays NumPy; um novo tipo de
+# jogada entra no fim de JOGADAS e nos agrupamentos abaixo em que deve aparecer.
+JOGADAS = ['FIN.C', 'FIN.E', 'FIN.T', 'GOL', 'ASSIST.', 'DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra', "FIN.S.C", "FIN.S.E", "FIN.S.T"]
+CODIGOS_JOGADAS = {jogada: codigo for codigo, jogada in enumerate(JOGADAS)}
+TEMPOS_JOGO = ['1ºT', '2ºT', '1ºP', '2ºP']
+CODIGOS_TEMPOS = {tempo: codigo for codigo, tempo in enumerate(TEMPOS_JOGO)}
+PERIODOS_ESTATISTICAS = TEMPOS_JOGO + ['Total']
+
+# Agrupamentos de jogadas usados nas estatísticas e nos gráficos.
+FINALIZACOES = ['FIN.C', 'FIN.E', 'FIN.T']
+FINALIZACOES_SOFRIDAS = ["FIN.S.C", "FIN.S.E", "FIN.S.T"]
+JOGADAS_POSSE = ['DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra']
+JOGADAS_ATAQUE = FINALIZACOES + ['DES.C/P.', 'C.A.-Pró']
+JOGADAS_DEFESA = ['DES.S/P.', 'PER.P.', 'C.A.-Contra'] + FINALIZACOES_SOFRIDAS
+
+# Categorias, na ordem das médias de `get_mean` usadas pelos gráficos de barras.
+CATEGORIAS_MEDIA = JOGADAS_ATAQUE + JOGADAS_DEFESA
+
+def jogadas_da_posicao(posicao=None):
+    """
+    Retorna os subconjuntos de jogadas exibidos para uma posição. Finalizações sofridas
+    só fazem parte da análise do goleiro (e da equipe, quando a posição não é informada).
+
+    Args:
+        posicao (str, optional): Posição do jogador (ex: 'Goleiro', 'Fixo'). Defaults to None.
+
+    Returns:
+        dict: Listas de jogadas para as chaves 'Ataque', 'Defesa' (mapas de localização),
+              'Barras' (gráfico de barras do jogador) e 'Radar' (gráfico de radar).
+    """
+    goleiro = posicao in (None, "Goleiro")
+    return {
+        "Ataque": JOGADAS_ATAQUE,
+        "Defesa": JOGADAS_DEFESA if goleiro else [jogada for jogada in JOGADAS_DEFESA if jogada not in FINALIZACOES_SOFRIDAS],
+        "Barras": JOGADAS_POSSE + FINALIZACOES_SOFRIDAS if goleiro else FINALIZACOES + JOGADAS_POSSE,
+        "Radar": (FINALIZACOES_SOFRIDAS if goleiro else FINALIZACOES) + ['DES.C/P.', 'DES.S/P.', 'PER.P.'],
+    }
+
 def calcular_quadrante(x, y):
     """
     Calcula o quadrante de uma coordenada (x, y) dentro de uma quadra de futsal virtual.
@@ -81,26 +149,423 @@ def calcular_quadrante(x, y):
     linha = (y // height_quadrante) + 1
     return f"{linha}-{coluna}"
 
-def extrair_dataframe_jogador(db_manager):
+def zonas_de_quadrantes(quadrante_linha, quadrante_coluna):
+    """
+    Converte arrays de linha e coluna de quadrante (a partir de 1) em zonas inteiras.
+
+    Args:
+        quadrante_linha (array-like): Linhas dos quadrantes (1 a 6).
+        quadrante_coluna (array-like): Colunas dos quadrantes (1 a 3).
+
+    Returns:
+        np.ndarray: Zonas de 0 a 17 (int8); -1 para posições fora da quadra.
+    """
+    linha = np.asarray(quadrante_linha, dtype=np.int64)
+    coluna = np.asarray(quadrante_coluna, dtype=np.int64)
+    valida = (linha >= 1) & (linha <= NUMERO_LINHAS) & (coluna >= 1) & (coluna <= NUMERO_COLUNAS)
+    return np.where(valida, (linha - 1) * NUMERO_COLUNAS + (coluna - 1), -1).astype(np.int8)
+
+def calcular_zonas(x, y):
+    """
+    Calcula de uma vez as zonas de arrays de coordenadas, com a mesma divisão de `calcular_quadrante`.
+
+    Args:
+        x (array-like): Coordenadas X das jogadas.
+        y (array-like): Coordenadas Y das jogadas.
+
+    Returns:
+        np.ndarray: Zonas de 0 a 17 (int8); -1 para posições fora da quadra.
+    """
+    coluna = np.floor_divide(np.asarray(x, dtype=float), LARGURA_QUADRA / NUMERO_COLUNAS) + 1
+    linha = np.floor_divide(np.asarray(y, dtype=float), COMPRIMENTO_QUADRA / NUMERO_LINHAS) + 1
+    return zonas_de_quadrantes(linha, coluna)
+
+def contar_zonas(zonas, pesos=None):
+    """
+    Conta as ocorrências de cada zona, ignorando as posições fora da quadra.
+
+    Args:
+        zonas (np.ndarray): Zonas das jogadas.
+        pesos (np.ndarray, optional): Quantidade de cada linha, para dados já agregados. Defaults to None.
+
+    Returns:
+        np.ndarray: Contagem por zona, com NUMERO_ZONAS posições.
+    """
+    validas = zonas >= 0
+    if pesos is None:
+        return np.bincount(zonas[validas], minlength=NUMERO_ZONAS)
+    return np.bincount(zonas[validas], weights=pesos[validas], minlength=NUMERO_ZONAS).astype(np.int64)
+
+@lru_cache(maxsize=None)
+def bordas_grade(linhas, colunas):
+    """
+    Calcula, uma vez por grade, as bordas das faixas da quadra.
+
+    Args:
+        linhas (int): Número de faixas ao longo do comprimento (eixo Y).
+        colunas (int): Número de faixas ao longo da largura (eixo X).
+
+    Returns:
+        tuple: (bordas_y, bordas_x), arrays somente leitura com linhas + 1 e colunas + 1 posições.
+    """
+    bordas_y = np.linspace(0, COMPRIMENTO_QUADRA, linhas + 1)
+    bordas_x = np.linspace(0, LARGURA_QUADRA, colunas + 1)
+    bordas_y.flags.writeable = False
+    bordas_x.flags.writeable = False
+    return bordas_y, bordas_x
+
+def dentro_da_quadra(x, y):
+    """
+    Indica as posições dentro da quadra, com a mesma regra das zonas de `calcular_zonas` e das
+    colunas de quadrante do banco: cada faixa inclui a borda inicial e exclui a final, então
+    posições sobre a linha de fundo ou a lateral (y = 470, x = 280) ficam de fora em qualquer grade.
+
+    Args:
+        x (array-like): Coordenadas X das jogadas.
+        y (array-like): Coordenadas Y das jogadas.
+
+    Returns:
+        np.ndarray: Máscara booleana das posições dentro da quadra.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    return (x >= 0) & (x < LARGURA_QUADRA) & (y >= 0) & (y < COMPRIMENTO_QUADRA)
+
+def contar_grade(x, y, grade=GRADE_PADRAO, pesos=None):
+    """
+    Conta as jogadas por célula de uma grade qualquer com `np.histogram2d`.
+    Posições fora da quadra (`dentro_da_quadra`) são ignoradas, para que o total
+    seja o mesmo em todas as grades.
+
+    Args:
+        x (array-like): Coordenadas X das jogadas.
+        y (array-like): Coordenadas Y das jogadas.
+        grade (tuple, optional): (linhas, colunas) da grade. Defaults to GRADE_PADRAO.
+        pesos (array-like, optional): Quantidade de cada linha, para dados já agregados. Defaults to None.
+
+    Returns:
+        np.ndarray: Matriz de contagens [linha, coluna] (int64).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    dentro = dentro_da_quadra(x, y)
+    if pesos is not None:
+        pesos = np.asarray(pesos)[dentro]
+    bordas_y, bordas_x = bordas_grade(*grade)
+    contagens, _, _ = np.histogram2d(y[dentro], x[dentro], bins=[bordas_y, bordas_x], weights=pesos)
+    return contagens.astype(np.int64)
+
+def selecionar_grade(key):
+    """
+    Exibe o seletor de grade dos mapas de calor.
+
+    Args:
+        key (str): Chave única do componente Streamlit.
+
+    Returns:
+        tuple: (linhas, colunas) da grade escolhida.
+    """
+    rotulo = st.segmented_control("Grade", list(GRADES_QUADRA), default="6x3", key=key)
+    return GRADES_QUADRA.get(rotulo, GRADE_PADRAO)
+
+def selecionar_modo_quadras(key):
+    """
+    Exibe o seletor da forma de exibição dos mapas de calor.
+
+    Args:
+        key (str): Chave única do componente Streamlit.
+
+    Returns:
+        str: Uma das opções de MODOS_QUADRAS.
+    """
+    modo = st.segmented_control("Exibição", MODOS_QUADRAS, default="Interativo", key=key)
+    return modo or "Interativo"
+
+def formatar_quadrante(quadrante_linha, quadrante_coluna):
+    """
+    Monta o rótulo "linha-coluna" do quadrante a partir das colunas geradas
+    `quadrante_linha` e `quadrante_coluna` do banco, no mesmo formato de `calcular_quadrante`.
+
+    Args:
+        quadrante_linha (pd.Series): Linha do quadrante (1 a 6).
+        quadrante_coluna (pd.Series): Coluna do quadrante (1 a 3).
+
+    Returns:
+        pd.Series: Rótulos dos quadrantes (ex: "3.0-2.0").
+    """
+    return quadrante_linha.astype(float).astype(str) + "-" + quadrante_coluna.astype(float).astype(str)
+
+# Esquema compacto do DataFrame de jogadas: textos repetidos em categorias, ids em int32
+# e coordenadas em float32. A zona já é int8.
+COLUNAS_CATEGORICAS_JOGADAS = ["equipe_mandante_nome", "equipe_visitante_nome", "fase", "rodada", "competicao", "equipe_jogada", "jogador_nome", "jogada", "tempo", "partida"]
+TIPOS_COLUNAS_JOGADAS = {
+    **{coluna: "category" for coluna in COLUNAS_CATEGORICAS_JOGADAS},
+    "jogo_id": np.int32, "equipe_jogada_id": np.int32, "jogada_id": np.int32,
+    "x_loc": np.float32, "y_loc": np.float32,
+}
+
+def compactar_dataframe_jogador(dados_jogador_df):
+    """
+    Converte o DataFrame de jogadas para o esquema compacto de `TIPOS_COLUNAS_JOGADAS`.
+    Também é usado depois de `pd.concat`, que devolve como texto as categorias que diferem entre as partes.
+
+    Args:
+        dados_jogador_df (pd.DataFrame): DataFrame no formato de `extrair_dataframe_jogador`.
+
+    Returns:
+        pd.DataFrame: O mesmo DataFrame com os tipos compactos.
+    """
+    return dados_jogador_df.astype(TIPOS_COLUNAS_JOGADAS)
+
+def rotular_partidas(dados_jogador_df):
+    """
+    Monta o rótulo de exibição de cada partida uma única vez por jogo_id,
+    no formato "Mandante x Visitante - Competição - Fase - Rodada".
+
+    Args:
+        dados_jogador_df (pd.DataFrame): DataFrame com as colunas 'jogo_id', 'equipe_mandante_nome',
+                                         'equipe_visitante_nome', 'competicao', 'fase' e 'rodada'.
+
+    Returns:
+        pd.Series: Rótulo de cada partida, indexado por jogo_id.
+    """
+    jogos = dados_jogador_df.drop_duplicates("jogo_id")
+    return pd.Series(
+        [f"{mandante} x {visitante} - {competicao} - {fase} - {rodada}" for mandante, visitante, competicao, fase, rodada in zip(
+            jogos["equipe_mandante_nome"], jogos["equipe_visitante_nome"], jogos["competicao"], jogos["fase"], jogos["rodada"]
+        )],
+        index=jogos["jogo_id"], dtype=object
+    )
+
+def montar_dataframe_jogador(dados_jogador):
+    """
+    Monta o DataFrame de jogadas a partir das linhas de `DBManager.listar_dados_analise_individual`,
+    adicionando as colunas 'partida' e 'zona', no esquema compacto de `compactar_dataframe_jogador`.
+
+    Args:
+        dados_jogador (list of tuple): Linhas retornadas pelo banco de dados.
+
+    Returns:
+        pd.DataFrame: DataFrame no formato de `extrair_dataframe_jogador`.
+    """
+    dados_jogador_df = pd.DataFrame(dados_jogador, columns=["jogo_id", "equipe_mandante_nome", "equipe_visitante_nome", "fase", "rodada", "competicao","equipe_jogada_id", "equipe_jogada", "jogador_nome", "jogada", "tempo", "x_loc", "y_loc", "quadrante_linha", "quadrante_coluna", "jogada_id"])
+    dados_jogador_df["partida"] = dados_jogador_df["jogo_id"].map(rotular_partidas(dados_jogador_df)).astype("category")
+    dados_jogador_df['zona'] = zonas_de_quadrantes(dados_jogador_df.pop('quadrante_linha'), dados_jogador_df.pop('quadrante_coluna'))
+    return compactar_dataframe_jogador(dados_jogador_df)
+
+def extrair_dataframe_jogador(db_manager, equipe_id=None, competicao=None, jogo_id=None, jogador_id=None):
     """
     Extrai e processa o DataFrame de dados de jogadas individuais de jogadores
-    a partir do banco de dados. Adiciona uma coluna 'partida' e 'quadrante'.
+    a partir do banco de dados. Adiciona uma coluna 'partida' e 'zona' (quadrante inteiro, de 0 a 17).
 
     Args:
         db_manager (DBManager): Uma instância do gerenciador de banco de dados.
+        equipe_id (int, optional): Filtra, no banco, as jogadas de jogadores desta equipe. Defaults to None.
+        competicao (str, optional): Filtra, no banco, as jogadas desta competição. Defaults to None.
+        jogo_id (int, optional): Filtra, no banco, as jogadas deste jogo. Defaults to None.
+        jogador_id (int, optional): Filtra, no banco, as jogadas deste jogador. Defaults to None.
 
     Returns:
         pd.DataFrame: DataFrame contendo os dados das jogadas com as seguintes colunas:
-        ["jogo_id", "equipe_mandante_nome", "equipe_visitante_nome", "fase", "rodada", "competicao","equipe_jogada_id", "equipe_jogada", "jogador_nome", "jogada", "tempo","partida","quadrante"]   .
+        ["jogo_id", "equipe_mandante_nome", "equipe_visitante_nome", "fase", "rodada", "competicao","equipe_jogada_id", "equipe_jogada", "jogador_nome", "jogada", "tempo", "x_loc", "y_loc", "jogada_id", "partida","zona"]   .
+    """
+    return montar_dataframe_jogador(db_manager.listar_dados_analise_individual(
+        equipe_id=equipe_id, competicao=competicao, jogo_id=jogo_id, jogador_id=jogador_id
+    ))
+
+def atualizar_dataframe_jogador(db_manager, cache=None, equipe_id=None, competicao=None, jogo_id=None, jogador_id=None):
+    """
+    Atualiza de forma incremental o DataFrame de `extrair_dataframe_jogador`.
+
+    Lê do banco apenas as jogadas com id maior que o último já carregado e as
+    junta ao DataFrame do cache. Se o total de jogadas no banco não bater com o
+    total do cache somado às novas, houve exclusões (ou jogadas gravadas fora de
+    ordem) e o DataFrame é recarregado por completo. O mesmo acontece quando os
+    filtros mudam em relação aos do cache.
+
+    Args:
+        db_manager (DBManager): Uma instância do gerenciador de banco de dados.
+        cache (dict, optional): O retorno da chamada anterior, com as chaves
+                                'dados', 'ultimo_id', 'total' e 'filtros'. Se None, carrega tudo. Defaults to None.
+        equipe_id (int, optional): Filtra, no banco, as jogadas de jogadores desta equipe. Defaults to None.
+        competicao (str, optional): Filtra, no banco, as jogadas desta competição. Defaults to None.
+        jogo_id (int, optional): Filtra, no banco, as jogadas deste jogo. Defaults to None.
+        jogador_id (int, optional): Filtra, no banco, as jogadas deste jogador. Defaults to None.
+
+    Returns:
+        dict: {'dados': pd.DataFrame, 'ultimo_id': int, 'total': int, 'filtros': dict}, a ser
+              passado como `cache` na próxima chamada.
     """
-    dados_jogador = db_manager.listar_dados_analise_individual()
-    dados_jogador_df = pd.DataFrame(dados_jogador, columns=["jogo_id", "equipe_mandante_nome", "equipe_visitante_nome", "fase", "rodada", "competicao","equipe_jogada_id", "equipe_jogada", "jogador_nome", "jogada", "tempo", "x_loc", "y_loc"])
-    dados_jogador_df["partida"] = dados_jogador_df.apply(
-        lambda row: f"{row['equipe_mandante_nome']} x {row['equipe_visitante_nome']} - {row['competicao']} - {row['fase']} - {row['rodada']}",
-        axis=1
+    filtros = {"equipe_id": equipe_id, "competicao": competicao, "jogo_id": jogo_id, "jogador_id": jogador_id}
+    ultimo_id, total = db_manager.obter_marca_jogadas(**filtros)
+
+    if cache is not None and cache["filtros"] == filtros:
+        if ultimo_id == cache["ultimo_id"] and total == cache["total"]:
+            return cache
+
+        novas_jogadas = db_manager.listar_dados_analise_individual(**filtros, a_partir_de_id=cache["ultimo_id"], ate_id=ultimo_id)
+        if cache["total"] + len(novas_jogadas) == total:
+            dados_jogador_df = compactar_dataframe_jogador(
+                pd.concat([cache["dados"], montar_dataframe_jogador(novas_jogadas)], ignore_index=True)
+            )
+            return {"dados": dados_jogador_df, "ultimo_id": ultimo_id, "total": total, "filtros": filtros}
+
+    dados_jogador = db_manager.listar_dados_analise_individual(**filtros, ate_id=ultimo_id)
+    return {"dados": montar_dataframe_jogador(dados_jogador), "ultimo_id": ultimo_id, "total": len(dados_jogador), "filtros": filtros}
+
+# Tabelas lidas pelos DataFrames de análise, cujas versões (`DBManager.obter_versao_dados`)
+# formam a chave dos caches compartilhados entre sessões.
+TABELAS_DIMENSAO_JOGADAS = ("equipes_1", "jogadores_1", "jogos_1")
+TABELAS_JOGADAS = TABELAS_DIMENSAO_JOGADAS + ("jogadas_1",)
+TABELAS_GOLS = ("equipes_1", "jogadores_1", "jogos_1", "gols_1")
+MAXIMO_DATAFRAMES_EM_CACHE = 32
+
+@st.cache_resource
+def cache_dataframes_analise():
+    """
+    Cache dos DataFrames de análise compartilhado por todas as sessões do processo.
+    Os DataFrames guardados são devolvidos sem cópia e não devem ser alterados.
+
+    Returns:
+        dict: {'trava': threading.Lock, 'entradas': OrderedDict}
+    """
+    return {"trava": threading.Lock(), "entradas": OrderedDict()}
+
+def ler_cache_analise(chave):
+    """
+    Lê uma entrada do cache compartilhado de DataFrames, marcando-a como usada.
+
+    Args:
+        chave (tuple): A chave da entrada.
+
+    Returns:
+        dict or None: A entrada guardada, ou None se não existir.
+    """
+    cache = cache_dataframes_analise()
+    with cache["trava"]:
+        entrada = cache["entradas"].get(chave)
+        if entrada is not None:
+            cache["entradas"].move_to_end(chave)
+        return entrada
+
+def guardar_cache_analise(chave, entrada):
+    """
+    Guarda uma entrada no cache compartilhado de DataFrames, descartando as usadas
+    há mais tempo quando passa de `MAXIMO_DATAFRAMES_EM_CACHE`.
+
+    Args:
+        chave (tuple): A chave da entrada.
+        entrada (dict): Os dados a guardar, com a chave 'versao'.
+    """
+    cache = cache_dataframes_analise()
+    with cache["trava"]:
+        cache["entradas"][chave] = entrada
+        cache["entradas"].move_to_end(chave)
+        while len(cache["entradas"]) > MAXIMO_DATAFRAMES_EM_CACHE:
+            cache["entradas"].popitem(last=False)
+
+def limpar_cache_analise(db_manager=None):
+    """
+    Descarta todos os DataFrames do cache compartilhado e, se informado, as consultas
+    guardadas no DBManager. Usado pelo botão "Atualizar Dados".
+
+    Args:
+        db_manager (DBManager, optional): Gerenciador cujo cache de consultas também é descartado. Defaults to None.
+    """
+    cache = cache_dataframes_analise()
+    with cache["trava"]:
+        cache["entradas"].clear()
+    if db_manager is not None:
+        db_manager.invalidar_cache()
+
+def obter_dataframe_jogador(db_manager, equipe_id=None, competicao=None, jogo_id=None, jogador_id=None):
+    """
+    Retorna o DataFrame de `extrair_dataframe_jogador` a partir do cache compartilhado
+    entre as sessões, consultando o banco só quando a versão das tabelas muda.
+
+    Se apenas jogadas_1 mudou, o DataFrame guardado é atualizado de forma incremental
+    (`atualizar_dataframe_jogador`); alterações em equipes, jogadores ou jogos recarregam tudo.
+
+    Args:
+        db_manager (DBManager): Uma instância do gerenciador de banco de dados.
+        equipe_id (int, optional): Filtra, no banco, as jogadas de jogadores desta equipe. Defaults to None.
+        competicao (str, optional): Filtra, no banco, as jogadas desta competição. Defaults to None.
+        jogo_id (int, optional): Filtra, no banco, as jogadas deste jogo. Defaults to None.
+        jogador_id (int, optional): Filtra, no banco, as jogadas deste jogador. Defaults to None.
+
+    Returns:
+        pd.DataFrame: O DataFrame das jogadas, que não deve ser alterado.
+    """
+    versao_atual = db_manager.obter_versao_dados()
+    versao = {tabela: versao_atual.get(tabela) for tabela in TABELAS_JOGADAS}
+    chave = ("jogadas", equipe_id, competicao, jogo_id, jogador_id)
+
+    entrada = ler_cache_analise(chave)
+    if entrada is not None and entrada["versao"] == versao:
+        return entrada["dados"]
+
+    cache_incremental = None
+    if entrada is not None and all(entrada["versao"][tabela] == versao[tabela] for tabela in TABELAS_DIMENSAO_JOGADAS):
+        cache_incremental = entrada
+
+    entrada = atualizar_dataframe_jogador(
+        db_manager, cache_incremental, equipe_id=equipe_id, competicao=competicao, jogo_id=jogo_id, jogador_id=jogador_id
+    )
+    guardar_cache_analise(chave, {**entrada, "versao": versao})
+    return entrada["dados"]
+
+def obter_dataframe_analise_gols(db_manager):
+    """
+    Retorna o DataFrame de `extrair_dataframe_analise_gols` a partir do cache compartilhado
+    entre as sessões, consultando o banco só quando a versão das tabelas muda.
+
+    Args:
+        db_manager (DBManager): Uma instância do gerenciador de banco de dados.
+
+    Returns:
+        pd.DataFrame: O DataFrame dos gols, que não deve ser alterado.
+    """
+    versao_atual = db_manager.obter_versao_dados()
+    versao = {tabela: versao_atual.get(tabela) for tabela in TABELAS_GOLS}
+    chave = ("gols",)
+
+    entrada = ler_cache_analise(chave)
+    if entrada is not None and entrada["versao"] == versao:
+        return entrada["dados"]
+
+    dados_analise_gols = extrair_dataframe_analise_gols(db_manager)
+    guardar_cache_analise(chave, {"dados": dados_analise_gols, "versao": versao})
+    return dados_analise_gols
+
+def obter_dataframe_contagens(db_manager, por_quadrante=False, equipe_id=None, competicao=None, jogo_id=None, jogador_id=None):
+    """
+    Retorna o DataFrame de `extrair_dataframe_contagens` a partir do cache compartilhado
+    entre as sessões, consultando o banco só quando a versão das tabelas muda.
+
+    Args:
+        db_manager (DBManager): Uma instância do gerenciador de banco de dados.
+        por_quadrante (bool, optional): Se True, agrega também por quadrante (coluna 'zona'). Defaults to False.
+        equipe_id (int, optional): Filtra as contagens de jogadores desta equipe. Defaults to None.
+        competicao (str, optional): Filtra as contagens desta competição. Defaults to None.
+        jogo_id (int, optional): Filtra as contagens deste jogo. Defaults to None.
+        jogador_id (int, optional): Filtra as contagens deste jogador. Defaults to None.
+
+    Returns:
+        pd.DataFrame: O DataFrame das contagens, que não deve ser alterado.
+    """
+    versao_atual = db_manager.obter_versao_dados()
+    versao = {tabela: versao_atual.get(tabela) for tabela in TABELAS_JOGADAS}
+    chave = ("contagens", por_quadrante, equipe_id, competicao, jogo_id, jogador_id)
+
+    entrada = ler_cache_analise(chave)
+    if entrada is not None and entrada["versao"] == versao:
+        return entrada["dados"]
+
+    contagens_df = extrair_dataframe_contagens(
+        db_manager, por_quadrante=por_quadrante, equipe_id=equipe_id, competicao=competicao, jogo_id=jogo_id, jogador_id=jogador_id
     )
-    dados_jogador_df['quadrante'] = dados_jogador_df.apply(lambda row: calcular_quadrante(row['x_loc'], row['y_loc']), axis=1)
-    return dados_jogador_df
+    guardar_cache_analise(chave, {"dados": contagens_df, "versao": versao})
+    return contagens_df
 
 def extrair_dataframe_analise_gols(db_manager):
     """
@@ -114,13 +579,128 @@ def extrair_dataframe_analise_gols(db_manager):
         pd.DataFrame: DataFrame contendo os dados dos gols com colunas processadas.
     """
     dados_analise_gols = db_manager.listar_gols()
-    dados_analise_gols = pd.DataFrame(dados_analise_gols, columns=['id', 'jogo_id', 'Mandante', 'Visitante', 'Competição', 'Fase', 'Rodada', "Data", 'Equipe Analisada', 'Tipo', 'Característica', 'Tempo', 'Autor', 'Assistente', 'Jogadores em quadra', 'xloc', 'yloc'])
+    dados_analise_gols = pd.DataFrame(dados_analise_gols, columns=['id', 'jogo_id', 'Mandante', 'Visitante', 'Competição', 'Fase', 'Rodada', "Data", 'Equipe Analisada', 'Tipo', 'Característica', 'Tempo', 'Autor', 'Assistente', 'Jogadores em quadra', 'xloc', 'yloc', 'quadrante_linha', 'quadrante_coluna'])
     dados_analise_gols = dados_analise_gols.set_index('id')
-    dados_analise_gols['quadrante'] = dados_analise_gols.apply(lambda row: calcular_quadrante(row['xloc'], row['yloc']), axis=1)
-    dados_analise_gols.drop(['xloc', 'yloc'], inplace=True, axis=1)
+    dados_analise_gols['quadrante'] = formatar_quadrante(dados_analise_gols['quadrante_linha'], dados_analise_gols['quadrante_coluna'])
+    dados_analise_gols.drop(['xloc', 'yloc', 'quadrante_linha', 'quadrante_coluna'], inplace=True, axis=1)
     dados_analise_gols.fillna("", inplace=True)
     return dados_analise_gols
 
+def extrair_dataframe_contagens(db_manager, por_quadrante=False, equipe_id=None, competicao=None, jogo_id=None, jogador_id=None):
+    """
+    Extrai do banco de dados a tabela de contagens de jogadas já agregadas por
+    jogo, jogador, tempo e tipo de jogada (tabela `resumo_jogo`), com as colunas de
+    jogo e jogador usadas nos filtros das páginas e a coluna 'partida'.
+
+    As funções de estatística aceitam este DataFrame no lugar do DataFrame de
+    jogadas individuais: quando existe a coluna 'quantidade', ela é somada em vez
+    de se contar linhas.
+
+    Args:
+        db_manager (DBManager): Uma instância do gerenciador de banco de dados.
+        por_quadrante (bool, optional): Se True, a agregação também é feita por quadrante
+                                        e o DataFrame ganha a coluna 'zona', servindo
+                                        para `extrair_estatisticas_localizacao`. Defaults to False.
+        equipe_id (int, optional): Filtra as contagens de jogadores desta equipe. Defaults to None.
+        competicao (str, optional): Filtra as contagens desta competição. Defaults to None.
+        jogo_id (int, optional): Filtra as contagens deste jogo. Defaults to None.
+        jogador_id (int, optional): Filtra as contagens deste jogador. Defaults to None.
+
+    Returns:
+        pd.DataFrame: DataFrame com as colunas
+        ["jogo_id", "equipe_mandante_nome", "equipe_visitante_nome", "fase", "rodada", "competicao",
+        "equipe_jogada_id", "jogador_id", "jogador_nome", "tempo", "jogada", "quantidade", "partida"]
+        (e "zona", com `por_quadrante`), no esquema compacto de `TIPOS_COLUNAS_JOGADAS`.
+    """
+    colunas = ["jogo_id", "equipe_mandante_nome", "equipe_visitante_nome", "fase", "rodada", "competicao",
+               "equipe_jogada_id", "jogador_id", "jogador_nome", "tempo", "jogada"]
+    if por_quadrante:
+        colunas += ["quadrante_linha", "quadrante_coluna"]
+
+    contagens = db_manager.contar_jogadas_agrupadas(
+        por_quadrante=por_quadrante, equipe_id=equipe_id, competicao=competicao, jogo_id=jogo_id, jogador_id=jogador_id
+    )
+    contagens_df = pd.DataFrame(contagens, columns=colunas + ["quantidade"])
+    contagens_df["quantidade"] = contagens_df["quantidade"].astype(np.int64)
+    contagens_df["partida"] = contagens_df["jogo_id"].map(rotular_partidas(contagens_df)).astype("category")
+    if por_quadrante:
+        contagens_df["zona"] = zonas_de_quadrantes(contagens_df.pop("quadrante_linha"), contagens_df.pop("quadrante_coluna"))
+    return contagens_df.astype({coluna: tipo for coluna, tipo in TIPOS_COLUNAS_JOGADAS.items() if coluna in contagens_df.columns})
+
+def contar_valores(dados_df, coluna):
+    """
+    Conta as ocorrências de cada valor de uma coluna, somando a coluna 'quantidade'
+    quando o DataFrame já vem agregado do banco.
+
+    Args:
+        dados_df (pd.DataFrame): DataFrame de jogadas individuais ou de contagens
+                                 agregadas (com a coluna 'quantidade').
+        coluna (str): A coluna a ser contada (ex: 'jogada', 'tempo').
+
+    Returns:
+        pd.Series: Contagem por valor da coluna.
+    """
+    if "quantidade" in dados_df.columns:
+        return dados_df.groupby(coluna, observed=True)["quantidade"].sum()
+    return dados_df[coluna].value_counts()
+
+def contar_jogadas_por_tempo(dados_jogador_df, tempo):
+    """
+    Conta as jogadas de cada tipo ocorridas em um tempo de jogo.
+
+    Args:
+        dados_jogador_df (pd.DataFrame): DataFrame de jogadas individuais ou de contagens
+                                         agregadas (com a coluna 'quantidade').
+        tempo (str): O tempo de jogo (ex: '1ºT', '2ºP').
+
+    Returns:
+        pd.Series: Contagem por tipo de jogada.
+    """
+    return contar_valores(dados_jogador_df.loc[dados_jogador_df["tempo"] == tempo], "jogada")
+
+def extrair_matriz_estatisticas(dados_jogador_df):
+    """
+    Conta, em uma única passada, as jogadas por tipo de jogada e tempo de jogo e calcula
+    as médias por partida a partir das mesmas contagens.
+
+    As médias do 1ºT, 2ºT e Total são divididas pelo número de partidas; as da prorrogação,
+    pelo número de partidas que tiveram prorrogação (no mínimo 1).
+
+    Args:
+        dados_jogador_df (pd.DataFrame): DataFrame de jogadas individuais ou de contagens
+                                         agregadas (com a coluna 'quantidade').
+
+    Returns:
+        tuple: (contagens, medias), dois DataFrames com as jogadas de JOGADAS
+               (mais 'FIN.TOTAL' e 'FIN.S.TOTAL') no índice 'jogada' e os tempos de
+               PERIODOS_ESTATISTICAS nas colunas 'tempo'.
+    """
+    codigos_jogada = pd.Categorical(dados_jogador_df["jogada"], categories=JOGADAS).codes.astype(np.int64)
+    codigos_tempo = pd.Categorical(dados_jogador_df["tempo"], categories=TEMPOS_JOGO).codes.astype(np.int64)
+    validas = (codigos_jogada >= 0) & (codigos_tempo >= 0)
+
+    pesos = dados_jogador_df["quantidade"].to_numpy()[validas] if "quantidade" in dados_jogador_df.columns else None
+    contagens = np.bincount(
+        codigos_jogada[validas] * len(TEMPOS_JOGO) + codigos_tempo[validas],
+        weights=pesos, minlength=len(JOGADAS) * len(TEMPOS_JOGO)
+    ).astype(np.int64).reshape(len(JOGADAS), len(TEMPOS_JOGO))
+
+    totais_finalizacoes = [contagens[[CODIGOS_JOGADAS[j] for j in jogadas]].sum(axis=0) for jogadas in (FINALIZACOES, FINALIZACOES_SOFRIDAS)]
+    contagens = np.vstack([contagens, *totais_finalizacoes])
+    contagens = np.column_stack([contagens, contagens[:, CODIGOS_TEMPOS['1ºT']] + contagens[:, CODIGOS_TEMPOS['2ºT']]])
+
+    # Partidas distintas por tempo, a partir dos pares (partida, tempo) presentes no DataFrame.
+    codigos_jogo, jogos = pd.factorize(dados_jogador_df["jogo_id"])
+    pares = np.unique(codigos_jogo[codigos_tempo >= 0] * len(TEMPOS_JOGO) + codigos_tempo[codigos_tempo >= 0])
+    jogos_com_prorrogacao = len(np.unique(pares[pares % len(TEMPOS_JOGO) >= CODIGOS_TEMPOS['1ºP']] // len(TEMPOS_JOGO)))
+    numero_jogos = max(len(jogos), 1)
+    numero_jogos_prorrogacao = max(jogos_com_prorrogacao, 1)
+    divisores = np.array([numero_jogos, numero_jogos, numero_jogos_prorrogacao, numero_jogos_prorrogacao, numero_jogos])
+
+    indice = pd.Index(JOGADAS + ["FIN.TOTAL", "FIN.S.TOTAL"], name="jogada")
+    colunas = pd.Index(PERIODOS_ESTATISTICAS, name="tempo")
+    return pd.DataFrame(contagens, index=indice, columns=colunas), pd.DataFrame(contagens / divisores, index=indice, columns=colunas)
+
 def extrair_estatisticas_jogadores(dados_jogador_df):
     """
     Extrai estatísticas de jogadas por tempo (1ºT, 2ºT, Total) para um jogador
@@ -132,72 +712,181 @@ def extrair_estatisticas_jogadores(dados_jogador_df):
     Returns:
         pd.DataFrame: DataFrame com as contagens de jogadas por tipo e tempo.
     """
-    primeiro_tempo = dados_jogador_df.jogada.loc[dados_jogador_df["tempo"] == '1ºT'].value_counts().reindex(["FIN.C", "FIN.E", "FIN.T", 'DES.C/P.', 'DES.S/P.', 'PER.P.', 'C.A', 'ASSIST.', 'GOL'], fill_value=0)
-    segundo_tempo = dados_jogador_df.jogada.loc[dados_jogador_df["tempo"] == '2ºT'].value_counts().reindex(["FIN.C", "FIN.E", "FIN.T", 'DES.C/P.', 'DES.S/P.', 'PER.P.', 'C.A', 'ASSIST.', 'GOL'], fill_value=0)
-    estatiscas_jogadores_df = pd.DataFrame({"1ºT": primeiro_tempo, "2ºT": segundo_tempo})
-    estatiscas_jogadores_df["Total"] = estatiscas_jogadores_df["1ºT"] + estatiscas_jogadores_df["2ºT"]
-    estatiscas_jogadores_df.loc['FIN.TOTAL'] = estatiscas_jogadores_df.loc[['FIN.C', 'FIN.E', 'FIN.T']].sum()
-    return estatiscas_jogadores_df
+    contagens, _ = extrair_matriz_estatisticas(dados_jogador_df)
+    return contagens.reindex(["FIN.C", "FIN.E", "FIN.T", 'DES.C/P.', 'DES.S/P.', 'PER.P.', 'C.A', 'ASSIST.', 'GOL', 'FIN.TOTAL'], fill_value=0)[["1ºT", "2ºT", "Total"]]
 
 def extrair_estatisticas_gerais(dados_jogador_df):
     """
     Extrai estatísticas gerais de jogadas por tempo (1ºT, 2ºT, 1ºP, 2ºP) e total,
-    reindexando para garantir todas as categorias de jogadas.
+    com todas as categorias de jogadas.
 
     Args:
-        dados_jogador_df (pd.DataFrame): DataFrame contendo os dados das jogadas.
+        dados_jogador_df (pd.DataFrame): DataFrame contendo os dados das jogadas ou as contagens
+                                         agregadas (com a coluna 'quantidade').
 
     Returns:
-        tuple: Uma tupla de dicionários, cada um contendo as estatísticas para:
+        tuple: Uma tupla de Series pandas indexadas por jogada (acessíveis como dicionários),
+               cada uma contendo as estatísticas para:
                1º Tempo, 2º Tempo, Total, 1º Tempo Prorrogação, 2º Tempo Prorrogação.
     """
-    primeiro_tempo = dados_jogador_df.jogada.loc[dados_jogador_df["tempo"] == '1ºT'].value_counts().reindex(['FIN.C', 'FIN.E', 'FIN.T', 'GOL', 'ASSIST.', 'DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra', "FIN.S.C", "FIN.S.E", "FIN.S.T"], fill_value=0)
-    segundo_tempo = dados_jogador_df.jogada.loc[dados_jogador_df["tempo"] == '2ºT'].value_counts().reindex(['FIN.C', 'FIN.E', 'FIN.T', 'GOL', 'ASSIST.', 'DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra', "FIN.S.C", "FIN.S.E", "FIN.S.T"], fill_value=0)
-    primeiro_tempo_prorrogacao = dados_jogador_df.jogada.loc[dados_jogador_df["tempo"] == '1ºP'].value_counts().reindex(['FIN.C', 'FIN.E', 'FIN.T', 'GOL', 'ASSIST.', 'DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra', "FIN.S.C", "FIN.S.E", "FIN.S.T"], fill_value=0)
-    segundo_tempo_prorrogacao = dados_jogador_df.jogada.loc[dados_jogador_df["tempo"] == '2ºP'].value_counts().reindex(['FIN.C', 'FIN.T', 'GOL', 'ASSIST.', 'DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra', "FIN.S.C", "FIN.S.E", "FIN.S.T"], fill_value=0)
+    contagens, _ = extrair_matriz_estatisticas(dados_jogador_df)
+    return tuple(contagens[tempo] for tempo in ["1ºT", "2ºT", "Total", "1ºP", "2ºP"])
+
 
-    estatisticas_jogadores_df = pd.DataFrame({"1ºT": primeiro_tempo, "2ºT": segundo_tempo, "1ºP": primeiro_tempo_prorrogacao, "2ºP": segundo_tempo_prorrogacao})
-    estatisticas_jogadores_df["Total"] = estatisticas_jogadores_df["1ºT"] + estatisticas_jogadores_df["2ºT"]
-    estatisticas_jogadores_df.loc['FIN.TOTAL'] = estatisticas_jogadores_df.loc[['FIN.C', 'FIN.E', 'FIN.T']].sum()
-    estatisticas_jogadores_df.loc['FIN.S.TOTAL'] = estatisticas_jogadores_df.loc[["FIN.S.C", "FIN.S.E", "FIN.S.T"]].sum()
+def extrair_tensor_localizacao(dados_jogador_df, grade=GRADE_PADRAO):
+    """
+    Conta, em uma única passada, as jogadas por tipo de jogada, tempo e célula da grade da quadra.
 
-    estatisticas_primeiro_tempo_dict = estatisticas_jogadores_df["1ºT"].to_dict()
-    estatisticas_segundo_tempo_dict = estatisticas_jogadores_df["2ºT"].to_dict()
-    estatisticas_totais_dict = estatisticas_jogadores_df["Total"].to_dict()
-    estatisticas_pt_prorrogacao_dict = estatisticas_jogadores_df["1ºP"].to_dict()
-    estatisticas_st_prorrogacao_dict = estatisticas_jogadores_df["2ºP"].to_dict()
+    Na grade padrão usa a coluna 'zona' vinda do banco; nas demais, distribui as coordenadas
+    com `np.histogramdd` sobre (jogada, tempo, y, x), com as bordas de `bordas_grade`. Nas duas,
+    só contam as posições de `dentro_da_quadra`, então o total não muda ao trocar de grade.
 
-    return estatisticas_primeiro_tempo_dict, estatisticas_segundo_tempo_dict, estatisticas_totais_dict, estatisticas_pt_prorrogacao_dict, estatisticas_st_prorrogacao_dict
+    Args:
+        dados_jogador_df (pd.DataFrame): DataFrame contendo os dados das jogadas (com as colunas 'zona',
+                                         'x_loc' e 'y_loc'), ou as contagens agregadas por quadrante de
+                                         `extrair_dataframe_contagens` (só na grade padrão).
+        grade (tuple, optional): (linhas, colunas) da grade. Defaults to GRADE_PADRAO.
+
+    Returns:
+        np.ndarray: Contagens de forma [jogada, tempo, linha, coluna], indexadas pelos códigos de
+                    CODIGOS_JOGADAS e CODIGOS_TEMPOS.
+    """
+    linhas, colunas = grade
+    codigos_jogada = pd.Categorical(dados_jogador_df["jogada"], categories=JOGADAS).codes.astype(np.int64)
+    codigos_tempo = pd.Categorical(dados_jogador_df["tempo"], categories=TEMPOS_JOGO).codes
+    pesos = dados_jogador_df["quantidade"].to_numpy() if "quantidade" in dados_jogador_df.columns else None
+
+    if tuple(grade) != GRADE_PADRAO or "zona" not in dados_jogador_df.columns:
+        x = dados_jogador_df["x_loc"].to_numpy(dtype=float)
+        y = dados_jogador_df["y_loc"].to_numpy(dtype=float)
+        # O histograma poria as posições sobre as bordas finais na última faixa; a grade padrão as descarta
+        dentro = dentro_da_quadra(x, y)
+        bordas_y, bordas_x = bordas_grade(linhas, colunas)
+        contagens, _ = np.histogramdd(
+            (codigos_jogada[dentro], codigos_tempo[dentro], y[dentro], x[dentro]),
+            bins=(np.arange(len(JOGADAS) + 1) - 0.5, np.arange(len(TEMPOS_JOGO) + 1) - 0.5, bordas_y, bordas_x),
+            weights=pesos[dentro] if pesos is not None else None
+        )
+        return contagens.astype(np.int64)
 
+    zonas = dados_jogador_df["zona"].to_numpy()
+    validas = (codigos_jogada >= 0) & (codigos_tempo >= 0) & (zonas >= 0)
+    indices = (codigos_jogada[validas] * len(TEMPOS_JOGO) + codigos_tempo[validas]) * NUMERO_ZONAS + zonas[validas]
+    contagens = np.bincount(indices, weights=pesos[validas] if pesos is not None else None, minlength=len(JOGADAS) * len(TEMPOS_JOGO) * NUMERO_ZONAS)
+    return contagens.astype(np.int64).reshape(len(JOGADAS), len(TEMPOS_JOGO), NUMERO_LINHAS, NUMERO_COLUNAS)
 
-def extrair_estatisticas_localizacao(dados_jogador_df, jogada):
+def tensor_localizacao(dados, grade=GRADE_PADRAO):
     """
-    Extrai estatísticas de localização de uma jogada específica por quadrante e tempo.
+    Retorna o tensor de `extrair_tensor_localizacao` para um DataFrame, ou o próprio
+    tensor quando ele já foi calculado, para que uma página conte as jogadas uma vez só.
 
     Args:
-        dados_jogador_df (pd.DataFrame): DataFrame contendo os dados das jogadas.
+        dados (pd.DataFrame or np.ndarray): DataFrame das jogadas ou tensor já calculado.
+        grade (tuple, optional): (linhas, colunas) da grade, usada só para DataFrames. Defaults to GRADE_PADRAO.
+
+    Returns:
+        np.ndarray: O tensor de localização.
+    """
+    return dados if isinstance(dados, np.ndarray) else extrair_tensor_localizacao(dados, grade)
+
+def localizacao_do_tensor(tensor, jogada):
+    """
+    Recorta do tensor de localização as contagens por célula da grade de uma jogada em cada tempo.
+
+    Args:
+        tensor (np.ndarray): O tensor de `extrair_tensor_localizacao`.
+        jogada (str): O tipo de jogada (ex: 'FIN.C', 'DES.S/P.').
+
+    Returns:
+        dict: No formato de `extrair_estatisticas_localizacao`.
+    """
+    codigo = CODIGOS_JOGADAS.get(jogada)
+    if codigo is None:
+        contagens = np.zeros(tensor.shape[1:], dtype=np.int64)
+    else:
+        contagens = tensor[codigo]
+
+    return {
+        "Primeiro Tempo": contagens[CODIGOS_TEMPOS['1ºT']],
+        "Segundo Tempo": contagens[CODIGOS_TEMPOS['2ºT']],
+        "Total": contagens[CODIGOS_TEMPOS['1ºT']] + contagens[CODIGOS_TEMPOS['2ºT']],
+        "Primeiro Tempo Prorrogação": contagens[CODIGOS_TEMPOS['1ºP']],
+        "Segundo Tempo Prorrogação": contagens[CODIGOS_TEMPOS['2ºP']]
+    }
+
+def extrair_estatisticas_localizacao(dados_jogador_df, jogada, grade=GRADE_PADRAO):
+    """
+    Extrai estatísticas de localização de uma jogada específica por célula da grade e tempo.
+
+    Para várias jogadas do mesmo DataFrame, prefira calcular o tensor uma vez com
+    `extrair_tensor_localizacao` e recortá-lo com `localizacao_do_tensor`.
+
+    Args:
+        dados_jogador_df (pd.DataFrame or np.ndarray): DataFrame contendo os dados das jogadas, as contagens
+                                                 agregadas por quadrante de `extrair_dataframe_contagens`,
+                                                 ou o tensor de `extrair_tensor_localizacao`.
         jogada (str): O tipo de jogada a ser analisado (ex: 'FIN.C', 'DES.S/P.').
+        grade (tuple, optional): (linhas, colunas) da grade. Defaults to GRADE_PADRAO.
 
     Returns:
         dict: Um dicionário onde as chaves são os tempos ('Primeiro Tempo', 'Segundo Tempo', 'Total', etc.)
-              e os valores são Series pandas com as contagens por quadrante.
-    """
-    quadrantes_padrao = ['1.0-1.0', '1.0-2.0', '1.0-3.0', '2.0-1.0', '2.0-2.0', '2.0-3.0', '3.0-1.0', '3.0-2.0', '3.0-3.0', '4.0-1.0', '4.0-2.0', '4.0-3.0', '5.0-1.0', '5.0-2.0', '5.0-3.0', '6.0-1.0', '6.0-2.0', '6.0-3.0']
-
-    primeiro_tempo = dados_jogador_df[(dados_jogador_df["tempo"] == '1ºT') & (dados_jogador_df["jogada"] == jogada)].quadrante.value_counts().reindex(quadrantes_padrao, fill_value=0)
-    segundo_tempo = dados_jogador_df[(dados_jogador_df["tempo"] == '2ºT') & (dados_jogador_df["jogada"] == jogada)].quadrante.value_counts().reindex(quadrantes_padrao, fill_value=0)
-    total = primeiro_tempo + segundo_tempo
-    primeiro_tempo_prorrogacao = dados_jogador_df[(dados_jogador_df["tempo"] == '1ºP') & (dados_jogador_df["jogada"] == jogada)].quadrante.value_counts().reindex(quadrantes_padrao, fill_value=0)
-    segundo_tempo_prorrogacao = dados_jogador_df[(dados_jogador_df["tempo"] == '2ºP') & (dados_jogador_df["jogada"] == jogada)].quadrante.value_counts().reindex(quadrantes_padrao, fill_value=0)
-
-    localizacao_jogadas = {
-        "Primeiro Tempo": primeiro_tempo,
-        "Segundo Tempo": segundo_tempo,
-        "Total": total,
-        "Primeiro Tempo Prorrogação": primeiro_tempo_prorrogacao,
-        "Segundo Tempo Prorrogação": segundo_tempo_prorrogacao
-    }
-    return localizacao_jogadas
+              e os valores são matrizes [linha, coluna] com as contagens por célula da grade.
+    """
+    return localizacao_do_tensor(tensor_localizacao(dados_jogador_df, grade), jogada)
+
+# As figuras são montadas como dicionários e convertidas sem a validação propriedade a propriedade
+# do Plotly, que dominava o custo de cada figura. Com FUTSAL_VALIDAR_FIGURAS=1 no ambiente, toda
+# figura volta a ser validada, para conferir uma especificação nova ou alterada. tests/test_figuras.py
+# valida uma vez cada tipo de figura, e benchmarks/figuras.py compara as duas formas.
+VALIDAR_FIGURAS = os.environ.get("FUTSAL_VALIDAR_FIGURAS") == "1"
+
+@lru_cache(maxsize=None)
+def tema_plotly(nome="plotly_dark"):
+    """
+    Retorna um tema do Plotly já expandido em dicionário, como precisa uma figura não validada
+    (o nome do tema só é resolvido pela validação).
+
+    Args:
+        nome (str, optional): Nome do tema em `plotly.io.templates`. Padrão é "plotly_dark".
+
+    Returns:
+        dict: O tema, que não deve ser alterado.
+    """
+    return pio.templates[nome].to_plotly_json()
+
+@lru_cache(maxsize=None)
+def layout_subplots(rows, cols, subplot_titles, shared_yaxes=False):
+    """
+    Calcula uma única vez o layout de `make_subplots` (domínios dos eixos e títulos dos subplots)
+    para as figuras montadas como dicionários.
+
+    Args:
+        rows (int): Número de linhas de subplots.
+        cols (int): Número de colunas de subplots.
+        subplot_titles (tuple): Títulos dos subplots.
+        shared_yaxes (bool, optional): Se os subplots compartilham o eixo Y. Padrão é False.
+
+    Returns:
+        dict: O layout, sem tema, que não deve ser alterado.
+    """
+    layout = make_subplots(rows=rows, cols=cols, subplot_titles=subplot_titles, shared_yaxes=shared_yaxes).layout.to_plotly_json()
+    layout.pop("template", None)
+    return layout
+
+def figura_de_especificacao(tracos, layout):
+    """
+    Cria a figura Plotly a partir de traços e layout em dicionários, sem validá-los (a menos que
+    VALIDAR_FIGURAS esteja ligado). A figura serializa para o mesmo JSON da validada e o
+    `st.plotly_chart` a aceita sem validar de novo, o que não acontece se receber o dicionário.
+
+    Args:
+        tracos (list): Dicionários dos traços, com a chave 'type'.
+        layout (dict): Dicionário do layout, com o tema já expandido (ver `tema_plotly`).
+
+    Returns:
+        plotly.graph_objects.Figure: A figura.
+    """
+    return go.Figure(data=tracos, layout=layout, _validate=VALIDAR_FIGURAS)
 
 def plotar_estatisticas_gerais_time(estatisticas_totais_dict, numero_jogos):
     """
@@ -210,46 +899,45 @@ def plotar_estatisticas_gerais_time(estatisticas_totais_dict, numero_jogos):
     Returns:
         plotly.graph_objects.Figure: Uma figura Plotly com os indicadores de desempenho do time.
     """
-    estatisticas_gerais_fig = go.Figure()
-
     efetividade_finalizacoes = estatisticas_totais_dict['FIN.C'] / estatisticas_totais_dict['FIN.TOTAL'] if estatisticas_totais_dict['FIN.TOTAL'] > 0 else 0
     efetividade_finalizacoes_certas = estatisticas_totais_dict['GOL'] / estatisticas_totais_dict['FIN.C'] if estatisticas_totais_dict['FIN.C'] > 0 else 0
 
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=numero_jogos, domain={'row': 0, 'column': 1},
-        title={"text": "Jogos", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['GOL'], domain={'row': 1, 'column': 0},
-        title={"text": "Gols", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['FIN.TOTAL'], domain={'row': 1, 'column': 1},
-        title={"text": "Fin.", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=efetividade_finalizacoes, number={"valueformat": ".0%", "font": {"size": 20}},
-        domain={'row': 1, 'column': 2}, title={"text": "Efet.Fin.", "font": {"size": 12}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['GOL'] / numero_jogos if numero_jogos > 0 else 0,
-        domain={'row': 2, 'column': 0}, title={"text": "Média Gols", "font": {"size": 12}},
-        number={"font": {"size": 20}, "valueformat": ".1f"}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['FIN.C'], domain={'row': 2, 'column': 1},
-        title={"text": "Fin.C.", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=efetividade_finalizacoes_certas, number={"valueformat": ".0%", "font": {"size": 20}},
-        domain={'row': 2, 'column': 2}, title={"text": "Efet.Fin.C.", "font": {"size": 12}}
-    ))
+    indicadores = [
+        dict(type='indicator',
+            mode="number", value=numero_jogos, domain={'row': 0, 'column': 1},
+            title={"text": "Jogos", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['GOL'], domain={'row': 1, 'column': 0},
+            title={"text": "Gols", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['FIN.TOTAL'], domain={'row': 1, 'column': 1},
+            title={"text": "Fin.", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=efetividade_finalizacoes, number={"valueformat": ".0%", "font": {"size": 20}},
+            domain={'row': 1, 'column': 2}, title={"text": "Efet.Fin.", "font": {"size": 12}}
+        ),
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['GOL'] / numero_jogos if numero_jogos > 0 else 0,
+            domain={'row': 2, 'column': 0}, title={"text": "Média Gols", "font": {"size": 12}},
+            number={"font": {"size": 20}, "valueformat": ".1f"}
+        ),
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['FIN.C'], domain={'row': 2, 'column': 1},
+            title={"text": "Fin.C.", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=efetividade_finalizacoes_certas, number={"valueformat": ".0%", "font": {"size": 20}},
+            domain={'row': 2, 'column': 2}, title={"text": "Efet.Fin.C.", "font": {"size": 12}}
+        ),
+    ]
 
-    estatisticas_gerais_fig.update_layout(
+    return figura_de_especificacao(indicadores, dict(
         grid={'rows': 3, 'columns': 3, 'pattern': "independent"},
-        template="plotly_dark", margin_t=7, margin_b=0, height=180, margin_l=10, margin_r=10
-    )
-    return estatisticas_gerais_fig
+        template=tema_plotly(), margin=dict(t=7, b=0, l=10, r=10), height=180
+    ))
 
 
 def plotar_estatisticas_gerais(estatisticas_totais_dict, numero_jogos):
@@ -263,45 +951,44 @@ def plotar_estatisticas_gerais(estatisticas_totais_dict, numero_jogos):
     Returns:
         plotly.graph_objects.Figure: Uma figura Plotly com os indicadores de desempenho do jogador.
     """
-    estatisticas_gerais_fig = go.Figure()
-
     efetividade_finalizacoes = estatisticas_totais_dict['FIN.C'] / estatisticas_totais_dict['FIN.TOTAL'] if estatisticas_totais_dict['FIN.TOTAL'] > 0 else 0
     efetividade_finalizacoes_certas = estatisticas_totais_dict['GOL'] / estatisticas_totais_dict['FIN.C'] if estatisticas_totais_dict['FIN.C'] > 0 else 0
 
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=numero_jogos, domain={'row': 0, 'column': 1},
-        title={"text": "Jogos", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['GOL'], domain={'row': 1, 'column': 0},
-        title={"text": "Gols", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['FIN.TOTAL'], domain={'row': 1, 'column': 1},
-        title={"text": "Fin.", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=efetividade_finalizacoes, number={"valueformat": ".0%", "font": {"size": 20}},
-        domain={'row': 1, 'column': 2}, title={"text": "Efet.Fin.", "font": {"size": 12}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['ASSIST.'], domain={'row': 2, 'column': 0},
-        title={"text": "Assist.", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['FIN.C'], domain={'row': 2, 'column': 1},
-        title={"text": "Fin.C.", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=efetividade_finalizacoes_certas, number={"valueformat": ".0%", "font": {"size": 20}},
-        domain={'row': 2, 'column': 2}, title={"text": "Efet.Fin.C.", "font": {"size": 12}}
-    ))
+    indicadores = [
+        dict(type='indicator',
+            mode="number", value=numero_jogos, domain={'row': 0, 'column': 1},
+            title={"text": "Jogos", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['GOL'], domain={'row': 1, 'column': 0},
+            title={"text": "Gols", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['FIN.TOTAL'], domain={'row': 1, 'column': 1},
+            title={"text": "Fin.", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=efetividade_finalizacoes, number={"valueformat": ".0%", "font": {"size": 20}},
+            domain={'row': 1, 'column': 2}, title={"text": "Efet.Fin.", "font": {"size": 12}}
+        ),
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['ASSIST.'], domain={'row': 2, 'column': 0},
+            title={"text": "Assist.", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['FIN.C'], domain={'row': 2, 'column': 1},
+            title={"text": "Fin.C.", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=efetividade_finalizacoes_certas, number={"valueformat": ".0%", "font": {"size": 20}},
+            domain={'row': 2, 'column': 2}, title={"text": "Efet.Fin.C.", "font": {"size": 12}}
+        ),
+    ]
 
-    estatisticas_gerais_fig.update_layout(
+    return figura_de_especificacao(indicadores, dict(
         grid={'rows': 3, 'columns': 3, 'pattern': "independent"},
-        template="plotly_dark", margin_t=7, margin_b=0, height=180, margin_l=10, margin_r=10
-    )
-    return estatisticas_gerais_fig
+        template=tema_plotly(), margin=dict(t=7, b=0, l=10, r=10), height=180
+    ))
 
 
 def plotar_estatisticas_gerais_1(estatisticas_totais_dict):
@@ -315,8 +1002,6 @@ def plotar_estatisticas_gerais_1(estatisticas_totais_dict):
     Returns:
         plotly.graph_objects.Figure: Uma figura Plotly com os indicadores de desempenho.
     """
-    estatisticas_gerais_fig = go.Figure()
-
     percentual_perda_de_posse = (
         estatisticas_totais_dict['C.A.-Contra'] / estatisticas_totais_dict['PER.P.']
         if estatisticas_totais_dict['PER.P.'] > 0 else 0
@@ -326,40 +1011,41 @@ def plotar_estatisticas_gerais_1(estatisticas_totais_dict):
         if estatisticas_totais_dict['DES.C/P.'] > 0 else 0
     )
 
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['DES.C/P.'], domain={'row': 0, 'column': 0},
-        title={"text": "Des.C/P.", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['C.A.-Pró'], domain={'row': 1, 'column': 0},
-        title={"text": "C.A. - Pró", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=efetividade_desarme_com_posse, number={"valueformat": ".0%", "font": {"size": 20}},
-        domain={'row': 2, 'column': 0}, title={"text": "Efetividade", "font": {"size": 12}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['DES.S/P.'], domain={'row': 1, 'column': 1},
-        title={"text": "Des.S/P.", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['PER.P.'], domain={'row': 0, 'column': 2},
-        title={"text": "Per.P.", "font": {"size": 12}}, number={"font": {"size": 20}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=estatisticas_totais_dict['C.A.-Contra'], number={"font": {"size": 20}},
-        domain={'row': 1, 'column': 2}, title={"text": "C.A Sofrido", "font": {"size": 12}}
-    ))
-    estatisticas_gerais_fig.add_trace(go.Indicator(
-        mode="number", value=percentual_perda_de_posse, number={"valueformat": ".0%", "font": {"size": 20}},
-        domain={'row': 2, 'column': 2}, title={"text": "Percentual", "font": {"size": 12}}
-    ))
+    indicadores = [
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['DES.C/P.'], domain={'row': 0, 'column': 0},
+            title={"text": "Des.C/P.", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['C.A.-Pró'], domain={'row': 1, 'column': 0},
+            title={"text": "C.A. - Pró", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=efetividade_desarme_com_posse, number={"valueformat": ".0%", "font": {"size": 20}},
+            domain={'row': 2, 'column': 0}, title={"text": "Efetividade", "font": {"size": 12}}
+        ),
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['DES.S/P.'], domain={'row': 1, 'column': 1},
+            title={"text": "Des.S/P.", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['PER.P.'], domain={'row': 0, 'column': 2},
+            title={"text": "Per.P.", "font": {"size": 12}}, number={"font": {"size": 20}}
+        ),
+        dict(type='indicator',
+            mode="number", value=estatisticas_totais_dict['C.A.-Contra'], number={"font": {"size": 20}},
+            domain={'row': 1, 'column': 2}, title={"text": "C.A Sofrido", "font": {"size": 12}}
+        ),
+        dict(type='indicator',
+            mode="number", value=percentual_perda_de_posse, number={"valueformat": ".0%", "font": {"size": 20}},
+            domain={'row': 2, 'column': 2}, title={"text": "Percentual", "font": {"size": 12}}
+        ),
+    ]
 
-    estatisticas_gerais_fig.update_layout(
+    return figura_de_especificacao(indicadores, dict(
         grid={'rows': 3, 'columns': 3, 'pattern': "independent"},
-        template="plotly_dark", height=270, margin_t=20, margin_r=5
-    )
-    return estatisticas_gerais_fig
+        template=tema_plotly(), height=270, margin=dict(t=20, r=5)
+    ))
 
 
 def plotar_grafico_barras(estatisticas_primeiro_tempo_dict, estatisticas_segundo_tempo_dict, mean_primeiro_tempo, mean_segundo_tempo):
@@ -376,45 +1062,47 @@ def plotar_grafico_barras(estatisticas_primeiro_tempo_dict, estatisticas_segundo
     Returns:
         plotly.graph_objects.Figure: Uma figura Plotly com gráficos de barras comparativos.
     """
-    categorias = ['FIN.C', 'FIN.E', 'FIN.T', 'DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra', "FIN.S.C", "FIN.S.E", "FIN.S.T"]
+    categorias = CATEGORIAS_MEDIA
     valores_1T = [estatisticas_primeiro_tempo_dict.get(categoria, 0) for categoria in categorias]
     valores_2T = [estatisticas_segundo_tempo_dict.get(categoria, 0) for categoria in categorias]
 
     cores = ['rgba(0, 255, 0, 0.6)', 'rgba(255, 0, 0, 0.6)', 'rgba(255, 255, 0, 0.6)',
              'rgba(0, 0, 255, 0.6)', 'rgba(0, 255, 255, 0.6)', 'rgba(128, 0, 128, 0.6)', 'rgba(0, 60, 0, 1.0)', 'rgba(255, 165, 0, 1.0)', 'rgba(0, 255, 255, 0.6)']
 
-    fig = make_subplots(
-        rows=1, cols=2, subplot_titles=('1º Tempo', '2º Tempo'), shared_yaxes=True
-    )
+    layout = layout_subplots(1, 2, ('1º Tempo', '2º Tempo'), shared_yaxes=True)
 
-    fig.add_trace(go.Bar(
-        x=categorias, y=valores_1T, name='1º Tempo', marker_color=cores,
-        text=valores_1T, textposition='inside', insidetextanchor='start', textfont=dict(color="black")
-    ), row=1, col=1)
-
-    fig.add_trace(go.Bar(
-        x=categorias, y=valores_2T, name='2º Tempo', marker_color=cores,
-        text=valores_2T, textposition='inside', insidetextanchor='start', textfont=dict(color="black")
-    ), row=1, col=2)
-
-    fig.add_trace(go.Scatter(
-        x=categorias, y=mean_primeiro_tempo, mode="lines+markers+text",
-        text=[f"{m:.2f}" for m in mean_primeiro_tempo], textposition="top center",
-        marker=dict(size=8, color="white"), line=dict(width=2, color="cyan"), name="Média Primeiro Tempo"
-    ), row=1, col=1)
-
-    fig.add_trace(go.Scatter(
-        x=categorias, y=mean_segundo_tempo, mode="lines+markers+text",
-        text=[f"{m:.2f}" for m in mean_segundo_tempo], textposition="top center",
-        marker=dict(size=8, color="white"), line=dict(width=2, color="cyan"), name="Média Segundo Tempo"
-    ), row=1, col=2)
+    tracos = [
+        dict(type='bar',
+            x=categorias, y=valores_1T, name='1º Tempo', marker=dict(color=cores),
+            text=[str(valor) for valor in valores_1T], textposition='inside', insidetextanchor='start', textfont=dict(color="black"),
+            xaxis='x', yaxis='y'
+        ),
+        dict(type='bar',
+            x=categorias, y=valores_2T, name='2º Tempo', marker=dict(color=cores),
+            text=[str(valor) for valor in valores_2T], textposition='inside', insidetextanchor='start', textfont=dict(color="black"),
+            xaxis='x2', yaxis='y2'
+        ),
+        dict(type='scatter',
+            x=categorias, y=mean_primeiro_tempo, mode="lines+markers+text",
+            text=[f"{m:.2f}" for m in mean_primeiro_tempo], textposition="top center",
+            marker=dict(size=8, color="white"), line=dict(width=2, color="cyan"), name="Média Primeiro Tempo",
+            xaxis='x', yaxis='y'
+        ),
+        dict(type='scatter',
+            x=categorias, y=mean_segundo_tempo, mode="lines+markers+text",
+            text=[f"{m:.2f}" for m in mean_segundo_tempo], textposition="top center",
+            marker=dict(size=8, color="white"), line=dict(width=2, color="cyan"), name="Média Segundo Tempo",
+            xaxis='x2', yaxis='y2'
+        ),
+    ]
 
-    fig.update_layout(
+    return figura_de_especificacao(tracos, dict(
+        layout,
         title={'text': 'Comparação de Ações por Tempo', 'x': 0.5, 'xanchor': 'center', 'y': 0.95},
-        yaxis_title='Quantidade', barmode='group', template='plotly_dark', showlegend=False,
+        yaxis=dict(layout['yaxis'], title={'text': 'Quantidade'}),
+        barmode='group', template=tema_plotly(), showlegend=False,
         height=450, margin=dict(t=80)
-    )
-    return fig
+    ))
 
 def plotar_grafico_barras_jogador(estatisticas_primeiro_tempo_dict, estatisticas_segundo_tempo_dict, mean_primeiro_tempo, mean_segundo_tempo,posicao):
     """
@@ -431,12 +1119,10 @@ def plotar_grafico_barras_jogador(estatisticas_primeiro_tempo_dict, estatisticas
         plotly.graph_objects.Figure: Uma figura Plotly com gráficos de barras comparativos para o jogador.
     """
     
-    if posicao == 'Goleiro':    
-        categorias = ['DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra','FIN.S.C', 'FIN.S.E', 'FIN.S.T', ]
-        mean_primeiro_tempo = mean_primeiro_tempo[3:]
-        mean_segundo_tempo = mean_segundo_tempo[3:]
-    else:
-        categorias = ['FIN.C', 'FIN.E', 'FIN.T', 'DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra']   
+    categorias = jogadas_da_posicao(posicao)["Barras"]
+    indices_media = [CATEGORIAS_MEDIA.index(categoria) for categoria in categorias]
+    mean_primeiro_tempo = mean_primeiro_tempo[indices_media]
+    mean_segundo_tempo = mean_segundo_tempo[indices_media]
     
     valores_1T = [estatisticas_primeiro_tempo_dict.get(categoria, 0) for categoria in categorias]
     valores_2T = [estatisticas_segundo_tempo_dict.get(categoria, 0) for categoria in categorias]
@@ -444,38 +1130,41 @@ def plotar_grafico_barras_jogador(estatisticas_primeiro_tempo_dict, estatisticas
     cores = ['rgba(0, 255, 0, 0.6)', 'rgba(255, 0, 0, 0.6)', 'rgba(255, 255, 0, 0.6)',
              'rgba(0, 0, 255, 0.6)', 'rgba(0, 255, 255, 0.6)', 'rgba(128, 0, 128, 0.6)', 'rgba(0, 60, 0, 1.0)', 'rgba(255, 165, 0, 1.0)']
 
-    fig = make_subplots(
-        rows=1, cols=2, subplot_titles=('1º Tempo', '2º Tempo'), shared_yaxes=True
-    )
+    layout = layout_subplots(1, 2, ('1º Tempo', '2º Tempo'), shared_yaxes=True)
 
-    fig.add_trace(go.Bar(
-        x=categorias, y=valores_1T, name='1º Tempo', marker_color=cores,
-        text=valores_1T, textposition='inside', insidetextanchor='start', textfont=dict(color="black")
-    ), row=1, col=1)
-
-    fig.add_trace(go.Bar(
-        x=categorias, y=valores_2T, name='2º Tempo', marker_color=cores,
-        text=valores_2T, textposition='inside', insidetextanchor='start', textfont=dict(color="black")
-    ), row=1, col=2)
-
-    fig.add_trace(go.Scatter(
-        x=categorias, y=mean_primeiro_tempo, mode="lines+markers+text",
-        text=[f"{m:.2f}" for m in mean_primeiro_tempo], textposition="top center",
-        marker=dict(size=8, color="white"), line=dict(width=2, color="cyan"), name="Média Primeiro Tempo"
-    ), row=1, col=1)
-
-    fig.add_trace(go.Scatter(
-        x=categorias, y=mean_segundo_tempo, mode="lines+markers+text",
-        text=[f"{m:.2f}" for m in mean_segundo_tempo], textposition="top center",
-        marker=dict(size=8, color="white"), line=dict(width=2, color="cyan"), name="Média Segundo Tempo"
-    ), row=1, col=2)
+    tracos = [
+        dict(type='bar',
+            x=categorias, y=valores_1T, name='1º Tempo', marker=dict(color=cores),
+            text=[str(valor) for valor in valores_1T], textposition='inside', insidetextanchor='start', textfont=dict(color="black"),
+            xaxis='x', yaxis='y'
+        ),
+        dict(type='bar',
+            x=categorias, y=valores_2T, name='2º Tempo', marker=dict(color=cores),
+            text=[str(valor) for valor in valores_2T], textposition='inside', insidetextanchor='start', textfont=dict(color="black"),
+            xaxis='x2', yaxis='y2'
+        ),
+        dict(type='scatter',
+            x=categorias, y=mean_primeiro_tempo, mode="lines+markers+text",
+            text=[f"{m:.2f}" for m in mean_primeiro_tempo], textposition="top center",
+            marker=dict(size=8, color="white"), line=dict(width=2, color="cyan"), name="Média Primeiro Tempo",
+            xaxis='x', yaxis='y'
+        ),
+        dict(type='scatter',
+            x=categorias, y=mean_segundo_tempo, mode="lines+markers+text",
+            text=[f"{m:.2f}" for m in mean_segundo_tempo], textposition="top center",
+            marker=dict(size=8, color="white"), line=dict(width=2, color="cyan"), name="Média Segundo Tempo",
+            xaxis='x2', yaxis='y2'
+        ),
+    ]
 
-    fig.update_layout(
+    return figura_de_especificacao(tracos, dict(
+        layout,
         title={'text': 'Comparação de Ações por Tempo', 'x': 0.5, 'xanchor': 'center', 'y': 0.95},
-        xaxis_title='Tipo de Ação', yaxis_title='Quantidade', barmode='group', template='plotly_dark',
-        showlegend=False, height=450, margin=dict(t=80)
-    )
-    return fig
+        xaxis=dict(layout['xaxis'], title={'text': 'Tipo de Ação'}),
+        yaxis=dict(layout['yaxis'], title={'text': 'Quantidade'}),
+        barmode='group', template=tema_plotly(), showlegend=False,
+        height=450, margin=dict(t=80)
+    ))
 
 def plotar_grafico_barras_parcial(estatisticas_parciais_dict, mean):
     """
@@ -489,10 +1178,10 @@ def plotar_grafico_barras_parcial(estatisticas_parciais_dict, mean):
     Returns:
         plotly.graph_objects.Figure: Uma figura Plotly com gráficos de barras para ataque e defesa.
     """
-    categorias_ataque = ['FIN.C', 'FIN.E', 'FIN.T', 'DES.C/P.', 'C.A.-Pró']
-    categorias_defesa = ['DES.S/P.', 'PER.P.', 'C.A.-Contra', "FIN.S.C", "FIN.S.E", "FIN.S.T"]
-    mean_ataque = [mean[i] for i in range(len(categorias_ataque))]
-    mean_defesa = [mean[i] for i in range(len(categorias_ataque), len(categorias_ataque) + len(categorias_defesa))]
+    categorias_ataque = JOGADAS_ATAQUE
+    categorias_defesa = JOGADAS_DEFESA
+    mean_ataque = mean[:len(categorias_ataque)]
+    mean_defesa = mean[len(categorias_ataque):len(categorias_ataque) + len(categorias_defesa)]
 
     valores_ataque = np.array([estatisticas_parciais_dict.get(categoria, 0) for categoria in categorias_ataque])
     valores_defesa = np.array([estatisticas_parciais_dict.get(categoria, 0) for categoria in categorias_defesa])
@@ -500,37 +1189,39 @@ def plotar_grafico_barras_parcial(estatisticas_parciais_dict, mean):
     cores = ['rgba(0, 255, 0, 0.6)', 'rgba(255, 0, 0, 0.6)', 'rgba(255, 255, 0, 0.6)',
              'rgba(0, 0, 255, 0.6)', 'rgba(0, 255, 255, 0.6)', 'rgba(128, 0, 128, 0.6)', 'rgba(0, 60, 0, 1.0)', 'rgba(255, 165, 0, 1.0)', 'rgba(0, 255, 255, 0.6)']
 
-    fig = make_subplots(
-        rows=1, cols=2, subplot_titles=('Ataque', 'Defesa'), shared_yaxes=True
-    )
-
-    fig.add_trace(go.Bar(
-        x=categorias_ataque, y=valores_ataque, name='Ataque', marker_color=cores[:len(categorias_ataque)],
-        text=valores_ataque, textposition='inside', insidetextanchor='end', textfont=dict(color="black")
-    ), row=1, col=1)
+    layout = layout_subplots(1, 2, ('Ataque', 'Defesa'), shared_yaxes=True)
 
-    fig.add_trace(go.Bar(
-        x=categorias_defesa, y=valores_defesa, name='Defesa', marker_color=cores[len(categorias_ataque):],
-        text=valores_defesa, textposition='inside', insidetextanchor='end', textfont=dict(color="black")
-    ), row=1, col=2)
-
-    fig.add_trace(go.Scatter(
-        x=categorias_ataque, y=mean_ataque, mode="lines+markers+text",
-        text=[f"{m:.2f}" for m in mean_ataque], textposition="top center",
-        marker=dict(size=8, color="white"), line=dict(width=2, color="cyan"), name="Média Ataque"
-    ), row=1, col=1)
-
-    fig.add_trace(go.Scatter(
-        x=categorias_defesa, y=mean_defesa, mode="lines+markers+text",
-        text=[f"{m:.2f}" for m in mean_defesa], textposition="top center",
-        marker=dict(size=8, color="white"), line=dict(width=2, color="cyan"), name="Média Defesa"
-    ), row=1, col=2)
+    tracos = [
+        dict(type='bar',
+            x=categorias_ataque, y=valores_ataque, name='Ataque', marker=dict(color=cores[:len(categorias_ataque)]),
+            text=valores_ataque, textposition='inside', insidetextanchor='end', textfont=dict(color="black"),
+            xaxis='x', yaxis='y'
+        ),
+        dict(type='bar',
+            x=categorias_defesa, y=valores_defesa, name='Defesa', marker=dict(color=cores[len(categorias_ataque):]),
+            text=valores_defesa, textposition='inside', insidetextanchor='end', textfont=dict(color="black"),
+            xaxis='x2', yaxis='y2'
+        ),
+        dict(type='scatter',
+            x=categorias_ataque, y=mean_ataque, mode="lines+markers+text",
+            text=[f"{m:.2f}" for m in mean_ataque], textposition="top center",
+            marker=dict(size=8, color="white"), line=dict(width=2, color="cyan"), name="Média Ataque",
+            xaxis='x', yaxis='y'
+        ),
+        dict(type='scatter',
+            x=categorias_defesa, y=mean_defesa, mode="lines+markers+text",
+            text=[f"{m:.2f}" for m in mean_defesa], textposition="top center",
+            marker=dict(size=8, color="white"), line=dict(width=2, color="cyan"), name="Média Defesa",
+            xaxis='x2', yaxis='y2'
+        ),
+    ]
 
-    fig.update_layout(
-        yaxis_title='Quantidade', barmode='group', template='plotly_dark', showlegend=False,
+    return figura_de_especificacao(tracos, dict(
+        layout,
+        yaxis=dict(layout['yaxis'], title={'text': 'Quantidade'}),
+        barmode='group', template=tema_plotly(), showlegend=False,
         height=450, margin=dict(t=80)
-    )
-    return fig
+    ))
 
 def plotar_grafico_barras_parcial_jogador(estatisticas_parciais_dict, mean,posicao):
     """
@@ -545,34 +1236,31 @@ def plotar_grafico_barras_parcial_jogador(estatisticas_parciais_dict, mean,posic
     Returns:
         plotly.graph_objects.Figure: Uma figura Plotly com o gráfico de barras das ações do jogador.
     """
-    if posicao == "Goleiro":
-        categorias = [ 'DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra','FIN.S.C', 'FIN.S.E', 'FIN.S.T'] 
-        mean = mean[3:]
-    else:    
-        categorias = ['FIN.C', 'FIN.E', 'FIN.T', 'DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra']
+    categorias = jogadas_da_posicao(posicao)["Barras"]
+    mean = mean[[CATEGORIAS_MEDIA.index(categoria) for categoria in categorias]]
     
     
     valores = np.array([estatisticas_parciais_dict.get(categoria, 0) for categoria in categorias])
     cores = ['rgba(0, 255, 0, 0.6)', 'rgba(255, 0, 0, 0.6)', 'rgba(255, 255, 0, 0.6)',
              'rgba(0, 0, 255, 0.6)', 'rgba(0, 255, 255, 0.6)', 'rgba(128, 0, 128, 0.6)', 'rgba(0, 60, 0, 1.0)', 'rgba(255, 165, 0, 1.0)']
 
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        x=categorias, y=valores, marker_color=cores,
-        text=valores, textposition='inside', insidetextanchor='start', textfont=dict(color="black")
-    ))
-    fig.add_trace(go.Scatter(
-        x=categorias, y=mean, mode="lines+markers+text",
-        text=[f"{m:.2f}" for m in mean], textposition="top center",
-        marker=dict(size=9, color="white"), line=dict(width=2, color="cyan"), name="Média"
-    ))
+    tracos = [
+        dict(type='bar',
+            x=categorias, y=valores, marker=dict(color=cores),
+            text=valores, textposition='inside', insidetextanchor='start', textfont=dict(color="black")
+        ),
+        dict(type='scatter',
+            x=categorias, y=mean, mode="lines+markers+text",
+            text=[f"{m:.2f}" for m in mean], textposition="top center",
+            marker=dict(size=9, color="white"), line=dict(width=2, color="cyan"), name="Média"
+        ),
+    ]
 
-    fig.update_layout(
+    return figura_de_especificacao(tracos, dict(
         title={'text': 'Ações', 'x': 0.5, 'xanchor': 'center', 'y': 0.95},
-        xaxis_title='Tipo de Ação', yaxis_title='Quantidade', barmode='group', template='plotly_dark',
-        showlegend=False, height=450, margin=dict(t=60)
-    )
-    return fig
+        xaxis=dict(title={'text': 'Tipo de Ação'}), yaxis=dict(title={'text': 'Quantidade'}),
+        barmode='group', template=tema_plotly(), showlegend=False, height=450, margin=dict(t=60)
+    ))
 
 
 def plotar_historico(estatisticas_primeiro_tempo_dict, estatisticas_segundo_tempo_dict, numero_jogos):
@@ -689,10 +1377,7 @@ def plotar_radar_chart(estatisticas_totais_dict, estatisticas_geral_totais_dict,
     Returns:
         plotly.graph_objects.Figure: Uma figura Plotly com o gráfico de radar.
     """
-    if posicao == "Goleiro":
-        theta = ['FIN.S.C', 'FIN.S.E', 'FIN.S.T', 'DES.C/P.', 'DES.S/P.', 'PER.P.']
-    else:
-        theta = ['FIN.C', 'FIN.E', 'FIN.T', 'DES.C/P.', 'DES.S/P.', 'PER.P.']
+    theta = jogadas_da_posicao(posicao)["Radar"]
 
     numerador = [estatisticas_totais_dict.get(i, 0) for i in theta]
     denominador = [estatisticas_geral_totais_dict.get(i, 0) for i in theta]
@@ -701,14 +1386,13 @@ def plotar_radar_chart(estatisticas_totais_dict, estatisticas_geral_totais_dict,
 
     valores.append(valores[0]) # Fechar o ciclo
 
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(
+    radar = dict(type='scatterpolar',
         r=valores, theta=theta + [theta[0]], fill='toself', name="Desempenho",
         text=[f"{v:.1%}" for v in valores], # Formato de porcentagem com uma casa decimal
         hoverinfo="text",
-    ))
+    )
 
-    fig.update_layout(
+    return figura_de_especificacao([radar], dict(
         polar=dict(
             radialaxis=dict(
                 visible=True, range=[0, 1.0], showticklabels=True,
@@ -716,10 +1400,9 @@ def plotar_radar_chart(estatisticas_totais_dict, estatisticas_geral_totais_dict,
                 tickformat="%", tickangle=0,
             ),
         ),
-        showlegend=False, template="plotly_dark",
+        showlegend=False, template=tema_plotly(),
         title=dict(text='Radar de Ações: Percentual em Relação ao Time', x=0.5, xanchor='center', yanchor='top')
-    )
-    return fig
+    ))
 
 def create_arc(x_center, y_center, radius, theta1, theta2, color='gray', width=2):
     """
@@ -745,23 +1428,26 @@ def create_arc(x_center, y_center, radius, theta1, theta2, color='gray', width=2
     y = y_center + radius * np.sin(theta)
     return dict(type='scatter', x=x, y=y, mode='lines', line=dict(color=color, width=width)), (x[0], y[0]), (x[-1], y[-1])
 
-def create_futsal_court(titulo, heatmap_data, line_color='white'):
+@lru_cache(maxsize=None)
+def geometria_quadra(line_color='white'):
     """
-    Cria uma figura Plotly representando uma quadra de futsal com um heatmap
-    sobreposto para visualizar a distribuição de jogadas.
+    Calcula uma única vez, por cor de linha, as partes fixas da quadra de futsal: os arcos,
+    o círculo central, as linhas e o layout. As figuras de `create_futsal_court` só
+    acrescentam o heatmap e o título.
+
+    O tema "plotly_dark" entra apenas com a sua parte de layout: os padrões de traços do tema
+    são sobrescritos pelos estilos explícitos da quadra e só encareceriam a validação de cada figura.
 
     Args:
-        titulo (str): Título do gráfico da quadra.
-        heatmap_data (list or np.array): Dados para o heatmap, que serão remodelados para 6x3.
         line_color (str, optional): Cor das linhas da quadra. Padrão é 'white'.
 
     Returns:
-        plotly.graph_objects.Figure: Uma figura Plotly da quadra de futsal com heatmap.
+        tuple: Uma tupla contendo:
+               - tuple: Dicionários dos traços da quadra.
+               - dict: Dicionário do layout da quadra, com as formas e sem título.
     """
     fig = go.Figure()
-    width, height, radius = 280, 470, 60
-    heatmap_data = np.array(heatmap_data).reshape(6,3)
-    heatmap_data = np.flipud(heatmap_data)
+    height, radius = 470, 60
 
     # Adicionar arcos
     arc_left_bottom, left_bottom_start, left_bottom_end = create_arc(-30, 0, radius, 90, 180, line_color, 2)
@@ -787,17 +1473,50 @@ def create_futsal_court(titulo, heatmap_data, line_color='white'):
     fig.add_trace(go.Scatter(x=x_center_circle, y=y_center_circle, mode='lines', line=dict(color=line_color, width=2)))
     
     fig.add_shape(type='rect', x0=-140, y0=0, x1=140, y1=height, line=dict(color=line_color, width=2))
+
+    fig.update_layout(
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False, scaleanchor="x", scaleratio=1),
+        showlegend=False,
+        plot_bgcolor='#121212',
+        height=250,
+        margin_t=10,
+        margin_b= 10,
+    )
+    quadra = fig.to_dict()
+    quadra["layout"]["template"] = {"layout": pio.templates["plotly_dark"].layout.to_plotly_json()}
+    return tuple(quadra["data"]), quadra["layout"]
+
+def create_futsal_court(titulo, heatmap_data, line_color='white'):
+    """
+    Cria uma figura Plotly representando uma quadra de futsal com um heatmap
+    sobreposto para visualizar a distribuição de jogadas.
+
+    Args:
+        titulo (str): Título do gráfico da quadra.
+        heatmap_data (np.array): Matriz [linha, coluna] de contagens, de qualquer grade (ou as 18
+                                 contagens da grade padrão em sequência).
+        line_color (str, optional): Cor das linhas da quadra. Padrão é 'white'.
+
+    Returns:
+        plotly.graph_objects.Figure: Uma figura Plotly da quadra de futsal com heatmap.
+    """
+    tracos_quadra, layout_quadra = geometria_quadra(line_color)
+    width = 280
+    heatmap_data = np.asarray(heatmap_data)
+    if heatmap_data.ndim == 1:
+        heatmap_data = heatmap_data.reshape(GRADE_PADRAO)
+    linhas, colunas = heatmap_data.shape
+    heatmap_data = np.flipud(heatmap_data)
     
     # Criar Heatmap
-    x_edges = np.linspace(-140, 140, 4)  # 3 colunas
-    y_edges = np.linspace(0, 470, 7)  # 6 linhas
-    
-    x_heatmap = [(x_edges[i] + x_edges[i + 1]) / 2 for i in range(len(x_edges) - 1)]
-    y_heatmap = [(y_edges[i] + y_edges[i + 1]) / 2 for i in range(len(y_edges) - 1)]
+    y_edges, x_edges = bordas_grade(linhas, colunas)
+    x_heatmap = (x_edges[:-1] + x_edges[1:]) / 2 - width / 2
+    y_heatmap = (y_edges[:-1] + y_edges[1:]) / 2
     
     custom_colorscale = [[0.0, "green"], [0.33, "yellow"], [0.66, "orange"], [1.0, "red"]]
     
-    heatmap_trace = go.Heatmap(
+    heatmap_trace = dict(type='heatmap',
     z=heatmap_data,
     x=x_heatmap,
     y=y_heatmap,
@@ -808,45 +1527,364 @@ def create_futsal_court(titulo, heatmap_data, line_color='white'):
     showscale=False,
     text=heatmap_data.astype(str),  # Mostra os valores
     texttemplate="%{text}",  # Define o formato dos textos
-    textfont={"size": 17, "color": "white"}  # Ajusta o tamanho e cor dos textos
+    textfont={"size": 17 if linhas * colunas <= NUMERO_ZONAS else 9, "color": "white"}  # Ajusta o tamanho e cor dos textos
 )
     
-    fig.add_trace(heatmap_trace)
-    
-    fig.update_layout(
-        title=dict(text=titulo, x=0.5, xanchor='center', yanchor='top'),
-        xaxis=dict(visible=False),
-        yaxis=dict(visible=False, scaleanchor="x", scaleratio=1),
+    layout = dict(layout_quadra, title=dict(text=titulo, x=0.5, xanchor='center', yanchor='top'))
+    return figura_de_especificacao([*tracos_quadra, heatmap_trace], layout)
+
+
+@lru_cache(maxsize=None)
+def contorno_quadra(line_color='white'):
+    """
+    Junta as linhas de `geometria_quadra` (arcos, círculo central, linhas e retângulo) em um único
+    traço, com os segmentos separados por None e os arcos com menos pontos, para ser repetido em
+    cada quadra de uma figura única.
+
+    Args:
+        line_color (str, optional): Cor das linhas da quadra. Padrão é 'white'.
+
+    Returns:
+        dict: Dicionário de configuração do traço Scatter das linhas da quadra.
+    """
+    tracos_quadra, layout_quadra = geometria_quadra(line_color)
+    x, y = [], []
+    for traco in tracos_quadra:
+        # Um a cada cinco pontos dos arcos basta no tamanho de cada quadra da figura única
+        amostra = np.r_[0:len(traco["x"]):5, len(traco["x"]) - 1]
+        x += list(np.round(traco["x"][amostra], 1)) + [None]
+        y += list(np.round(traco["y"][amostra], 1)) + [None]
+    for forma in layout_quadra["shapes"]:
+        if forma["type"] == "rect":
+            x += [forma["x0"], forma["x1"], forma["x1"], forma["x0"], forma["x0"], None]
+            y += [forma["y0"], forma["y0"], forma["y1"], forma["y1"], forma["y0"], None]
+        else:
+            x += [round(forma["x0"], 1), round(forma["x1"], 1), None]
+            y += [round(forma["y0"], 1), round(forma["y1"], 1), None]
+    return dict(type='scatter', x=x, y=y, mode='lines', hoverinfo='skip', line=dict(color=line_color, width=2))
+
+def create_futsal_court_grid(titulos, matrizes, colunas, line_color='white'):
+    """
+    Cria uma única figura Plotly com uma quadra de futsal por matriz, lado a lado, em vez de
+    uma figura por quadra. As quadras compartilham o mesmo traço de linhas e o mesmo eixo de
+    cores, de modo que as cores são comparáveis entre as quadras.
+
+    Args:
+        titulos (list): Título de cada quadra.
+        matrizes (list): Matrizes [linha, coluna] de contagens, como em `create_futsal_court`.
+        colunas (int): Número de quadras por linha da figura.
+        line_color (str, optional): Cor das linhas da quadra. Padrão é 'white'.
+
+    Returns:
+        plotly.graph_objects.Figure: Uma figura Plotly com as quadras de futsal e seus heatmaps.
+    """
+    width = 280
+    linhas_figura = max(-(-len(matrizes) // colunas), 1)
+    espaco_x, espaco_y = 0.02, 0.1 / linhas_figura
+    largura = (1 - (colunas - 1) * espaco_x) / colunas
+    altura = (1 - (linhas_figura - 1) * espaco_y) / linhas_figura
+    contorno = contorno_quadra(line_color)
+    tracos_quadra, layout_quadra = geometria_quadra(line_color)
+    matrizes = [np.asarray(matriz) for matriz in matrizes]
+    matrizes = [matriz.reshape(GRADE_PADRAO) if matriz.ndim == 1 else matriz for matriz in matrizes]
+    zmax = max((matriz.max() for matriz in matrizes if matriz.size), default=0)
+
+    # Eixos e títulos montados direto no layout: make_subplots e update_layout por quadra
+    # custariam mais que o próprio conteúdo da figura
+    tracos, anotacoes = [], []
+    layout = dict(
+        coloraxis=dict(colorscale=[[0.0, "green"], [0.33, "yellow"], [0.66, "orange"], [1.0, "red"]], cmin=0, cmax=zmax, showscale=False),
         showlegend=False,
         plot_bgcolor='#121212',
-        template="plotly_dark",
-        height=250,
-        margin_t=10,
-        margin_b= 10,
+        template=layout_quadra["template"],
+        height=250 * linhas_figura,
+        margin=dict(t=30, b=10, l=10, r=10),
+    )
+    for i, (titulo, matriz) in enumerate(zip(titulos, matrizes)):
+        sufixo = str(i + 1) if i else ""
+        x0 = (i % colunas) * (largura + espaco_x)
+        y1 = 1 - (i // colunas) * (altura + espaco_y)
+        layout[f"xaxis{sufixo}"] = dict(domain=[x0, x0 + largura], anchor=f"y{sufixo}", visible=False)
+        layout[f"yaxis{sufixo}"] = dict(domain=[y1 - altura, y1], anchor=f"x{sufixo}", visible=False, scaleanchor=f"x{sufixo}", scaleratio=1)
+        anotacoes.append(dict(text=titulo, x=x0 + largura / 2, y=y1, xref="paper", yref="paper", xanchor="center", yanchor="bottom", showarrow=False, font=dict(size=16)))
+
+        linhas, colunas_grade = matriz.shape
+        y_edges, x_edges = bordas_grade(linhas, colunas_grade)
+        tracos.append(dict(contorno, xaxis=f"x{sufixo}", yaxis=f"y{sufixo}"))
+        tracos.append(dict(
+            type='heatmap',
+            z=np.flipud(matriz),
+            x=(x_edges[:-1] + x_edges[1:]) / 2 - width / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            xaxis=f"x{sufixo}",
+            yaxis=f"y{sufixo}",
+            coloraxis="coloraxis",
+            opacity=0.6,
+            texttemplate="%{z}",
+            textfont={"size": 17 if linhas * colunas_grade <= NUMERO_ZONAS else 9, "color": "white"}
+        ))
+    layout["annotations"] = anotacoes
+    return figura_de_especificacao(tracos, layout)
+
+
+# Cache em disco das quadras renderizadas como PNG. Aumente a versão ao mudar o desenho,
+# para que as imagens antigas deixem de ser usadas.
+DIRETORIO_CACHE_QUADRAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "quadras")
+VERSAO_DESENHO_QUADRA = 1
+
+def chave_quadra_png(titulo, matriz, line_color='white'):
+    """
+    Calcula a chave do cache de imagens de uma quadra: o sha256 do conteúdo e do formato
+    da matriz (a grade), do título, da cor das linhas e da versão do desenho.
+
+    Args:
+        titulo (str): Título da quadra.
+        matriz (np.ndarray): Matriz [linha, coluna] de contagens.
+        line_color (str, optional): Cor das linhas da quadra. Padrão é 'white'.
+
+    Returns:
+        str: O hash hexadecimal que nomeia o arquivo da imagem.
+    """
+    matriz = np.ascontiguousarray(matriz, dtype=np.int64)
+    hash_quadra = hashlib.sha256()
+    hash_quadra.update(f"{VERSAO_DESENHO_QUADRA}|{titulo}|{line_color}|{matriz.shape}|".encode())
+    hash_quadra.update(matriz.tobytes())
+    return hash_quadra.hexdigest()
+
+def desenhar_quadra_png(titulo, matriz, line_color='white'):
+    """
+    Desenha com matplotlib a mesma quadra de `create_futsal_court`, como imagem estática.
+
+    Args:
+        titulo (str): Título da quadra.
+        matriz (np.ndarray): Matriz [linha, coluna] de contagens.
+        line_color (str, optional): Cor das linhas da quadra. Padrão é 'white'.
+
+    Returns:
+        bytes: O conteúdo PNG da imagem.
+    """
+    tracos_quadra, layout_quadra = geometria_quadra(line_color)
+    width = 280
+    linhas, colunas = matriz.shape
+    y_edges, x_edges = bordas_grade(linhas, colunas)
+    x_centros = (x_edges[:-1] + x_edges[1:]) / 2 - width / 2
+    y_centros = (y_edges[:-1] + y_edges[1:]) / 2
+    valores = np.flipud(matriz)
+    cores = LinearSegmentedColormap.from_list("quadra", [(0.0, "green"), (0.33, "yellow"), (0.66, "orange"), (1.0, "red")])
+
+    # Figure direto, sem pyplot, para poder desenhar em várias sessões ao mesmo tempo
+    fig = Figure(figsize=(2.4, 3.6), dpi=100, facecolor="#111111")
+    ax = fig.add_axes([0.02, 0.02, 0.96, 0.86])
+    ax.set_facecolor("#121212")
+    ax.pcolormesh(x_edges - width / 2, y_edges, valores, cmap=cores, vmin=0, vmax=max(valores.max(), 1), alpha=0.6)
+    for traco in tracos_quadra:
+        ax.plot(traco["x"], traco["y"], color=line_color, linewidth=1.5)
+    for forma in layout_quadra["shapes"]:
+        if forma["type"] == "rect":
+            ax.plot([forma["x0"], forma["x1"], forma["x1"], forma["x0"], forma["x0"]], [forma["y0"], forma["y0"], forma["y1"], forma["y1"], forma["y0"]], color=line_color, linewidth=1.5)
+        else:
+            ax.plot([forma["x0"], forma["x1"]], [forma["y0"], forma["y1"]], color=line_color, linewidth=1.5)
+    tamanho_fonte = 12 if linhas * colunas <= NUMERO_ZONAS else 6
+    for i, y in enumerate(y_centros):
+        for j, x in enumerate(x_centros):
+            ax.text(x, y, str(valores[i, j]), color="white", fontsize=tamanho_fonte, ha="center", va="center")
+    ax.set_xlim(-width / 2 - 5, width / 2 + 5)
+    ax.set_ylim(-5, y_edges[-1] + 5)
+    ax.set_aspect("equal")
+    ax.axis("off")
+    fig.suptitle(titulo, color="white", fontsize=11, y=0.97)
+
+    buffer = BytesIO()
+    fig.savefig(buffer, format="png", facecolor=fig.get_facecolor())
+    return buffer.getvalue()
+
+def renderizar_quadra_png(titulo, matriz, line_color='white'):
+    """
+    Retorna a quadra de futsal com heatmap como PNG, desenhando-a só na primeira vez:
+    as imagens ficam em `DIRETORIO_CACHE_QUADRAS`, nomeadas pelo hash de `chave_quadra_png`.
 
-    )
-    
-    return fig
+    Args:
+        titulo (str): Título da quadra.
+        matriz (np.ndarray): Matriz [linha, coluna] de contagens (ou as 18 contagens da grade padrão em sequência).
+        line_color (str, optional): Cor das linhas da quadra. Padrão é 'white'.
+
+    Returns:
+        bytes: O conteúdo PNG da imagem.
+    """
+    matriz = np.asarray(matriz)
+    if matriz.ndim == 1:
+        matriz = matriz.reshape(GRADE_PADRAO)
+    caminho = os.path.join(DIRETORIO_CACHE_QUADRAS, f"{chave_quadra_png(titulo, matriz, line_color)}.png")
 
+    try:
+        with open(caminho, "rb") as arquivo:
+            return arquivo.read()
+    except OSError:
+        pass
 
-def pegar_imagem_jogador(image_id):
+    png = desenhar_quadra_png(titulo, matriz, line_color)
+    try:
+        os.makedirs(DIRETORIO_CACHE_QUADRAS, exist_ok=True)
+        escrever_arquivo_atomico(caminho, png)
+    except OSError as e:
+        print(f"Erro ao salvar imagem da quadra no cache: {e}")
+    return png
+
+
+# Cache em disco das fotos de jogadores e logos, compartilhado entre as sessões e os reinícios do app.
+# As imagens usadas há mais tempo são descartadas quando o total passa do limite, e uma imagem só é
+# revalidada no servidor (ETag / Last-Modified) depois de VALIDADE_IMAGENS_SEGUNDOS.
+DIRETORIO_CACHE_IMAGENS = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "imagens")
+LIMITE_CACHE_IMAGENS_BYTES = 50 * 1024 * 1024
+VALIDADE_IMAGENS_SEGUNDOS = 24 * 60 * 60
+MAXIMO_DOWNLOADS_SIMULTANEOS = 4
+
+@st.cache_resource
+def recursos_imagens():
+    """
+    Recursos de download de imagens compartilhados por todas as sessões do processo: uma
+    `requests.Session` com pool de conexões e o pool de threads das pré-cargas.
+
+    Returns:
+        dict: {'sessao': requests.Session, 'executor': ThreadPoolExecutor, 'trava': threading.Lock,
+               'em_andamento': dict url -> Future dos downloads em andamento}
+    """
+    sessao = requests.Session()
+    adaptador = requests.adapters.HTTPAdapter(pool_connections=MAXIMO_DOWNLOADS_SIMULTANEOS, pool_maxsize=MAXIMO_DOWNLOADS_SIMULTANEOS)
+    sessao.mount("https://", adaptador)
+    sessao.mount("http://", adaptador)
+    return {
+        "sessao": sessao,
+        "executor": ThreadPoolExecutor(max_workers=MAXIMO_DOWNLOADS_SIMULTANEOS, thread_name_prefix="imagens"),
+        "trava": threading.Lock(),
+        "em_andamento": {},
+    }
+
+def caminho_imagem_em_cache(url):
     """
-    Busca uma imagem de jogador de uma URL do Google Drive.
+    Retorna o caminho, sem extensão, dos arquivos de uma imagem no cache em disco.
 
     Args:
-        image_id (str): O ID da imagem no Google Drive.
+        url (str): A URL da imagem.
 
     Returns:
-        bytes: O conteúdo binário da imagem se a requisição for bem-sucedida e o conteúdo for uma imagem,
-               caso contrário, retorna None.
+        str: O caminho; a imagem fica em '.img' e os metadados em '.json'.
     """
-    if not image_id:
-        return None
+    return os.path.join(DIRETORIO_CACHE_IMAGENS, hashlib.sha256(url.encode()).hexdigest())
+
+def ler_imagem_em_cache(url):
+    """
+    Lê uma imagem e seus metadados do cache em disco, marcando-a como usada.
+
+    Args:
+        url (str): A URL da imagem.
+
+    Returns:
+        tuple: (bytes, dict) com o conteúdo e os metadados, ou (None, None) se a imagem não estiver em cache.
+    """
+    caminho = caminho_imagem_em_cache(url)
+    try:
+        with open(f"{caminho}.img", "rb") as arquivo:
+            conteudo = arquivo.read()
+        with open(f"{caminho}.json", encoding="utf-8") as arquivo:
+            metadados = json.load(arquivo)
+        os.utime(f"{caminho}.img")
+    except (OSError, ValueError):
+        return None, None
+    return conteudo, metadados
+
+def escrever_arquivo_atomico(caminho, conteudo):
+    """
+    Escreve um arquivo por meio de um temporário renomeado, para que outra sessão nunca o leia pela metade.
+
+    Args:
+        caminho (str): O caminho do arquivo.
+        conteudo (bytes): O conteúdo.
+    """
+    temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporario, "wb") as arquivo:
+        arquivo.write(conteudo)
+    os.replace(temporario, caminho)
+
+def guardar_imagem_em_cache(url, conteudo, metadados):
+    """
+    Guarda uma imagem (ou, com `conteudo` None, só os metadados) no cache em disco e descarta
+    as imagens usadas há mais tempo se o cache passar de LIMITE_CACHE_IMAGENS_BYTES.
+
+    Args:
+        url (str): A URL da imagem.
+        conteudo (bytes or None): O conteúdo da imagem.
+        metadados (dict): ETag, Last-Modified e horário da última verificação no servidor.
+    """
+    caminho = caminho_imagem_em_cache(url)
+    try:
+        os.makedirs(DIRETORIO_CACHE_IMAGENS, exist_ok=True)
+        if conteudo is not None:
+            escrever_arquivo_atomico(f"{caminho}.img", conteudo)
+        escrever_arquivo_atomico(f"{caminho}.json", json.dumps(metadados).encode("utf-8"))
+        if conteudo is not None:
+            podar_cache_imagens()
+    except OSError as e:
+        print(f"Erro ao salvar imagem no cache: {e}")
+
+def podar_cache_imagens():
+    """
+    Remove do cache em disco as imagens usadas há mais tempo até o total caber em LIMITE_CACHE_IMAGENS_BYTES.
+    """
+    imagens = []
+    for entrada in os.scandir(DIRETORIO_CACHE_IMAGENS):
+        if entrada.name.endswith(".img"):
+            try:
+                info = entrada.stat()
+            except OSError:
+                continue
+            imagens.append((info.st_mtime, info.st_size, entrada.path))
+
+    total = sum(tamanho for _, tamanho, _ in imagens)
+    for _, tamanho, caminho in sorted(imagens):
+        if total <= LIMITE_CACHE_IMAGENS_BYTES:
+            break
+        for arquivo in (caminho, f"{caminho[:-len('.img')]}.json"):
+            try:
+                os.remove(arquivo)
+            except OSError:
+                pass
+        total -= tamanho
+
+def baixar_imagem(url, sessao):
+    """
+    Retorna uma imagem do cache em disco, consultando o servidor só quando ela não está em cache
+    ou passou de VALIDADE_IMAGENS_SEGUNDOS. Nesse caso a requisição é condicional (If-None-Match /
+    If-Modified-Since), e uma resposta 304 reaproveita a cópia em disco. Se o servidor falhar,
+    a cópia antiga é usada.
+
+    Roda também nas threads de pré-carga, que não têm contexto do Streamlit: por isso recebe a
+    sessão HTTP em vez de chamar `recursos_imagens`.
+
+    Args:
+        url (str): A URL da imagem.
+        sessao (requests.Session): A sessão de `recursos_imagens`.
 
-    url = f"https://drive.google.com/uc?id={image_id}"
+    Returns:
+        bytes: O conteúdo binário da imagem se ela estiver em cache ou a requisição for bem-sucedida
+               e o conteúdo for uma imagem, caso contrário, retorna None.
+    """
+    conteudo, metadados = ler_imagem_em_cache(url)
+    if conteudo is not None and time.time() - metadados.get("verificado_em", 0) < VALIDADE_IMAGENS_SEGUNDOS:
+        return conteudo
+
+    cabecalhos = {}
+    if conteudo is not None:
+        if metadados.get("etag"):
+            cabecalhos["If-None-Match"] = metadados["etag"]
+        if metadados.get("last_modified"):
+            cabecalhos["If-Modified-Since"] = metadados["last_modified"]
 
     try:
-        response = requests.get(url, timeout=10)
+        response = sessao.get(url, timeout=10, headers=cabecalhos)
+        if response.status_code == 304 and conteudo is not None:
+            guardar_imagem_em_cache(url, None, dict(metadados, verificado_em=time.time()))
+            return conteudo
         response.raise_for_status()
 
         content_type = response.headers.get('Content-Type', '')
@@ -860,18 +1898,100 @@ def pegar_imagem_jogador(image_id):
             print(f"Imagem inválida: {e}")
             return None
 
+        guardar_imagem_em_cache(url, response.content, {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "verificado_em": time.time(),
+        })
         return response.content
 
     except requests.exceptions.RequestException as e:
         print(f"Erro ao buscar imagem: {e}")
-        return None
+        return conteudo
 
-def get_player_photo(image_id):
+def buscar_imagem(url):
     """
-    Busca uma imagem de jogador de uma URL genérica.
+    Retorna uma imagem por `baixar_imagem`, aguardando o download já em andamento da mesma URL
+    (de uma pré-carga) em vez de repeti-lo.
 
     Args:
-        image_id (str): A URL direta da imagem.
+        url (str): A URL da imagem.
+
+    Returns:
+        bytes: O conteúdo binário da imagem, ou None.
+    """
+    recursos = recursos_imagens()
+    with recursos["trava"]:
+        futuro = recursos["em_andamento"].get(url)
+    if futuro is not None:
+        return futuro.result()
+    return baixar_imagem(url, recursos["sessao"])
+
+def pre_carregar_imagens(urls):
+    """
+    Agenda o download das imagens em segundo plano, no pool de threads compartilhado, para que
+    já estejam no cache em disco quando forem exibidas. Retorna sem esperar os downloads.
+
+    Args:
+        urls (list): As URLs das imagens; vazias e repetidas são ignoradas.
+    """
+    recursos = recursos_imagens()
+    agendados = []
+    with recursos["trava"]:
+        for url in dict.fromkeys(url for url in urls if url):
+            if url in recursos["em_andamento"]:
+                continue
+            futuro = recursos["executor"].submit(baixar_imagem, url, recursos["sessao"])
+            recursos["em_andamento"][url] = futuro
+            agendados.append((url, futuro))
+
+    # Fora da trava: um download que já terminou executa o callback aqui mesmo, e
+    # `descartar_download` precisa da trava.
+    for url, futuro in agendados:
+        futuro.add_done_callback(lambda futuro, url=url: descartar_download(recursos, url, futuro))
+
+def descartar_download(recursos, url, futuro):
+    """
+    Remove um download concluído da lista de downloads em andamento. É chamada pela thread
+    que concluiu o download, então recebe os recursos em vez de chamar `recursos_imagens`.
+
+    Args:
+        recursos (dict): O retorno de `recursos_imagens`.
+        url (str): A URL da imagem.
+        futuro (Future): O download concluído; a entrada só é removida se ainda for dele.
+    """
+    with recursos["trava"]:
+        if recursos["em_andamento"].get(url) is futuro:
+            del recursos["em_andamento"][url]
+
+def url_imagem_drive(image_id):
+    """
+    Monta a URL de download de uma imagem do Google Drive.
+
+    Args:
+        image_id (str): O ID da imagem no Google Drive.
+
+    Returns:
+        str: A URL da imagem.
+    """
+    return f"https://drive.google.com/uc?id={image_id}"
+
+def pre_carregar_imagens_drive(ids_imagens):
+    """
+    Agenda em segundo plano o download das imagens do Google Drive (fotos de um elenco, logos)
+    com `pre_carregar_imagens`.
+
+    Args:
+        ids_imagens (list): Os IDs das imagens no Google Drive; vazios são ignorados.
+    """
+    pre_carregar_imagens([url_imagem_drive(image_id) for image_id in ids_imagens if image_id])
+
+def pegar_imagem_jogador(image_id):
+    """
+    Busca uma imagem de jogador de uma URL do Google Drive, pelo cache em disco de `buscar_imagem`.
+
+    Args:
+        image_id (str): O ID da imagem no Google Drive.
 
     Returns:
         bytes: O conteúdo binário da imagem se a requisição for bem-sucedida e o conteúdo for uma imagem,
@@ -880,29 +2000,24 @@ def get_player_photo(image_id):
     if not image_id:
         return None
 
-    url = f"{image_id}"
-
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-
-        content_type = response.headers.get('Content-Type', '')
-        if 'image' not in content_type:
-            print(f"Conteúdo não é uma imagem. Tipo: {content_type}")
-            return None
+    return buscar_imagem(url_imagem_drive(image_id))
 
-        try:
-            Image.open(BytesIO(response.content)).verify()
-        except Exception as e:
-            print(f"Imagem inválida: {e}")
-            return None
+def get_player_photo(image_id):
+    """
+    Busca uma imagem de jogador de uma URL genérica, pelo cache em disco de `buscar_imagem`.
 
-        return response.content
+    Args:
+        image_id (str): A URL direta da imagem.
 
-    except requests.exceptions.RequestException as e:
-        print(f"Erro ao buscar imagem: {e}")
+    Returns:
+        bytes: O conteúdo binário da imagem se a requisição for bem-sucedida e o conteúdo for uma imagem,
+               caso contrário, retorna None.
+    """
+    if not image_id:
         return None
 
+    return buscar_imagem(f"{image_id}")
+
 
 def listar_competicoes_unicas(lista_jogos):
     """
@@ -970,37 +2085,15 @@ def get_mean(df):
     (1ºT, 2ºT, Total, 1ºP, 2ºP) a partir de um DataFrame.
 
     Args:
-        df (pd.DataFrame): DataFrame contendo os dados das jogadas.
+        df (pd.DataFrame): DataFrame contendo os dados das jogadas ou as contagens agregadas (com a coluna 'quantidade').
 
     Returns:
-        tuple: Uma tupla de arrays NumPy, cada um contendo as médias para:
+        tuple: Uma tupla de arrays NumPy na ordem de CATEGORIAS_MEDIA, cada um contendo as médias para:
                1º Tempo, 2º Tempo, Total, 1º Tempo Prorrogação, 2º Tempo Prorrogação.
     """
-    numero_jogos = int(df["jogo_id"].nunique())
-    # Garante que numero_jogos_prorrogacao seja pelo menos 1 para evitar divisão por zero
-    numero_jogos_prorrogacao = int(df[df["tempo"].isin(["1ºP", "2ºP"])]["jogo_id"].nunique())
-    numero_jogos_prorrogacao = numero_jogos_prorrogacao if numero_jogos_prorrogacao > 0 else 1
-
-
-    estatisticas_primeiro_tempo_dict, estatisticas_segundo_tempo_dict, estatisticas_totais_dict, estatisticas_pt_prorrogacao_dict, estatisticas_st_prorrogacao_dict = extrair_estatisticas_gerais(df)
-    categorias = ['FIN.C', 'FIN.E', 'FIN.T', 'DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra', "FIN.S.C", "FIN.S.E", "FIN.S.T"]
-
-    valores_totais = np.array([estatisticas_totais_dict.get(categoria, 0) for categoria in categorias])
-    mean_total = valores_totais / numero_jogos if numero_jogos > 0 else np.zeros_like(valores_totais)
-
-    valores_primeiro_tempo = np.array([estatisticas_primeiro_tempo_dict.get(categoria, 0) for categoria in categorias])
-    mean_primeiro_tempo = valores_primeiro_tempo / numero_jogos if numero_jogos > 0 else np.zeros_like(valores_primeiro_tempo)
-
-    valores_segundo_tempo = np.array([estatisticas_segundo_tempo_dict.get(categoria, 0) for categoria in categorias])
-    mean_segundo_tempo = valores_segundo_tempo / numero_jogos if numero_jogos > 0 else np.zeros_like(valores_segundo_tempo)
-
-    valores_primeiro_tempo_prorrogacao = np.array([estatisticas_pt_prorrogacao_dict.get(categoria, 0) for categoria in categorias])
-    mean_primeiro_tempo_prorrogacao = valores_primeiro_tempo_prorrogacao / numero_jogos_prorrogacao if numero_jogos_prorrogacao != 0 else np.zeros_like(valores_primeiro_tempo_prorrogacao)
-
-    valores_segundo_tempo_prorrogacao = np.array([estatisticas_st_prorrogacao_dict.get(categoria, 0) for categoria in categorias])
-    mean_segundo_tempo_prorrogacao = valores_segundo_tempo_prorrogacao / numero_jogos_prorrogacao if numero_jogos_prorrogacao != 0 else np.zeros_like(valores_segundo_tempo_prorrogacao)
-
-    return mean_primeiro_tempo, mean_segundo_tempo, mean_total, mean_primeiro_tempo_prorrogacao, mean_segundo_tempo_prorrogacao
+    _, medias = extrair_matriz_estatisticas(df)
+    medias = medias.loc[CATEGORIAS_MEDIA]
+    return tuple(medias[tempo].to_numpy() for tempo in ["1ºT", "2ºT", "Total", "1ºP", "2ºP"])
 
 
 def get_athletes_total_figures(estatisticas_totais_dict, estatisticas_primeiro_tempo_dict, estatisticas_segundo_tempo_dict, estatisticas_geral_totais_dict, numero_jogos, mean_primeiro_tempo, mean_segundo_tempo,posicao):
@@ -1058,60 +2151,54 @@ def get_athletes_partial_figures(estatisticas_parciais_dict, estatisticas_geral_
     return estatisticas_gerais_fig, estatisticas_gerais_fig_1, grafico_barras_fig, radar_fig
 
 
-def get_plots_plays_localization_team(filtro_jogada, data, tempo):
+def get_plots_plays_localization_team(filtro_jogada, data, tempo, grade=GRADE_PADRAO):
     """
     Retorna uma lista de figuras da quadra de futsal com heatmaps de localização
     para jogadas específicas de um time, filtradas por tipo de jogada e tempo.
 
     Args:
         filtro_jogada (str): O tipo de jogada a ser filtrado ("Ataque" ou "Defesa").
-        data (pd.DataFrame): DataFrame contendo os dados das jogadas.
+        data (pd.DataFrame or np.ndarray): DataFrame contendo os dados das jogadas (ou o tensor de `extrair_tensor_localizacao`).
         tempo (str): O período de tempo a ser analisado (ex: 'Primeiro Tempo', 'Segundo Tempo').
+        grade (tuple, optional): (linhas, colunas) da grade, quando `data` é um DataFrame. Defaults to GRADE_PADRAO.
 
     Returns:
         list: Uma lista de figuras Plotly (quadras de futsal com heatmaps).
     """
-    jogadas = {"Ataque": ['FIN.C', 'FIN.E', 'FIN.T', 'DES.C/P.', 'C.A.-Pró'], "Defesa": ['DES.S/P.', 'PER.P.', 'C.A.-Contra', "FIN.S.C", "FIN.S.E", "FIN.S.T"]}
-    jogadas_selecionadas = jogadas[filtro_jogada]
+    jogadas_selecionadas = jogadas_da_posicao()[filtro_jogada]
+    tensor = tensor_localizacao(data, grade)
     figs = []
     for jogada in jogadas_selecionadas:
-        localizacao_jogadas = extrair_estatisticas_localizacao(data, jogada)
+        localizacao_jogadas = localizacao_do_tensor(tensor, jogada)
         fig = create_futsal_court(jogada, localizacao_jogadas[tempo])
         figs.append(fig)
     return figs
 
-def get_plots_plays_localization_athletes(filtro_jogada, data, tempo,posicao):
+def get_plots_plays_localization_athletes(filtro_jogada, data, tempo,posicao, grade=GRADE_PADRAO):
     """
     Retorna uma lista de figuras da quadra de futsal com heatmaps de localização
     para jogadas específicas de um atleta, filtradas por tipo de jogada e tempo.
 
     Args:
         filtro_jogada (str): O tipo de jogada a ser filtrado ("Ataque" ou "Defesa").
-        data (pd.DataFrame): DataFrame contendo os dados das jogadas do atleta.
+        data (pd.DataFrame or np.ndarray): DataFrame contendo os dados das jogadas do atleta (ou o tensor de `extrair_tensor_localizacao`).
         tempo (str): O período de tempo a ser analisado (ex: 'Primeiro Tempo', 'Segundo Tempo').
+        grade (tuple, optional): (linhas, colunas) da grade, quando `data` é um DataFrame. Defaults to GRADE_PADRAO.
 
     Returns:
         list: Uma lista de figuras Plotly (quadras de futsal com heatmaps).
     """
-    if posicao == 'Goleiro':
-    
-        jogadas = {"Ataque": ['FIN.C', 'FIN.E', 'FIN.T','DES.C/P.', 'C.A.-Pró'], 
-                   "Defesa": ['DES.S/P.', 'PER.P.', 'C.A.-Contra',"FIN.S.C", "FIN.S.E", "FIN.S.T"]}
-    else:
-        jogadas = {"Ataque": ['FIN.C', 'FIN.E', 'FIN.T','DES.C/P.', 'C.A.-Pró'], 
-                   "Defesa": ['DES.S/P.', 'PER.P.', 'C.A.-Contra']}
-            
-    
-    jogadas_selecionadas = jogadas[filtro_jogada]
+    jogadas_selecionadas = jogadas_da_posicao(posicao)[filtro_jogada]
+    tensor = tensor_localizacao(data, grade)
     figs = []
     for jogada in jogadas_selecionadas:
-        localizacao_jogadas = extrair_estatisticas_localizacao(data, jogada)
+        localizacao_jogadas = localizacao_do_tensor(tensor, jogada)
         fig = create_futsal_court(jogada, localizacao_jogadas[tempo])
         figs.append(fig)
     return figs
 
 
-def create_futsal_subplots(tipo, data, tempo, rows, cols):
+def create_futsal_subplots(tipo, data, tempo, rows, cols, grade=GRADE_PADRAO):
     """
     Cria uma figura Plotly com múltiplos subplots de quadras de futsal,
     cada um exibindo um heatmap de localização para diferentes tipos de jogadas
@@ -1119,22 +2206,24 @@ def create_futsal_subplots(tipo, data, tempo, rows, cols):
 
     Args:
         tipo (str): O tipo de jogada a ser exibido ("Ataque" ou "Defesa").
-        data (pd.DataFrame): DataFrame contendo os dados das jogadas.
+        data (pd.DataFrame or np.ndarray): DataFrame contendo os dados das jogadas (ou o tensor de `extrair_tensor_localizacao`).
         tempo (str): O período de tempo a ser analisado (ex: 'Primeiro Tempo', 'Segundo Tempo').
         rows (int): Número de linhas para os subplots.
         cols (int): Número de colunas para os subplots.
+        grade (tuple, optional): (linhas, colunas) da grade, quando `data` é um DataFrame. Defaults to GRADE_PADRAO.
 
     Returns:
         plotly.graph_objects.Figure: Uma figura Plotly com múltiplos subplots de quadras.
     """
-    titulos = {"Ataque": ['FIN.C', 'FIN.E', 'FIN.T'], "Defesa": ['DES.C/P.', 'C.A.-Pró', 'DES.S/P.', 'PER.P.', 'C.A.-Contra']}
+    titulos = {"Ataque": FINALIZACOES, "Defesa": JOGADAS_POSSE}
     titulos = titulos[tipo]
     fig = make_subplots(rows=rows, cols=cols, subplot_titles=titulos)
+    tensor = tensor_localizacao(data, grade)
 
     for i, titulo in enumerate(titulos):
         row = (i // cols) + 1
         col = (i % cols) + 1
-        heatmap_data = extrair_estatisticas_localizacao(data, titulo)
+        heatmap_data = localizacao_do_tensor(tensor, titulo)
         court_fig = create_futsal_court(titulo, heatmap_data[tempo])
         for trace in court_fig.data:
             fig.add_trace(trace, row=row, col=col)
@@ -1157,7 +2246,7 @@ def plotar_caracteristicas_gols(df_gols, equipe1, equipe2):
     marcados por uma equipe e sofridos por outra.
 
     Args:
-        df_gols (pd.DataFrame): DataFrame contendo os dados dos gols.
+        df_gols (pd.DataFrame or dict): DataFrame contendo os dados dos gols, ou o pivô de `extrair_pivo_gols`.
         equipe1 (str): Nome da primeira equipe (para gols marcados).
         equipe2 (str): Nome da segunda equipe (para gols sofridos).
 
@@ -1221,7 +2310,7 @@ def plotar_caracteristicas_gols_1(df_gols, equipe1, equipe2):
     marcados por uma equipe e sofridos por outra, divididos por tempo (quartos/prorrogação).
 
     Args:
-        df_gols (pd.DataFrame): DataFrame contendo os dados dos gols.
+        df_gols (pd.DataFrame or dict): DataFrame contendo os dados dos gols, ou o pivô de `extrair_pivo_gols`.
         equipe1 (str): Nome da primeira equipe (para gols marcados).
         equipe2 (str): Nome da segunda equipe (para gols sofridos).
 
@@ -1297,7 +2386,7 @@ def plotar_caracteristicas_gols_2(df_gols, equipe1, equipe2):
     com legendas personalizadas.
 
     Args:
-        df_gols (pd.DataFrame): DataFrame contendo os dados dos gols.
+        df_gols (pd.DataFrame or dict): DataFrame contendo os dados dos gols, ou o pivô de `extrair_pivo_gols`.
         equipe1 (str): Nome da primeira equipe (para gols marcados).
         equipe2 (str): Nome da segunda equipe (para gols sofridos).
 
@@ -1412,7 +2501,7 @@ def plotar_caracteristicas_gols_2_invertido(df_gols, equipe1, equipe2):
     com legendas personalizadas e eixos invertidos.
 
     Args:
-        df_gols (pd.DataFrame): DataFrame contendo os dados dos gols.
+        df_gols (pd.DataFrame or dict): DataFrame contendo os dados dos gols, ou o pivô de `extrair_pivo_gols`.
         equipe1 (str): Nome da primeira equipe (para gols sofridos).
         equipe2 (str): Nome da segunda equipe (para gols marcados).
 
@@ -1526,7 +2615,7 @@ def plotar_caracteristicas_gols_invertido(df_gols, equipe1, equipe2):
     sofridos por uma equipe e marcados por outra, com eixos invertidos.
 
     Args:
-        df_gols (pd.DataFrame): DataFrame contendo os dados dos gols.
+        df_gols (pd.DataFrame or dict): DataFrame contendo os dados dos gols, ou o pivô de `extrair_pivo_gols`.
         equipe1 (str): Nome da primeira equipe (para gols sofridos).
         equipe2 (str): Nome da segunda equipe (para gols marcados).
 
@@ -1585,13 +2674,72 @@ def plotar_caracteristicas_gols_invertido(df_gols, equipe1, equipe2):
     )
     return fig
 
+# Eixos padronizados dos gráficos de características de gols.
+TEMPOS_GOLS = ['1ºQ', '2ºQ', '3ºQ', '4ºQ', '1ºP', '2ºP']
+CARACTERISTICAS_GOLS = [
+    "4x3", "3x4", "Ataque Posicional PA", "Ataque Posicional PB",
+    "Goleiro Linha", "Defesa Goleiro Linha", "Goleiro no Jogo",
+    "Escanteio", "Falta", "Lateral", "Pênalti", "Tiro de 10",
+    "Gol Contra", "Transição Alta", "Transição Baixa"
+]
+
+def extrair_pivo_gols(df_gols):
+    """
+    Agrupa os gols uma única vez por (equipe, tipo, tempo, característica), para que
+    todos os gráficos de características de um mesmo período sejam recortes do mesmo pivô.
+
+    Args:
+        df_gols (pd.DataFrame): DataFrame contendo os dados dos gols.
+
+    Returns:
+        dict: {'contagens': pd.DataFrame com linhas (Equipe Analisada, Tipo) e colunas (Tempo, Característica),
+              'jogos': pd.Series com o número de jogos de cada equipe}.
+    """
+    contagens = df_gols.groupby(['Equipe Analisada', 'Tipo', 'Tempo', 'Característica']).size()
+    if contagens.empty:
+        colunas = pd.MultiIndex.from_tuples([], names=['Tempo', 'Característica'])
+        contagens = pd.DataFrame(index=pd.MultiIndex.from_tuples([], names=['Equipe Analisada', 'Tipo']), columns=colunas, dtype=np.int64)
+    else:
+        contagens = contagens.unstack(['Tempo', 'Característica'], fill_value=0)
+    jogos = df_gols.groupby('Equipe Analisada')['jogo_id'].nunique()
+    return {"contagens": contagens, "jogos": jogos}
+
+def pivo_gols(dados):
+    """
+    Retorna o pivô de `extrair_pivo_gols` para um DataFrame, ou o próprio pivô quando ele já foi calculado.
+
+    Args:
+        dados (pd.DataFrame or dict): DataFrame dos gols ou pivô já calculado.
+
+    Returns:
+        dict: O pivô dos gols.
+    """
+    return dados if isinstance(dados, dict) else extrair_pivo_gols(dados)
+
+def gols_da_equipe(pivo, equipe, tipo):
+    """
+    Recorta do pivô os gols de uma equipe e tipo ("Marcado" ou "Sofrido").
+
+    Args:
+        pivo (dict): O pivô de `extrair_pivo_gols`.
+        equipe (str): Nome da equipe.
+        tipo (str): "Marcado" ou "Sofrido".
+
+    Returns:
+        pd.Series: Contagens com MultiIndex (Tempo, Característica); zeros se a equipe não tiver gols do tipo.
+    """
+    contagens = pivo["contagens"]
+    if (equipe, tipo) in contagens.index:
+        return contagens.loc[(equipe, tipo)]
+    return pd.Series(0, index=contagens.columns, dtype=np.int64)
+
 def extrair_dados_caracteristicas_gols(df_gols, equipe1, equipe2):
     """
     Extrai dados de características de gols (marcados e sofridos) para duas equipes
     e reindexa as Series resultantes para garantir categorias padronizadas.
 
     Args:
-        df_gols (pd.DataFrame): DataFrame contendo os dados dos gols.
+        df_gols (pd.DataFrame or dict): DataFrame contendo os dados dos gols, ou o pivô de `extrair_pivo_gols`.
         equipe1 (str): Nome da primeira equipe.
         equipe2 (str): Nome da segunda equipe.
 
@@ -1604,36 +2752,16 @@ def extrair_dados_caracteristicas_gols(df_gols, equipe1, equipe2):
                - pd.Series: Gols marcados pela equipe 2.
                - pd.Series: Gols sofridos pela equipe 2.
     """
-    caracteristicas_padrao = [
-        "4x3", "3x4", "Ataque Posicional PA", "Ataque Posicional PB",
-        "Goleiro Linha", "Defesa Goleiro Linha", "Goleiro no Jogo",
-        "Escanteio", "Falta", "Lateral", "Pênalti", "Tiro de 10",
-        "Gol Contra", "Transição Alta", "Transição Baixa"
-    ]
-    try:
-        jogos_e1 = df_gols.loc[df_gols['Equipe Analisada'] == equipe1]['jogo_id'].nunique()
-    except Exception:
-        jogos_e1 = 0
-    try:
-        jogos_e2 = df_gols.loc[df_gols['Equipe Analisada'] == equipe2]['jogo_id'].nunique()
-    except Exception:
-        jogos_e2 = 0
-
-    df_gols_group = df_gols.groupby(['Equipe Analisada', 'Tipo', 'Característica'])['Tipo'].count()
-
-    def get_valor(df, chave):
-        try:
-            s = df.loc[chave]
-        except KeyError:
-            s = pd.Series(dtype=int)
-        return s.reindex(caracteristicas_padrao, fill_value=0)
+    pivo = pivo_gols(df_gols)
 
-    gols_marcados_e1 = get_valor(df_gols_group, (equipe1, "Marcado"))
-    gols_sofridos_e1 = get_valor(df_gols_group, (equipe1, "Sofrido"))
-    gols_marcados_e2 = get_valor(df_gols_group, (equipe2, "Marcado"))
-    gols_sofridos_e2 = get_valor(df_gols_group, (equipe2, "Sofrido"))
+    def por_caracteristica(equipe, tipo):
+        gols = gols_da_equipe(pivo, equipe, tipo)
+        return gols.groupby(level='Característica').sum().reindex(CARACTERISTICAS_GOLS, fill_value=0)
 
-    return jogos_e1, gols_marcados_e1, gols_sofridos_e1, jogos_e2, gols_marcados_e2, gols_sofridos_e2
+    return (
+        int(pivo["jogos"].get(equipe1, 0)), por_caracteristica(equipe1, "Marcado"), por_caracteristica(equipe1, "Sofrido"),
+        int(pivo["jogos"].get(equipe2, 0)), por_caracteristica(equipe2, "Marcado"), por_caracteristica(equipe2, "Sofrido")
+    )
 
 def extrair_dados_caracteristicas_gols_1(df_gols, equipe1, equipe2):
     """
@@ -1642,7 +2770,7 @@ def extrair_dados_caracteristicas_gols_1(df_gols, equipe1, equipe2):
     para garantir categorias e tempos padronizados.
 
     Args:
-        df_gols (pd.DataFrame): DataFrame contendo os dados dos gols.
+        df_gols (pd.DataFrame or dict): DataFrame contendo os dados dos gols, ou o pivô de `extrair_pivo_gols`.
         equipe1 (str): Nome da primeira equipe.
         equipe2 (str): Nome da segunda equipe.
 
@@ -1655,40 +2783,16 @@ def extrair_dados_caracteristicas_gols_1(df_gols, equipe1, equipe2):
                - pd.Series: Gols marcados pela equipe 2, com MultiIndex (Tempo, Característica).
                - pd.Series: Gols sofridos pela equipe 2, com MultiIndex (Tempo, Característica).
     """
-    tempos = ['1ºQ', '2ºQ', '3ºQ', '4ºQ', '1ºP', '2ºP']
-    caracteristicas_padrao = [
-        "4x3", "3x4", "Ataque Posicional PA", "Ataque Posicional PB",
-        "Goleiro Linha", "Defesa Goleiro Linha", "Goleiro no Jogo",
-        "Escanteio", "Falta", "Lateral", "Pênalti", "Tiro de 10",
-        "Gol Contra", "Transição Alta", "Transição Baixa"
-    ]
-
-    novo_index = pd.MultiIndex.from_product([tempos, caracteristicas_padrao], names=['Tempo', 'Característica'])
-
-    try:
-        jogos_e1 = df_gols.loc[df_gols['Equipe Analisada'] == equipe1]['jogo_id'].nunique()
-    except Exception:
-        jogos_e1 = 0
-    try:
-        jogos_e2 = df_gols.loc[df_gols['Equipe Analisada'] == equipe2]['jogo_id'].nunique()
-    except Exception:
-        jogos_e2 = 0
-
-    df_gols_group = df_gols.groupby(['Equipe Analisada', 'Tipo', 'Tempo', 'Característica'])['Tipo'].count()
-
-    def get_valor(df, chave):
-        try:
-            s = df.loc[chave]
-        except KeyError:
-            s = pd.Series(dtype=int)
-        return s.reindex(novo_index, fill_value=0)
+    pivo = pivo_gols(df_gols)
+    novo_index = pd.MultiIndex.from_product([TEMPOS_GOLS, CARACTERISTICAS_GOLS], names=['Tempo', 'Característica'])
 
-    gols_marcados_e1 = get_valor(df_gols_group, (equipe1, "Marcado"))
-    gols_sofridos_e1 = get_valor(df_gols_group, (equipe1, "Sofrido"))
-    gols_marcados_e2 = get_valor(df_gols_group, (equipe2, "Marcado"))
-    gols_sofridos_e2 = get_valor(df_gols_group, (equipe2, "Sofrido"))
+    def por_tempo(equipe, tipo):
+        return gols_da_equipe(pivo, equipe, tipo).reindex(novo_index, fill_value=0)
 
-    return jogos_e1, gols_marcados_e1, gols_sofridos_e1, jogos_e2, gols_marcados_e2, gols_sofridos_e2
+    return (
+        int(pivo["jogos"].get(equipe1, 0)), por_tempo(equipe1, "Marcado"), por_tempo(equipe1, "Sofrido"),
+        int(pivo["jogos"].get(equipe2, 0)), por_tempo(equipe2, "Marcado"), por_tempo(equipe2, "Sofrido")
+    )
 
 
 def exibir_seta(direcao="↑"):
@@ -1782,7 +2886,93 @@ def exibir_jogadas(tipo, fig_espacamento, fig_barras, key_prefix):
             st.plotly_chart(fig_barras, use_container_width=True, key=f"{key_prefix}_barras", config={'displayModeBar': False})
 
 
-def exibir_localizacao_jogadas_por_tempo(dados_time_df, tempo, key_prefix):
+def exibir_quadras_agrupadas(titulos, matrizes, colunas, key):
+    """
+    Exibe as quadras de uma aba em uma única figura, no lugar de um gráfico por quadra.
+
+    Args:
+        titulos (list): Título de cada quadra.
+        matrizes (list): Matrizes [linha, coluna] de contagens de cada quadra.
+        colunas (int): Número de quadras por linha.
+        key (str): Chave única do componente Streamlit.
+    """
+    fig = create_futsal_court_grid(titulos, matrizes, colunas)
+    st.plotly_chart(fig, use_container_width=True, key=key, config={'displayModeBar': False})
+
+def exibir_quadras_imagem(titulos, matrizes, colunas):
+    """
+    Exibe as quadras de uma aba como imagens estáticas, lidas do cache em disco de `renderizar_quadra_png`.
+
+    Args:
+        titulos (list): Título de cada quadra.
+        matrizes (list): Matrizes [linha, coluna] de contagens de cada quadra.
+        colunas (int): Número de quadras por linha.
+    """
+    for inicio in range(0, len(matrizes), colunas):
+        colunas_quadras = st.columns(colunas)
+        for coluna, titulo, matriz in zip(colunas_quadras, titulos[inicio:inicio + colunas], matrizes[inicio:inicio + colunas]):
+            coluna.image(renderizar_quadra_png(titulo, matriz), use_container_width=True)
+
+def exibir_quadras(titulos, matrizes, colunas, key_prefix, modo="Interativo"):
+    """
+    Exibe as quadras de uma aba no modo escolhido: um gráfico Plotly por quadra, uma figura única
+    (`exibir_quadras_agrupadas`) ou imagens estáticas (`exibir_quadras_imagem`).
+
+    Args:
+        titulos (list): Título de cada quadra.
+        matrizes (list): Matrizes [linha, coluna] de contagens de cada quadra.
+        colunas (int): Número de quadras por linha.
+        key_prefix (str): Prefixo para as chaves únicas dos componentes Streamlit.
+        modo (str, optional): Uma das opções de MODOS_QUADRAS. Defaults to "Interativo".
+    """
+    if modo == "Figura única":
+        exibir_quadras_agrupadas(titulos, matrizes, colunas, key=f"{key_prefix}_agrupada")
+    elif modo == "Imagem":
+        exibir_quadras_imagem(titulos, matrizes, colunas)
+    else:
+        for inicio in range(0, len(matrizes), colunas):
+            colunas_quadras = st.columns(colunas)
+            quadras = zip(colunas_quadras, titulos[inicio:inicio + colunas], matrizes[inicio:inicio + colunas])
+            for i, (coluna, titulo, matriz) in enumerate(quadras, start=inicio):
+                coluna.plotly_chart(create_futsal_court(titulo, matriz), key=f"{key_prefix}_{i}", config={'displayModeBar': False})
+
+def quadras_por_periodo(tensor, jogadas, periodos=("Primeiro Tempo", "Segundo Tempo", "Total")):
+    """
+    Lista os títulos e as matrizes das quadras de cada jogada em cada período, na ordem de exibição.
+
+    Args:
+        tensor (np.ndarray): O tensor de `extrair_tensor_localizacao`.
+        jogadas (list): Os tipos de jogada.
+        periodos (tuple, optional): As chaves de `localizacao_do_tensor` a exibir. Padrão é 1ºT, 2ºT e Total.
+
+    Returns:
+        tuple: Uma tupla contendo:
+               - list: Os títulos no formato "jogada - período".
+               - list: As matrizes correspondentes.
+    """
+    titulos, matrizes = [], []
+    for jogada in jogadas:
+        localizacao_jogadas = localizacao_do_tensor(tensor, jogada)
+        for periodo in periodos:
+            titulos.append(f"{jogada} - {periodo}")
+            matrizes.append(localizacao_jogadas[periodo])
+    return titulos, matrizes
+
+def quadras_do_tempo(tensor, jogadas, tempo):
+    """
+    Lista os títulos e as matrizes das quadras de cada jogada em um único período.
+
+    Args:
+        tensor (np.ndarray): O tensor de `extrair_tensor_localizacao`.
+        jogadas (list): Os tipos de jogada, usados também como títulos.
+        tempo (str): A chave de `localizacao_do_tensor` a exibir (ex: 'Primeiro Tempo').
+
+    Returns:
+        tuple: (títulos, matrizes).
+    """
+    return list(jogadas), [localizacao_do_tensor(tensor, jogada)[tempo] for jogada in jogadas]
+
+def exibir_localizacao_jogadas_por_tempo(dados_time_df, tempo, key_prefix, grade=GRADE_PADRAO, modo="Interativo"):
     """
     Exibe a localização das jogadas por tempo para o time, divididas em abas de "Ataque" e "Defesa",
     mostrando heatmaps da quadra.
@@ -1791,29 +2981,22 @@ def exibir_localizacao_jogadas_por_tempo(dados_time_df, tempo, key_prefix):
         dados_time_df (pd.DataFrame): DataFrame contendo os dados das jogadas do time.
         tempo (str): O período de tempo a ser analisado (ex: 'Primeiro Tempo', 'Segundo Tempo').
         key_prefix (str): Prefixo para as chaves únicas dos componentes Streamlit.
+        grade (tuple, optional): (linhas, colunas) da grade dos mapas de calor. Defaults to GRADE_PADRAO.
+        modo (str, optional): Uma das opções de MODOS_QUADRAS. Defaults to "Interativo".
     """
+    jogadas = jogadas_da_posicao()
+    tensor = extrair_tensor_localizacao(dados_time_df, grade)
     tab_ataque, tab_defesa = st.tabs(['Ataque', 'Defesa'])
 
     with tab_ataque:
         with st.container(border=True, height=300):
-            colunas_jogadas_ofensivas = st.columns(5)
-            figs = get_plots_plays_localization_team("Ataque", dados_time_df, tempo)
-            for i, fig in enumerate(figs):
-                colunas_jogadas_ofensivas[i].plotly_chart(fig, key=f"localizazao_{i}_time_tab_ataque_{key_prefix}", config={'displayModeBar': False})
+            exibir_quadras(*quadras_do_tempo(tensor, jogadas['Ataque'], tempo), 5, f"localizacao_ataque_{key_prefix}", modo)
     with tab_defesa:
         with st.container(border=True, height=600):
-            colunas_jogadas_defensivas_1 = st.columns(3)
-            colunas_jogadas_defensivas_2 = st.columns(3)
-            figs = get_plots_plays_localization_team("Defesa", dados_time_df, tempo)
+            exibir_quadras(*quadras_do_tempo(tensor, jogadas['Defesa'], tempo), 3, f"localizacao_defesa_{key_prefix}", modo)
 
-            for i in range(3):
-                colunas_jogadas_defensivas_1[i].plotly_chart(figs[i], key=f"localizazao_{i}_time_tab_defesa_{key_prefix}", config={'displayModeBar': False})
-            if len(figs) > 3:
-                for i in range(3, len(figs)):
-                    colunas_jogadas_defensivas_2[i-3].plotly_chart(figs[i], key=f"localizazao_1{i}_time_tab_defesa_{key_prefix}", config={'displayModeBar': False})
 
-
-def exibir_localizacao_jogadas_por_tempo_jogador(dados_time_df, tempo, key_prefix,posicao):
+def exibir_localizacao_jogadas_por_tempo_jogador(dados_time_df, tempo, key_prefix,posicao, grade=GRADE_PADRAO, modo="Interativo"):
     """
     Exibe a localização das jogadas por tempo para o time, divididas em abas de "Ataque" e "Defesa",
     mostrando heatmaps da quadra.
@@ -1823,7 +3006,11 @@ def exibir_localizacao_jogadas_por_tempo_jogador(dados_time_df, tempo, key_prefi
         tempo (str): O período de tempo a ser analisado (ex: 'Primeiro Tempo', 'Segundo Tempo').
         key_prefix (str): Prefixo para as chaves únicas dos componentes Streamlit.
         posicao (string): Posição do jogador.
+        grade (tuple, optional): (linhas, colunas) da grade dos mapas de calor. Defaults to GRADE_PADRAO.
+        modo (str, optional): Uma das opções de MODOS_QUADRAS. Defaults to "Interativo".
     """
+    jogadas = jogadas_da_posicao(posicao)
+    tensor = extrair_tensor_localizacao(dados_time_df, grade)
     tab_ataque, tab_defesa = st.tabs(['Ataque', 'Defesa'])
     if posicao == "Goleiro":
         height_container_defesa = 600
@@ -1832,63 +3019,37 @@ def exibir_localizacao_jogadas_por_tempo_jogador(dados_time_df, tempo, key_prefi
     
     with tab_ataque:
         with st.container(border=True, height=300):
-            colunas_jogadas_ofensivas = st.columns(5)
-            figs = get_plots_plays_localization_athletes("Ataque", dados_time_df, tempo,posicao)
-            for i, fig in enumerate(figs):
-                colunas_jogadas_ofensivas[i].plotly_chart(fig, key=f"localizazao_{i}_time_tab_ataque_{key_prefix}", config={'displayModeBar': False})
+            exibir_quadras(*quadras_do_tempo(tensor, jogadas['Ataque'], tempo), 5, f"localizacao_ataque_{key_prefix}", modo)
     with tab_defesa:
         with st.container(border=True, height=height_container_defesa):
-            colunas_jogadas_defensivas_1 = st.columns(3)
-            colunas_jogadas_defensivas_2 = st.columns(3)
-            figs = get_plots_plays_localization_athletes("Defesa", dados_time_df, tempo,posicao)
-
-            for i in range(3):
-                colunas_jogadas_defensivas_1[i].plotly_chart(figs[i], key=f"localizazao_{i}_time_tab_defesa_{key_prefix}", config={'displayModeBar': False})
-            if len(figs) > 3:
-                for i in range(3, len(figs)):
-                    colunas_jogadas_defensivas_2[i-3].plotly_chart(figs[i], key=f"localizazao_1{i}_time_tab_defesa_{key_prefix}", config={'displayModeBar': False})
+            exibir_quadras(*quadras_do_tempo(tensor, jogadas['Defesa'], tempo), 3, f"localizacao_defesa_{key_prefix}", modo)
 
 
 
-def exibir_localizacao_jogadas_total(dados_time_df):
+def exibir_localizacao_jogadas_total(dados_time_df, grade=GRADE_PADRAO, modo="Interativo"):
     """
     Exibe a localização total das jogadas para o time, divididas em abas de "Ataque" e "Defesa",
     mostrando heatmaps da quadra para cada período de tempo (1ºT, 2ºT, Total).
 
     Args:
         dados_time_df (pd.DataFrame): DataFrame contendo os dados das jogadas do time.
+        grade (tuple, optional): (linhas, colunas) da grade dos mapas de calor. Defaults to GRADE_PADRAO.
+        modo (str, optional): Uma das opções de MODOS_QUADRAS. Defaults to "Interativo".
     """
-    jogadas = {"Ataque": ['FIN.C', 'FIN.E', 'FIN.T', 'DES.C/P.', 'C.A.-Pró'], "Defesa": ['DES.S/P.', 'PER.P.', 'C.A.-Contra', "FIN.S.C", "FIN.S.E", "FIN.S.T"]}
+    jogadas = jogadas_da_posicao()
 
+    tensor = extrair_tensor_localizacao(dados_time_df, grade)
     tab_ataque, tab_defesa = st.tabs(['Ataque', 'Defesa'])
 
     with tab_ataque:
         with st.container(border=True, height=1500):
-            for jogada in jogadas['Ataque']:
-                colunas = st.columns(3)
-                localizacao_jogadas = extrair_estatisticas_localizacao(dados_time_df, jogada)
-
-                for i, (chave, valor) in enumerate(localizacao_jogadas.items()):
-                    if i == 3: # Exibe apenas os 3 primeiros (1T, 2T, Total)
-                        break
-                    titulo = f"{jogada} - {chave}"
-                    fig_localizacao_total = create_futsal_court(titulo, valor)
-                    colunas[i].plotly_chart(fig_localizacao_total, key=f"localizacao_{jogada}_{chave}", config={'displayModeBar': False})
+            exibir_quadras(*quadras_por_periodo(tensor, jogadas['Ataque']), 3, "localizacao_ataque_total", modo)
 
     with tab_defesa:
         with st.container(border=True, height=1800):
-            for jogada in jogadas['Defesa']:
-                colunas = st.columns(3)
-                localizacao_jogadas = extrair_estatisticas_localizacao(dados_time_df, jogada)
-
-                for i, (chave, valor) in enumerate(localizacao_jogadas.items()):
-                    if i == 3: # Exibe apenas os 3 primeiros (1T, 2T, Total)
-                        break
-                    titulo = f"{jogada} - {chave}"
-                    fig_localizacao_total = create_futsal_court(titulo, valor)
-                    colunas[i].plotly_chart(fig_localizacao_total, key=f"localizacao_{jogada}_{chave}", config={'displayModeBar': False})
+            exibir_quadras(*quadras_por_periodo(tensor, jogadas['Defesa']), 3, "localizacao_defesa_total", modo)
 
-def exibir_localizacao_jogadas_total_jogador(dados_time_df,posicao):
+def exibir_localizacao_jogadas_total_jogador(dados_time_df,posicao, grade=GRADE_PADRAO, modo="Interativo"):
     """
     Exibe a localização total das jogadas para o time, divididas em abas de "Ataque" e "Defesa",
     mostrando heatmaps da quadra para cada período de tempo (1ºT, 2ºT, Total).
@@ -1896,46 +3057,75 @@ def exibir_localizacao_jogadas_total_jogador(dados_time_df,posicao):
     Args:
         dados_time_df (pd.DataFrame): DataFrame contendo os dados das jogadas do time.
         posicao (string): Posiçao do jogador.
+        grade (tuple, optional): (linhas, colunas) da grade dos mapas de calor. Defaults to GRADE_PADRAO.
+        modo (str, optional): Uma das opções de MODOS_QUADRAS. Defaults to "Interativo".
     """
     
+    jogadas = jogadas_da_posicao(posicao)
     if posicao == "Goleiro":
-        jogadas = {"Ataque": ['FIN.C', 'FIN.E', 'FIN.T', 'DES.C/P.', 'C.A.-Pró'], 
-                "Defesa": ['DES.S/P.', 'PER.P.', 'C.A.-Contra', "FIN.S.C", "FIN.S.E", "FIN.S.T"]}
         height_container_defesa = 1800
     else:
-        jogadas = {"Ataque": ['FIN.C', 'FIN.E', 'FIN.T', 'DES.C/P.', 'C.A.-Pró'],
-                   "Defesa": ['DES.S/P.', 'PER.P.', 'C.A.-Contra']}
         height_container_defesa = 900
 
         
+    tensor = extrair_tensor_localizacao(dados_time_df, grade)
     tab_ataque, tab_defesa = st.tabs(['Ataque', 'Defesa'])
 
     with tab_ataque:
         with st.container(border=True, height=1500):
-            for jogada in jogadas['Ataque']:
-                colunas = st.columns(3)
-                localizacao_jogadas = extrair_estatisticas_localizacao(dados_time_df, jogada)
-
-                for i, (chave, valor) in enumerate(localizacao_jogadas.items()):
-                    if i == 3: # Exibe apenas os 3 primeiros (1T, 2T, Total)
-                        break
-                    titulo = f"{jogada} - {chave}"
-                    fig_localizacao_total = create_futsal_court(titulo, valor)
-                    colunas[i].plotly_chart(fig_localizacao_total, key=f"localizacao_{jogada}_{chave}", config={'displayModeBar': False})
+            exibir_quadras(*quadras_por_periodo(tensor, jogadas['Ataque']), 3, "localizacao_ataque_total", modo)
 
     with tab_defesa:
         with st.container(border=True, height=height_container_defesa):
-            for jogada in jogadas['Defesa']:
-                colunas = st.columns(3)
-                localizacao_jogadas = extrair_estatisticas_localizacao(dados_time_df, jogada)
+            exibir_quadras(*quadras_por_periodo(tensor, jogadas['Defesa']), 3, "localizacao_defesa_total", modo)
+
+class FigurasPorAba(Mapping):
+    """
+    Mapeamento aba -> tupla de figuras que só constrói as figuras de uma aba no primeiro
+    acesso e as reaproveita depois. Abas que a página não exibe nunca são construídas.
+
+    Args:
+        construtores (dict): Função sem argumentos que constrói a tupla de figuras de cada aba.
+    """
+
+    def __init__(self, construtores):
+        self._construtores = construtores
+        self._figuras = {}
+
+    def __getitem__(self, aba):
+        if aba not in self._figuras:
+            self._figuras[aba] = self._construtores[aba]()
+        return self._figuras[aba]
+
+    def __iter__(self):
+        return iter(self._construtores)
+
+    def __len__(self):
+        return len(self._construtores)
 
-                for i, (chave, valor) in enumerate(localizacao_jogadas.items()):
-                    if i == 3: # Exibe apenas os 3 primeiros (1T, 2T, Total)
-                        break
-                    titulo = f"{jogada} - {chave}"
-                    fig_localizacao_total = create_futsal_court(titulo, valor)
-                    colunas[i].plotly_chart(fig_localizacao_total, key=f"localizacao_{jogada}_{chave}", config={'displayModeBar': False})
+def memorizar_figuras(nome, filtros, origem, construir):
+    """
+    Guarda na sessão o último pacote de figuras de uma página, para que reruns com os mesmos
+    filtros (trocar de grade, de modo de exibição, de aba) não reconstruam as figuras.
+
+    Args:
+        nome (str): Nome da página, para separar os pacotes de páginas diferentes.
+        filtros (tuple): Os filtros selecionados na página.
+        origem (pd.DataFrame): O DataFrame do cache compartilhado de onde os dados saíram. Ele é
+                               substituído quando as tabelas mudam, invalidando o pacote.
+        construir (callable): Função sem argumentos que retorna o pacote de figuras.
+
+    Returns:
+        FigurasPorAba: O pacote guardado, ou um novo se os filtros ou os dados mudaram.
+    """
+    chave = f"figuras_{nome}"
+    entrada = st.session_state.get(chave)
+    if entrada is not None and entrada["filtros"] == filtros and entrada["origem"] is origem:
+        return entrada["figuras"]
 
+    figuras = construir()
+    st.session_state[chave] = {"filtros": filtros, "origem": origem, "figuras": figuras}
+    return figuras
 
 def pegar_figuras_e_estatisticas_jogadores(df_analise, df_media, estatisticas_gerais_para_radar,posicao):
     """
@@ -1943,13 +3133,14 @@ def pegar_figuras_e_estatisticas_jogadores(df_analise, df_media, estatisticas_ge
     comparando com uma média de referência (df_media) e estatísticas gerais para o radar.
 
     Args:
-        df_analise (pd.DataFrame): DataFrame com os dados a serem analisados para o jogador.
-        df_media (pd.DataFrame): DataFrame com os dados para calcular as médias de comparação.
+        df_analise (pd.DataFrame): DataFrame com os dados a serem analisados para o jogador (jogadas
+                                   individuais ou contagens de `obter_dataframe_contagens`).
+        df_media (pd.DataFrame): DataFrame com os dados para calcular as médias de comparação, no mesmo formato.
         estatisticas_gerais_para_radar (dict): Dicionário de estatísticas gerais (da equipe ou todos os jogadores)
                                                 para a comparação no gráfico de radar, estruturado por período.
         posicao (str): Posiçao jogador.
     Returns:
-        dict: Um dicionário contendo tuplas de figuras e rótulos para cada aba.
+        FigurasPorAba: Tuplas de figuras e rótulo de cada aba, construídas no primeiro acesso.
     """
     numero_jogos_jogador = df_analise["jogo_id"].nunique() if df_analise["jogo_id"].nunique() > 0 else 1
 
@@ -1958,33 +3149,29 @@ def pegar_figuras_e_estatisticas_jogadores(df_analise, df_media, estatisticas_ge
 
     media_pt, media_st, media_total, media_ptp, media_stp = get_mean(df_media)
 
-    # Para a aba 'Total':
-    fig_total_1, fig_total_2, bar_total, radar_total = get_athletes_total_figures(
-        estatisticas_total, estatisticas_pt, estatisticas_st, estatisticas_gerais_para_radar['Total'], numero_jogos_jogador, media_pt, media_st,posicao
-    )
-    # Para a aba 'Primeiro Tempo':
-    fig_pt_1, fig_pt_2, bar_pt, radar_pt = get_athletes_partial_figures(
-        estatisticas_pt, estatisticas_gerais_para_radar['Primeiro Tempo'], numero_jogos_jogador, media_pt,posicao
-    )
-    # Para a aba 'Segundo Tempo':
-    fig_st_1, fig_st_2, bar_st, radar_st = get_athletes_partial_figures(
-        estatisticas_st, estatisticas_gerais_para_radar['Segundo Tempo'], numero_jogos_jogador, media_st,posicao
-    )
-
-    return {
-        "Primeiro Tempo": (fig_pt_1, fig_pt_2, bar_pt, radar_pt, "Primeiro Tempo"),
-        "Segundo Tempo": (fig_st_1, fig_st_2, bar_st, radar_st, "Segundo Tempo"),
-        "Total": (fig_total_1, fig_total_2, bar_total, radar_total, "Total"),
-    }
+    return FigurasPorAba({
+        "Primeiro Tempo": lambda: get_athletes_partial_figures(
+            estatisticas_pt, estatisticas_gerais_para_radar['Primeiro Tempo'], numero_jogos_jogador, media_pt,posicao
+        ) + ("Primeiro Tempo",),
+        "Segundo Tempo": lambda: get_athletes_partial_figures(
+            estatisticas_st, estatisticas_gerais_para_radar['Segundo Tempo'], numero_jogos_jogador, media_st,posicao
+        ) + ("Segundo Tempo",),
+        "Total": lambda: get_athletes_total_figures(
+            estatisticas_total, estatisticas_pt, estatisticas_st, estatisticas_gerais_para_radar['Total'], numero_jogos_jogador, media_pt, media_st,posicao
+        ) + ("Total",),
+    })
 
-def exibir_conteudo_tabs_jogadores(nome_tab, figuras, df,logo_path,posicao):
+def exibir_conteudo_tabs_jogadores(nome_tab, figuras, df,logo_path,posicao, carregar_jogadas=None):
     """
     Exibe o conteúdo nas abas do Streamlit com os gráficos e dados do jogador por tempo.
 
     Args:
         figuras_estatisticas_jogador (dict): Dicionário com tuplas de figuras por tempo.
-        dados_time_df (pd.DataFrame): DataFrame com dados da equipe no jogo.
+        dados_time_df (pd.DataFrame): DataFrame com dados da equipe no jogo, ou as contagens por
+                                      quadrante de `obter_dataframe_contagens`.
         posicao (str): Posição do jogador.
+        carregar_jogadas (callable, optional): Função sem argumentos que retorna as jogadas individuais,
+                                               usada só nas grades diferentes da padrão. Defaults to None.
     """
    
 
@@ -1994,10 +3181,15 @@ def exibir_conteudo_tabs_jogadores(nome_tab, figuras, df,logo_path,posicao):
     with st.container(border=True, height=500):
         st.plotly_chart(radar_fig, use_container_width=True, key=f"{tempo_label}_radar", config={'displayModeBar': False})
     st.subheader("Localização Jogadas")
+    grade = selecionar_grade(key=f"grade_{nome_tab}")
+    modo = selecionar_modo_quadras(key=f"modo_quadras_{nome_tab}")
+    if grade != GRADE_PADRAO and carregar_jogadas is not None:
+        # As contagens só têm os quadrantes da grade padrão; as outras grades precisam das coordenadas
+        df = carregar_jogadas()
     if tempo_label == "Total":
-        exibir_localizacao_jogadas_total_jogador(df,posicao)
+        exibir_localizacao_jogadas_total_jogador(df,posicao, grade, modo)
     else:
-        exibir_localizacao_jogadas_por_tempo_jogador(df, tempo_label,nome_tab,posicao)   
+        exibir_localizacao_jogadas_por_tempo_jogador(df, tempo_label,nome_tab,posicao, grade, modo)   
 
 
 
@@ -2007,11 +3199,12 @@ def pegar_figuras_e_estatisticas(df_para_analisar, df_para_media):
     comparando com uma média de referência (df_for_mean).
 
     Args:
-        df_para_analisar (pd.DataFrame): DataFrame com os dados a serem analisados (ex: dados de um único jogo).
-        df_for_mean (pd.DataFrame): DataFrame com os dados para calcular as médias de comparação.
+        df_para_analisar (pd.DataFrame): DataFrame com os dados a serem analisados (ex: dados de um único jogo),
+                                         de jogadas individuais ou de contagens de `obter_dataframe_contagens`.
+        df_for_mean (pd.DataFrame): DataFrame com os dados para calcular as médias de comparação, no mesmo formato.
 
     Returns:
-        dict: Um dicionário contendo tuplas de figuras e rótulos para cada aba.
+        FigurasPorAba: Tuplas de figuras e rótulo de cada aba, construídas no primeiro acesso.
     """
     # Garante que o número de jogos é pelo menos 1 para evitar divisão por zero
     numero_jogos = df_para_analisar["jogo_id"].nunique() if df_para_analisar["jogo_id"].nunique() > 0 else 1
@@ -2026,71 +3219,76 @@ def pegar_figuras_e_estatisticas(df_para_analisar, df_para_media):
     # Calcula as médias de comparação usando o DataFrame de referência
     mean_pt, mean_st, mean_total, mean_ptp, mean_stp = get_mean(df_para_media)
 
-    # Geração das figuras para cada aba
-    fig_total_1, fig_total_2, bar_total = get_team_total_figures(
-        estatisticas_total, estatisticas_pt, estatisticas_st, numero_jogos, mean_pt, mean_st
-    )
-    fig_pt_1, fig_pt_2, bar_pt = get_team_partial_figures(
-        estatisticas_pt, numero_jogos, mean_pt
-    )
-    fig_st_1, fig_st_2, bar_st = get_team_partial_figures(
-        estatisticas_st, numero_jogos, mean_st
-    )
-    fig_ptp_1, fig_ptp_2, bar_ptp = get_team_partial_figures(
-        estatisticas_ptp, numero_jogos_prorrogacao, mean_ptp
-    )
-    fig_stp_1, fig_stp_2, bar_stp = get_team_partial_figures(
-        estatisticas_stp, numero_jogos_prorrogacao, mean_stp
-    )
-
-    return {
-        "Primeiro Tempo": (fig_pt_1, fig_pt_2, bar_pt, "Primeiro Tempo"),
-        "Segundo Tempo": (fig_st_1, fig_st_2, bar_st, "Segundo Tempo"),
-        "Total": (fig_total_1, fig_total_2, bar_total, "Total"),
-        "Primeiro Tempo Prorrogação": (fig_ptp_1, fig_ptp_2, bar_ptp, "Primeiro Tempo Prorrogação"),
-        "Segundo Tempo Prorrogação": (fig_stp_1, fig_stp_2, bar_stp, "Segundo Tempo Prorrogação")
-    }
-
-def exibir_conteudo_tab(nome_tab, figuras, df,logo_path):
+    # Geração das figuras de cada aba, só quando a aba for acessada
+    return FigurasPorAba({
+        "Primeiro Tempo": lambda: get_team_partial_figures(estatisticas_pt, numero_jogos, mean_pt) + ("Primeiro Tempo",),
+        "Segundo Tempo": lambda: get_team_partial_figures(estatisticas_st, numero_jogos, mean_st) + ("Segundo Tempo",),
+        "Total": lambda: get_team_total_figures(
+            estatisticas_total, estatisticas_pt, estatisticas_st, numero_jogos, mean_pt, mean_st
+        ) + ("Total",),
+        "Primeiro Tempo Prorrogação": lambda: get_team_partial_figures(
+            estatisticas_ptp, numero_jogos_prorrogacao, mean_ptp
+        ) + ("Primeiro Tempo Prorrogação",),
+        "Segundo Tempo Prorrogação": lambda: get_team_partial_figures(
+            estatisticas_stp, numero_jogos_prorrogacao, mean_stp
+        ) + ("Segundo Tempo Prorrogação",),
+    })
+
+def exibir_conteudo_tab(nome_tab, figuras, df,logo_path, carregar_jogadas=None):
     """
     Exibe o conteúdo de uma aba específica (gráficos e localização de jogadas).
 
     Args:
         tab_name (str): Nome da aba.
         figures (tuple): Tupla contendo as figuras Plotly para a aba.
-        df (pd.DataFrame): DataFrame com os dados atuais para a localização das jogadas.
+        df (pd.DataFrame): DataFrame com os dados atuais para a localização das jogadas, ou as
+                           contagens por quadrante de `obter_dataframe_contagens`.
+        carregar_jogadas (callable, optional): Função sem argumentos que retorna as jogadas individuais,
+                                               usada só nas grades diferentes da padrão. Defaults to None.
     """
     fig1, fig2, bar_fig, tempo_label = figuras
     exibir_graficos_tempo(fig1, fig2, bar_fig,nome_tab,logo_path)
     st.subheader("Localização Jogadas")
+    grade = selecionar_grade(key=f"grade_{nome_tab}")
+    modo = selecionar_modo_quadras(key=f"modo_quadras_{nome_tab}")
+    if grade != GRADE_PADRAO and carregar_jogadas is not None:
+        # As contagens só têm os quadrantes da grade padrão; as outras grades precisam das coordenadas
+        df = carregar_jogadas()
     if tempo_label == "Total":
-        exibir_localizacao_jogadas_total(df)
+        exibir_localizacao_jogadas_total(df, grade, modo)
     else:
-        exibir_localizacao_jogadas_por_tempo(df, tempo_label, key_prefix=nome_tab)            
+        exibir_localizacao_jogadas_por_tempo(df, tempo_label, key_prefix=nome_tab, grade=grade, modo=modo)            
         
         
 def listar_jogadas_com_tempo(db_manager, jogo_id):
     """
-    Recupera todas as jogadas de uma partida e calcula o quadrante de cada jogada.
+    Recupera todas as jogadas de uma partida com o quadrante de cada jogada e o
+    tempo, em segundos, desde a primeira jogada registrada.
+
+    O horário de cada jogada vem do banco em segundos desde a meia-noite; a diferença
+    é tomada módulo um dia, para partidas que atravessam a meia-noite.
 
     Args:
         db_manager: Instância da classe DBManager.
         jogo_id (int): ID da partida.
-        calcular_quadrante (func): Função que recebe x, y e retorna o quadrante.
 
     Returns:
         pd.DataFrame: DataFrame com colunas:
             - jogador_nome
             - jogada
             - quadrante
+            - zona
             - tempo
+            - hora_jogada
             - tempo_relativo_jogada
     """
+    colunas_saida = ['jogador_nome', 'jogada', 'quadrante', 'zona', 'tempo', 'hora_jogada', 'tempo_relativo_jogada']
+
     # Recupera jogadas do DB
     lista_jogadas = db_manager.listar_jogadas_por_partida_com_tempo(jogo_id)
 
     if not lista_jogadas:
-        return pd.DataFrame(columns=['jogador_nome', 'jogada', 'quadrante', 'tempo','hora_jogada', 'tempo_relativo_jogada'])
+        return pd.DataFrame(columns=colunas_saida)
 
     # Converte para DataFrame
     df = pd.DataFrame(lista_jogadas, columns=[
@@ -2105,23 +3303,39 @@ def listar_jogadas_com_tempo(db_manager, jogo_id):
         'x_loc',
         'y_loc',
         'hora_jogada',
-        'tempo_relativo_jogada'
+        'tempo_relativo_jogada',
+        'quadrante_linha',
+        'quadrante_coluna',
+        'segundos_jogada'
     ])
 
-    # Calcula quadrante
-    df['quadrante'] = df.apply(lambda row: calcular_quadrante(row['x_loc'], row['y_loc']), axis=1)
+    # Quadrante já calculado pelo banco
+    df['zona'] = zonas_de_quadrantes(df['quadrante_linha'], df['quadrante_coluna'])
+    df['quadrante'] = formatar_quadrante(df['quadrante_linha'], df['quadrante_coluna'])
 
-    
-    # converter a coluna para datetime
-    df['hora_jogada_dt'] = df['hora_jogada'].apply(lambda t: datetime.combine(datetime.today(), t))
+    # Tempo relativo à primeira jogada com horário, módulo um dia; jogadas sem horário ficam no início
+    segundos_jogada = df['segundos_jogada'].astype(float)
+    inicio = segundos_jogada.dropna().iloc[0] if segundos_jogada.notna().any() else 0.0
+    df['tempo_relativo_jogada'] = ((segundos_jogada - inicio) % SEGUNDOS_POR_DIA).fillna(0.0)
 
-    # calcular tempo relativo
-    df['tempo_relativo_jogada'] = (df['hora_jogada_dt'] - df['hora_jogada_dt'].iloc[0]).dt.total_seconds()
-    
-    # Seleciona colunas desejadas
-    df_final = df[['jogador_nome', 'jogada', 'quadrante', 'tempo','hora_jogada', 'tempo_relativo_jogada']].copy()
+    return df[colunas_saida].copy()
+
+
+def formatar_hhmmss_serie(segundos):
+    """
+    Versão vetorizada de `formatar_hhmmss` para uma coluna inteira de segundos.
+    Valores ausentes são exibidos como "00:00".
 
-    return df_final
+    Args:
+        segundos (pd.Series): Os tempos, em segundos.
+
+    Returns:
+        pd.Series: As strings de tempo formatadas ("HH:MM:SS" acima de uma hora, senão "MM:SS").
+    """
+    segundos = segundos.fillna(0).astype(np.int64)
+    horas = segundos // 3600
+    minutos_segundos = ((segundos % 3600) // 60).astype(str).str.zfill(2) + ":" + (segundos % 60).astype(str).str.zfill(2)
+    return minutos_segundos.where(horas == 0, horas.astype(str).str.zfill(2) + ":" + minutos_segundos)
 
 
 def formatar_hhmmss(segundos):